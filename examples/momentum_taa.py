@@ -74,11 +74,14 @@ class TopNMomentumAlphaModel(AlphaModel):
         
         # Calculate the holding-period return momenta for each asset,
         # for the particular provided momentum lookback period
-        all_momenta = {
-            asset: self.signals['momentum'](
-                asset, self.mom_lookback
-            ) for asset in assets
-        }
+        all_momenta = dict(
+            zip(
+                assets,
+                self.signals['momentum'].cross_section(
+                    self.mom_lookback, assets
+                )
+            )
+        )
 
         # Obtain a list of the top performing assets by momentum
         # restricted by the provided number of desired assets to
@@ -42,3 +42,15 @@ class DynamicUniverse(Universe):
             asset for asset, asset_date in self.asset_dates.items()
             if asset_date is not None and dt >= asset_date
         ]
+
+    def get_all_assets(self):
+        """
+        Obtain the list of all assets that are ever present within
+        the Universe, including those without an entry date.
+
+        Returns
+        -------
+        `list[str]`
+            The list of all Asset symbols in the dynamic Universe.
+        """
+        return list(self.asset_dates.keys())
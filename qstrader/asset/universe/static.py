@@ -32,3 +32,15 @@ class StaticUniverse(Universe):
             The list of Asset symbols in the static Universe.
         """
         return self.asset_list
+
+    def get_all_assets(self):
+        """
+        Obtain the list of all assets that are ever present within
+        the Universe, independent of time.
+
+        Returns
+        -------
+        `list[str]`
+            The list of Asset symbols in the static Universe.
+        """
+        return self.asset_list
@@ -13,3 +13,9 @@ class Universe(object):
         raise NotImplementedError(
             "Should implement get_assets()"
         )
+
+    @abstractmethod
+    def get_all_assets(self):
+        raise NotImplementedError(
+            "Should implement get_all_assets()"
+        )
@@ -0,0 +1,322 @@
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from qstrader.broker.portfolio.position import Position
+
+
+# The Position accounting fields stored within the arrays
+BOOK_FIELDS = (
+    'buy_quantity', 'sell_quantity', 'avg_bought', 'avg_sold',
+    'buy_commission', 'sell_commission', 'current_price'
+)
+
+
+def _book_field(name):
+    """
+    Create a property storing a Position accounting field within
+    the arrays of the ArrayPositionHandler of the position.
+
+    The value is also retained as set on the position, such that
+    reading the field returns it unchanged, e.g. an integer quantity
+    rather than its float array representation.
+
+    Parameters
+    ----------
+    name : `str`
+        The name of the field.
+
+    Returns
+    -------
+    `property`
+        The array-backed property.
+    """
+    attr = '_%s' % name
+
+    def getter(self):
+        return getattr(self, attr)
+
+    def setter(self, value):
+        setattr(self, attr, value)
+        getattr(self.book, name)[self.slot] = value
+
+    return property(getter, setter)
+
+
+class BookPosition(Position):
+    """
+    A Position whose accounting fields are stored within a row
+    ('slot') of the parallel arrays of an ArrayPositionHandler,
+    such that all of the Position accounting logic applies unchanged
+    while the handler can update the current prices of all positions
+    in vectorised form.
+
+    While the position is included within the portfolio totals of
+    the handler, changes to its current price are applied to the
+    totals as they occur.
+
+    Parameters
+    ----------
+    book : `ArrayPositionHandler`
+        The position handler storing the position.
+    asset : `str`
+        The Asset symbol string.
+    slot : `int`
+        The array row of the position.
+    """
+
+    __slots__ = ('book', 'slot', 'in_totals') + tuple(
+        '_%s' % field for field in BOOK_FIELDS
+    )
+
+    buy_quantity = _book_field('buy_quantity')
+    sell_quantity = _book_field('sell_quantity')
+    avg_bought = _book_field('avg_bought')
+    avg_sold = _book_field('avg_sold')
+    buy_commission = _book_field('buy_commission')
+    sell_commission = _book_field('sell_commission')
+
+    def __init__(self, book, asset, slot):
+        self.book = book
+        self.asset = asset
+        self.slot = slot
+        self.in_totals = False
+
+    @property
+    def current_price(self):
+        return self._current_price
+
+    @current_price.setter
+    def current_price(self, price):
+        if self.in_totals:
+            self.book.add_price_change((price - self._current_price) * self.net_quantity)
+        self._current_price = price
+        self.book.current_price[self.slot] = price
+
+    @property
+    def current_dt(self):
+        return self.book.current_dts[self.slot]
+
+    @current_dt.setter
+    def current_dt(self, dt):
+        self.book.current_dts[self.slot] = dt
+        self.book.current_ns[self.slot] = pd.Timestamp(dt).value
+
+
+class ArrayPositionHandler(object):
+    """
+    An alternative to the PositionHandler that stores the quantities,
+    average prices, commissions and current prices of all positions in
+    parallel NumPy arrays, indexed by a slot assigned to each asset.
+
+    The positions remain available by asset via the positions
+    dictionary. The portfolio totals are maintained incrementally,
+    such that querying the portfolio equity is O(1). A transaction
+    replaces the contribution of its position to the totals, as per
+    the Position accounting, while a price update adds the change in
+    price multiplied by the net quantity of each updated position.
+
+    The totals are equal to those of the PositionHandler up to
+    floating point summation order, and are reset once no positions
+    remain, such that rounding errors do not accumulate indefinitely.
+
+    Parameters
+    ----------
+    capacity : `int`, optional
+        The initial number of asset slots.
+    """
+
+    fields = BOOK_FIELDS
+
+    def __init__(self, capacity=16):
+        self.positions = OrderedDict()
+        self.asset_slots = {}
+        self.num_slots = 0
+        for field in self.fields:
+            setattr(self, field, np.zeros(capacity, dtype=np.float64))
+        self.current_dts = np.zeros(capacity, dtype=object)
+        self.current_ns = np.zeros(capacity, dtype=np.int64)
+        self._reset_totals()
+
+    def _grow(self):
+        """
+        Double the capacity of the arrays.
+        """
+        capacity = 2 * len(self.current_ns)
+        for field in self.fields + ('current_dts', 'current_ns'):
+            values = getattr(self, field)
+            grown = np.zeros(capacity, dtype=values.dtype)
+            grown[:len(values)] = values
+            setattr(self, field, grown)
+
+    def _slot(self, asset):
+        """
+        Obtain the array slot of an asset, assigning a new slot
+        upon the first transaction in the asset.
+
+        Parameters
+        ----------
+        asset : `str`
+            The Asset symbol string.
+
+        Returns
+        -------
+        `int`
+            The array slot of the asset.
+        """
+        slot = self.asset_slots.get(asset)
+        if slot is None:
+            if self.num_slots == len(self.current_ns):
+                self._grow()
+            slot = self.num_slots
+            self.asset_slots[asset] = slot
+            self.num_slots += 1
+        return slot
+
+    def transact_position(self, transaction):
+        """
+        Execute the transaction and update the appropriate
+        position for the transaction's asset accordingly.
+        """
+        asset = transaction.asset
+        if asset in self.positions:
+            position = self.positions[asset]
+            self._remove_from_totals(position)
+            position.transact(transaction)
+        else:
+            opened = Position.open_from_transaction(transaction)
+            position = BookPosition(self, asset, self._slot(asset))
+            for field in self.fields:
+                setattr(position, field, getattr(opened, field))
+            position.current_dt = opened.current_dt
+            self.positions[asset] = position
+
+        # If the position has zero quantity remove it
+        if position.net_quantity == 0:
+            del self.positions[asset]
+            if len(self.positions) == 0:
+                self._reset_totals()
+        else:
+            self._add_to_totals(position)
+
+    def update_current_prices(self, assets, prices, dt):
+        """
+        Update the current market prices of many held assets at
+        once, as per Position.update_current_price.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The held asset symbols.
+        prices : `np.ndarray`
+            The current market prices, ordered as the assets.
+        dt : `pd.Timestamp`
+            The timestamp of the current market prices.
+        """
+        slots = np.array(
+            [self.positions[asset].slot for asset in assets], dtype=np.int64
+        )
+        if dt is not None:
+            earlier = np.flatnonzero(pd.Timestamp(dt).value < self.current_ns[slots])
+            if len(earlier) > 0:
+                raise ValueError(
+                    'Supplied update time of "%s" is earlier than '
+                    'the current time of "%s".' % (
+                        dt, self.current_dts[slots[earlier[0]]]
+                    )
+                )
+            self.current_dts[slots] = dt
+            self.current_ns[slots] = pd.Timestamp(dt).value
+
+        prices = np.asarray(prices, dtype=np.float64)
+        non_positive = np.flatnonzero(prices <= 0.0)
+        if len(non_positive) > 0:
+            raise ValueError(
+                'Market price "%s" of asset "%s" must be positive to '
+                'update the position.' % (
+                    prices[non_positive[0]], assets[non_positive[0]]
+                )
+            )
+        net_quantity = self.buy_quantity[slots] - self.sell_quantity[slots]
+        self.add_price_change(
+            float(np.sum((prices - self.current_price[slots]) * net_quantity))
+        )
+        for asset, price in zip(assets, prices):
+            self.positions[asset]._current_price = price
+        self.current_price[slots] = prices
+
+    def _reset_totals(self):
+        """
+        Reset the portfolio totals to zero.
+        """
+        self.market_value = 0.0
+        self.unrealised_pnl = 0.0
+        self.realised_pnl = 0.0
+
+    def _add_to_totals(self, position):
+        """
+        Include the market value and P&Ls of a position within
+        the portfolio totals.
+
+        Parameters
+        ----------
+        position : `BookPosition`
+            The position to include.
+        """
+        self.market_value += position.market_value
+        self.unrealised_pnl += position.unrealised_pnl
+        self.realised_pnl += position.realised_pnl
+        position.in_totals = True
+
+    def _remove_from_totals(self, position):
+        """
+        Exclude the market value and P&Ls of a position from
+        the portfolio totals, prior to transacting the position.
+
+        Parameters
+        ----------
+        position : `BookPosition`
+            The position to exclude.
+        """
+        self.market_value -= position.market_value
+        self.unrealised_pnl -= position.unrealised_pnl
+        self.realised_pnl -= position.realised_pnl
+        position.in_totals = False
+
+    def add_price_change(self, change):
+        """
+        Apply a change in the current prices of the held positions,
+        multiplied by their net quantities, to the portfolio totals.
+
+        Parameters
+        ----------
+        change : `float`
+            The change in market value.
+        """
+        self.market_value += change
+        self.unrealised_pnl += change
+
+    def total_market_value(self):
+        """
+        Calculate the sum of all the positions' market values.
+        """
+        return self.market_value
+
+    def total_unrealised_pnl(self):
+        """
+        Calculate the sum of all the positions' unrealised P&Ls.
+        """
+        return self.unrealised_pnl
+
+    def total_realised_pnl(self):
+        """
+        Calculate the sum of all the positions' realised P&Ls.
+        """
+        return self.realised_pnl
+
+    def total_pnl(self):
+        """
+        Calculate the sum of all the positions' P&Ls.
+        """
+        return self.realised_pnl + self.unrealised_pnl
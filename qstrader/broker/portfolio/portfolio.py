@@ -2,10 +2,13 @@ import copy
 import datetime
 import logging
 
+import numpy as np
 import pandas as pd
 
 from qstrader import settings
+from qstrader.broker.portfolio.array_position_handler import ArrayPositionHandler
 from qstrader.broker.portfolio.portfolio_event import PortfolioEvent
+from qstrader.broker.portfolio.portfolio_history import PortfolioHistory
 from qstrader.broker.portfolio.position_handler import PositionHandler
 
 
@@ -28,6 +31,12 @@ class Portfolio(object):
         An identifier for the portfolio.
     name: str, optional
         The human-readable name of the portfolio.
+    array_positions: bool, optional
+        Whether to store the positions within an array-backed
+        ArrayPositionHandler, rather than a PositionHandler.
+    max_history: int, optional
+        If provided, only the most recent 'max_history' events of
+        the portfolio history are retained.
     """
 
     def __init__(
@@ -36,7 +45,9 @@ class Portfolio(object):
         starting_cash=0.0,
         currency="USD",
         portfolio_id=None,
-        name=None
+        name=None,
+        array_positions=False,
+        max_history=None
     ):
         """
         Initialise the Portfolio object with a PositionHandler,
@@ -50,8 +61,10 @@ class Portfolio(object):
         self.portfolio_id = portfolio_id
         self.name = name
 
-        self.pos_handler = PositionHandler()
-        self.history = []
+        self.pos_handler = (
+            ArrayPositionHandler() if array_positions else PositionHandler()
+        )
+        self.history = PortfolioHistory(max_events=max_history)
 
         self.logger = logging.getLogger('Portfolio')
         self.logger.setLevel(logging.DEBUG)
@@ -322,13 +335,72 @@ class Portfolio(object):
                 current_price, current_dt
             )
 
+    def update_market_values_of_assets(
+        self, assets, current_prices, current_dt
+    ):
+        """
+        Update the market values of many assets at once to their
+        current trade prices and date, as per
+        update_market_value_of_asset. The prices are validated
+        in a single vectorised pass prior to updating any position.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbols. Those not held are ignored.
+        current_prices : `np.ndarray`
+            The current trade prices, ordered as the assets.
+        current_dt : `pd.Timestamp`
+            The current trade date.
+        """
+        positions = self.pos_handler.positions
+        held = np.array([asset in positions for asset in assets], dtype=bool)
+        if not held.any():
+            return
+        current_prices = np.asarray(current_prices, dtype=np.float64)
+
+        negative = np.flatnonzero(held & (current_prices < 0.0))
+        if len(negative) > 0:
+            raise ValueError(
+                'Current trade price of %s is negative for '
+                'asset %s. Cannot update position.' % (
+                    current_prices[negative[0]], assets[negative[0]]
+                )
+            )
+
+        if current_dt < self.current_dt:
+            raise ValueError(
+                'Current trade date of %s is earlier than '
+                'current date %s of asset %s. Cannot update '
+                'position.' % (
+                    current_dt, self.current_dt, assets[np.flatnonzero(held)[0]]
+                )
+            )
+
+        non_positive = np.flatnonzero(held & (current_prices <= 0.0))
+        if len(non_positive) > 0:
+            raise ValueError(
+                'Market price "%s" of asset "%s" must be positive to '
+                'update the position.' % (
+                    current_prices[non_positive[0]], assets[non_positive[0]]
+                )
+            )
+
+        held_idx = np.flatnonzero(held)
+        self.pos_handler.update_current_prices(
+            [assets[idx] for idx in held_idx], current_prices[held_idx], current_dt
+        )
+
     def history_to_df(self):
         """
         Creates a Pandas DataFrame of the Portfolio history.
+
+        The 'date' index is left empty, as per the original record
+        based construction, on which existing fixtures rely. Use
+        history.to_df() for a DataFrame indexed by the event dates.
         """
-        records = [pe.to_dict() for pe in self.history]
-        return pd.DataFrame.from_records(
-            records, columns=[
-                "date", "type", "description", "debit", "credit", "balance"
-            ]
-        ).set_index(keys=["date"])
+        history_df = self.history.to_df().copy()
+        history_df.index = pd.Index(
+            np.full(len(history_df), np.nan), name="date"
+        )
+        return history_df
@@ -0,0 +1,182 @@
+import numpy as np
+import pandas as pd
+import pytz
+
+from qstrader.broker.portfolio.portfolio_event import PortfolioEvent
+
+
+class PortfolioHistory(object):
+    """
+    A columnar log of the PortfolioEvents of a Portfolio.
+
+    Rather than retaining a PortfolioEvent object per event, the event
+    fields are stored within parallel NumPy arrays, which grow in chunks
+    of at least 'chunk_size' events. The log otherwise behaves as the
+    list of PortfolioEvents it replaces, supporting appending, iteration,
+    indexing and comparison with a list of events.
+
+    The arrays are only ever appended to, with growth and retention
+    carried out by allocating new arrays. Hence the DataFrame exported
+    by to_df can share the memory of the arrays without being affected
+    by subsequent events.
+
+    Parameters
+    ----------
+    chunk_size : `int`, optional
+        The minimum number of events by which the arrays grow.
+    max_events : `int`, optional
+        If provided, only the most recent 'max_events' events are
+        retained, bounding the memory of long-running portfolios.
+        Defaults to retaining all events.
+    """
+
+    columns = ('_dt_ns', '_type', '_description', '_debit', '_credit', '_balance')
+
+    def __init__(self, chunk_size=1024, max_events=None):
+        if chunk_size < 1:
+            raise ValueError(
+                'Portfolio history chunk size of %s must be '
+                'a positive integer.' % chunk_size
+            )
+        if max_events is not None and max_events < 1:
+            raise ValueError(
+                'Portfolio history retention of %s events must be '
+                'a positive integer.' % max_events
+            )
+        self.chunk_size = chunk_size
+        self.max_events = max_events
+        self.tz = None
+        self.num_dropped = 0
+        self._start = 0
+        self._end = 0
+        self._dt_ns = np.zeros(chunk_size, dtype=np.int64)
+        self._type = np.empty(chunk_size, dtype=object)
+        self._description = np.empty(chunk_size, dtype=object)
+        self._debit = np.zeros(chunk_size, dtype=np.float64)
+        self._credit = np.zeros(chunk_size, dtype=np.float64)
+        self._balance = np.zeros(chunk_size, dtype=np.float64)
+
+    def _reallocate(self):
+        """
+        Move the retained events into newly allocated arrays with room
+        for at least a further chunk of events. The existing arrays are
+        left untouched, as they may be shared with exported DataFrames.
+        """
+        num_events = len(self)
+        capacity = num_events + max(self.chunk_size, num_events)
+        if self.max_events is not None:
+            capacity = min(capacity, self.max_events + self.chunk_size)
+        for column in self.columns:
+            values = getattr(self, column)
+            grown = np.zeros(capacity, dtype=values.dtype)
+            grown[:num_events] = values[self._start:self._end]
+            setattr(self, column, grown)
+        self._start = 0
+        self._end = num_events
+
+    def append(self, event):
+        """
+        Append a PortfolioEvent to the log, discarding the oldest
+        event if this exceeds the retention.
+
+        Parameters
+        ----------
+        event : `PortfolioEvent`
+            The portfolio event.
+        """
+        dt = pd.Timestamp(event.dt)
+        if self._end == 0:
+            self.tz = dt.tz
+        elif dt.tz is not None and str(dt.tz) != str(self.tz):
+            # Events across differing timezones are reported in UTC
+            self.tz = pytz.UTC
+
+        if self._end == len(self._dt_ns):
+            self._reallocate()
+        idx = self._end
+        self._dt_ns[idx] = dt.value
+        self._type[idx] = event.type
+        self._description[idx] = event.description
+        self._debit[idx] = event.debit
+        self._credit[idx] = event.credit
+        self._balance[idx] = event.balance
+        self._end += 1
+
+        if self.max_events is not None and len(self) > self.max_events:
+            self._start += 1
+            self.num_dropped += 1
+
+    def _event(self, idx):
+        """
+        Reconstruct the PortfolioEvent at an array index.
+
+        Parameters
+        ----------
+        idx : `int`
+            The array index of the event.
+
+        Returns
+        -------
+        `PortfolioEvent`
+            The portfolio event.
+        """
+        return PortfolioEvent(
+            dt=pd.Timestamp(int(self._dt_ns[idx]), tz=self.tz),
+            type=self._type[idx],
+            description=self._description[idx],
+            debit=float(self._debit[idx]),
+            credit=float(self._credit[idx]),
+            balance=float(self._balance[idx])
+        )
+
+    def __len__(self):
+        return self._end - self._start
+
+    def __iter__(self):
+        for idx in range(self._start, self._end):
+            yield self._event(idx)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self._event(self._start + idx) for idx in range(*key.indices(len(self)))]
+        if key < 0:
+            key += len(self)
+        if key < 0 or key >= len(self):
+            raise IndexError('Portfolio history index out of range.')
+        return self._event(self._start + key)
+
+    def __eq__(self, other):
+        if isinstance(other, (list, PortfolioHistory)):
+            return len(self) == len(other) and list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return 'PortfolioHistory(%s)' % list(self)
+
+    def to_df(self):
+        """
+        Export the retained events as a DataFrame indexed by date,
+        whose columns share the memory of the log arrays. The columns
+        are read-only, hence the DataFrame should be copied prior
+        to any modification.
+
+        Returns
+        -------
+        `pd.DataFrame`
+            The portfolio history.
+        """
+        columns = {}
+        for name, column in zip(
+            ('type', 'description', 'debit', 'credit', 'balance'),
+            self.columns[1:]
+        ):
+            values = getattr(self, column)[self._start:self._end]
+            values.flags.writeable = False
+            columns[name] = values
+
+        dates = pd.DatetimeIndex(
+            self._dt_ns[self._start:self._end].view('M8[ns]'), name='date'
+        )
+        if self.tz is not None:
+            dates = dates.tz_localize(pytz.UTC).tz_convert(self.tz)
+        return pd.DataFrame(columns, index=dates, copy=False)
@@ -32,6 +32,23 @@ class PositionHandler(object):
         if self.positions[asset].net_quantity == 0:
             del self.positions[asset]
 
+    def update_current_prices(self, assets, prices, dt):
+        """
+        Update the current market prices of many held assets at
+        once, as per Position.update_current_price.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The held asset symbols.
+        prices : `np.ndarray`
+            The current market prices, ordered as the assets.
+        dt : `pd.Timestamp`
+            The timestamp of the current market prices.
+        """
+        for asset, price in zip(assets, prices):
+            self.positions[asset].update_current_price(price, dt)
+
     def total_market_value(self):
         """
         Calculate the sum of all the positions' market values.
@@ -7,6 +7,7 @@ from qstrader.broker.broker import Broker
 from qstrader.broker.fee_model.fee_model import FeeModel
 from qstrader.broker.portfolio.portfolio import Portfolio
 from qstrader.broker.transaction.transaction import Transaction
+from qstrader.data.latest_prices import get_assets_latest_prices
 from qstrader.broker.fee_model.zero_fee_model import ZeroFeeModel
 
 
@@ -41,6 +42,12 @@ class SimulatedBroker(Broker):
         The model used to simulate trade slippage.
     market_impact_model : `MarketImpactModel`, optional
         The model used to simulate market impact of trading.
+    array_positions : `Boolean`, optional
+        Whether the portfolios store their positions within an
+        array-backed ArrayPositionHandler.
+    max_history : `int`, optional
+        If provided, the portfolios retain only their most recent
+        'max_history' history events.
     """
 
     def __init__(
@@ -53,7 +60,9 @@ class SimulatedBroker(Broker):
         initial_funds=0.0,
         fee_model=ZeroFeeModel(),
         slippage_model=None,
-        market_impact_model=None
+        market_impact_model=None,
+        array_positions=False,
+        max_history=None
     ):
         self.start_dt = start_dt
         self.exchange = exchange
@@ -66,6 +75,8 @@ class SimulatedBroker(Broker):
         self.fee_model = self._set_fee_model(fee_model)
         self.slippage_model = None  # TODO: Implement
         self.market_impact_model = None  # TODO: Implement
+        self.array_positions = array_positions
+        self.max_history = max_history
 
         self.cash_balances = self._set_cash_balances()
         self.portfolios = self._set_initial_portfolios()
@@ -335,7 +346,9 @@ class SimulatedBroker(Broker):
                 self.current_dt,
                 currency=self.base_currency,
                 portfolio_id=portfolio_id_str,
-                name=name
+                name=name,
+                array_positions=self.array_positions,
+                max_history=self.max_history
             )
             self.portfolios[portfolio_id_str] = p
             self.open_orders[portfolio_id_str] = queue.Queue()
@@ -542,7 +555,7 @@ class SimulatedBroker(Broker):
             )
         return self.portfolios[portfolio_id].portfolio_to_dict()
 
-    def _execute_order(self, dt, portfolio_id, order):
+    def _execute_order(self, dt, portfolio_id, order, bid_ask=None):
         """
         For a given portfolio ID string, create a Transaction instance from
         the provided Order and ensure the Portfolio is appropriately updated
@@ -556,6 +569,9 @@ class SimulatedBroker(Broker):
             The portfolio ID string.
         order : `Order`
             The Order instance to create the Transaction for.
+        bid_ask : `tuple(float, float)`, optional
+            The latest bid and ask prices of the asset, if already
+            obtained. Otherwise they are obtained from the data handler.
         """
         # Obtain a price for the asset, if no price then
         # raise a ValueError
@@ -566,10 +582,11 @@ class SimulatedBroker(Broker):
                 order.asset, order.order_id
             )
         )
-        bid_ask = self.data_handler.get_asset_latest_bid_ask_price(
-            dt, order.asset
-        )
-        if bid_ask == (np.nan, np.nan):
+        if bid_ask is None:
+            bid_ask = self.data_handler.get_asset_latest_bid_ask_price(
+                dt, order.asset
+            )
+        if np.isnan(bid_ask[0]) and np.isnan(bid_ask[1]):
             raise ValueError(price_err_msg)
 
         # Calculate the consideration and total commission
@@ -625,6 +642,28 @@ class SimulatedBroker(Broker):
                 )
             )
 
+    def _execute_orders(self, dt, orders):
+        """
+        Execute a batch of orders in a single pass, selling prior to
+        buying, with the latest bid and ask prices of all of the
+        ordered assets obtained from the data handler at once.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The current timestamp.
+        orders : `list[tuple(str, Order)]`
+            The portfolio ID string and Order instance of each order.
+        """
+        if len(orders) == 0:
+            return
+        sorted_orders = sorted(orders, key=lambda x: x[1].direction)
+        assets = list(dict.fromkeys(order.asset for _, order in sorted_orders))
+        bids, asks = get_assets_latest_prices(self.data_handler, dt, assets, 'bid_ask')
+        bid_asks = dict(zip(assets, zip(bids, asks)))
+        for portfolio, order in sorted_orders:
+            self._execute_order(dt, portfolio, order, bid_ask=bid_asks[order.asset])
+
     def get_executed_orders(self):
         return self.executed_orders
 
@@ -667,6 +706,30 @@ class SimulatedBroker(Broker):
                 )
             )
 
+    def submit_orders(self, portfolio_id, orders, dt):
+        """
+        Submit a batch of Order instances against the sub-portfolio
+        with ID 'portfolio_id' and update the SimulatedBroker to the
+        timestamp 'dt', as per submit_order followed by update.
+
+        The held assets are hence marked to market once for the batch
+        and, if the exchange is open, the orders are executed in a
+        single pass, selling prior to buying, rather than updating the
+        broker after each individual order.
+
+        Parameters
+        ----------
+        portfolio_id : `str`
+            The portfolio ID string.
+        orders : `list[Order]`
+            The Order instances to submit.
+        dt : `pd.Timestamp`
+            The current timestamp to update the Broker to.
+        """
+        for order in orders:
+            self.submit_order(portfolio_id, order)
+        self.update(dt)
+
     def update(self, dt):
         """
         Updates the current SimulatedBroker timestamp.
@@ -678,14 +741,19 @@ class SimulatedBroker(Broker):
         """
         self.current_dt = dt
 
-        # Update portfolio asset values
-        for portfolio in self.portfolios:
-            for asset in self.portfolios[portfolio].pos_handler.positions:
-                mid_price = self.data_handler.get_asset_latest_mid_price(
-                    dt, asset
-                )
-                self.portfolios[portfolio].update_market_value_of_asset(
-                    asset, mid_price, self.current_dt
+        # Update portfolio asset values, obtaining the prices of
+        # all held assets across the portfolios in a single call
+        held_assets = list(dict.fromkeys(
+            asset for portfolio in self.portfolios.values()
+            for asset in portfolio.pos_handler.positions
+        ))
+        if len(held_assets) > 0:
+            mid_prices = get_assets_latest_prices(
+                self.data_handler, dt, held_assets, 'mid'
+            )
+            for portfolio in self.portfolios.values():
+                portfolio.update_market_values_of_assets(
+                    held_assets, mid_prices, self.current_dt
                 )
 
         # Try to execute orders
@@ -697,6 +765,4 @@ class SimulatedBroker(Broker):
                         (portfolio, self.open_orders[portfolio].get())
                     )
 
-            sorted_orders = sorted(orders, key=lambda x: x[1].direction)
-            for portfolio, order in sorted_orders:
-                self._execute_order(dt, portfolio, order)
+            self._execute_orders(dt, orders)
@@ -1,47 +1,117 @@
+from functools import reduce
+
 import numpy as np
+import pandas as pd
 
 
 class BacktestDataHandler(object):
     """
+    Provides the prices and dividends of the assets of a Universe
+    across one or more data sources, along with the master trading
+    calendar of the backtest.
+
+    Parameters
+    ----------
+    universe : `Universe`
+        The universe of assets.
+    data_sources : `list`, optional
+        The data sources, queried in order.
+    calendar : `str`, optional
+        How the master trading calendar is derived from the dates
+        of the loaded assets. One of 'union' (days on which any asset
+        has data), 'intersection' (days on which every asset has data)
+        or 'longest' (the days of the asset with the longest history).
     """
 
+    calendars = ('union', 'intersection', 'longest')
+
     def __init__(
         self,
         universe,
-        data_sources=None
+        data_sources=None,
+        calendar='union'
     ):
+        if calendar not in self.calendars:
+            raise ValueError(
+                'Unknown trading calendar "%s" provided. Must be one '
+                'of %s.' % (calendar, ', '.join(self.calendars))
+            )
         self.universe = universe
         self.data_sources = data_sources
+        self.calendar = calendar
         self.data_source_stats = {}  # Store start/end/length for each source
+        self._asset_dates = {}
+        self._longest_asset = None
+        self._trading_days = None
         self._calculate_data_source_stats()
 
     def _calculate_data_source_stats(self):
         """
         Calculates and stores start/end/length for each data source.
+
+        Lazily-loading data sources only have the assets of the
+        Universe loaded, rather than every available asset.
         """
         for ds in self.data_sources:
-            for asset, df in ds.asset_bar_frames.items():
+            if getattr(ds, 'lazy', False):
+                assets = [
+                    asset for asset in self.universe.get_all_assets()
+                    if asset in ds.asset_bar_frames
+                ]
+                ds.prefetch(assets)
+                asset_frames = [
+                    (asset, ds.asset_bar_frames[asset]) for asset in assets
+                ]
+            else:
+                asset_frames = ds.asset_bar_frames.items()
+            for asset, df in asset_frames:
                 if asset not in self.data_source_stats:
                         self.data_source_stats[asset] = {}
                 self.data_source_stats[asset]['start_date'] = df.index.min()
                 self.data_source_stats[asset]['end_date'] = df.index.max()
                 self.data_source_stats[asset]['length'] = len(df)
+                if asset in self._asset_dates:
+                    self._asset_dates[asset] = self._asset_dates[asset].union(df.index)
+                else:
+                    self._asset_dates[asset] = df.index
+
+        max_length = -1
+        for asset, stats in self.data_source_stats.items():
+            if stats['length'] > max_length:
+                max_length = stats['length']
+                self._longest_asset = asset
 
     def get_longest_asset(self):
         """
         Returns the asset symbol with the longest data history.
         """
-        if not self.data_source_stats:
-            return None  # No data sources
+        return self._longest_asset
 
-        longest_asset = None
-        max_length = -1
+    def get_trading_days(self):
+        """
+        Obtain the master trading calendar of the backtest, as the
+        union or intersection of the dates of the loaded assets (or
+        the dates of the longest asset). Calculated once and cached.
 
-        for asset, stats in self.data_source_stats.items():
-            if stats['length'] > max_length:
-                max_length = stats['length']
-                longest_asset = asset
-        return longest_asset
+        Returns
+        -------
+        `pd.DatetimeIndex`
+            The sorted trading days.
+        """
+        if self._trading_days is None:
+            if len(self._asset_dates) == 0:
+                days = pd.DatetimeIndex([])
+            elif self.calendar == 'longest':
+                days = self._asset_dates[self._longest_asset]
+            else:
+                days = reduce(
+                    lambda days, dates: getattr(days, self.calendar)(dates),
+                    self._asset_dates.values()
+                )
+            self._trading_days = pd.DatetimeIndex(
+                days.unique().sort_values(), freq=None
+            ).rename(None)
+        return self._trading_days
     
     def get_asset_latest_bid_price(self, dt, asset_symbol):
         """
@@ -93,7 +163,236 @@ class BacktestDataHandler(object):
             # TODO: Log this
             mid = np.nan
         return mid
-    
+
+    def _get_assets_latest_prices(
+        self, dt, asset_symbols, batch_method, single_method
+    ):
+        """
+        Obtain the latest prices for many assets in a single pass,
+        taking the first non-NaN price for each asset across the
+        data sources.
+
+        Data sources implementing a batched method are queried once
+        for all outstanding assets, otherwise each outstanding asset
+        is queried individually. Should the batched query raise, e.g.
+        for a symbol unknown to the data source, each outstanding
+        asset is also queried individually.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The time at which to obtain the prices.
+        asset_symbols : `list[str]`
+            The asset symbols to obtain prices for.
+        batch_method : `str`
+            The name of the batched data source price method.
+        single_method : `str`
+            The name of the single asset data source price method.
+
+        Returns
+        -------
+        `np.ndarray`
+            The prices, ordered as the provided asset symbols.
+        """
+        asset_symbols = list(asset_symbols)
+        prices = np.full(len(asset_symbols), np.nan)
+        for ds in self.data_sources:
+            missing = np.flatnonzero(np.isnan(prices))
+            if len(missing) == 0:
+                break
+            missing_assets = [asset_symbols[idx] for idx in missing]
+            if hasattr(ds, batch_method):
+                try:
+                    prices[missing] = getattr(ds, batch_method)(dt, missing_assets)
+                    continue
+                except Exception:
+                    pass
+            for idx, asset_symbol in zip(missing, missing_assets):
+                try:
+                    prices[idx] = getattr(ds, single_method)(dt, asset_symbol)
+                except Exception:
+                    prices[idx] = np.nan
+        return prices
+
+    def get_assets_latest_bid_prices(self, dt, asset_symbols):
+        """
+        Obtain the latest bid prices for many assets at once.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The time at which to obtain the prices.
+        asset_symbols : `list[str]`
+            The asset symbols to obtain prices for.
+
+        Returns
+        -------
+        `np.ndarray`
+            The bid prices, ordered as the provided asset symbols.
+        """
+        return self._get_assets_latest_prices(
+            dt, asset_symbols, 'get_bids', 'get_bid'
+        )
+
+    def get_assets_latest_ask_prices(self, dt, asset_symbols):
+        """
+        Obtain the latest ask prices for many assets at once.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The time at which to obtain the prices.
+        asset_symbols : `list[str]`
+            The asset symbols to obtain prices for.
+
+        Returns
+        -------
+        `np.ndarray`
+            The ask prices, ordered as the provided asset symbols.
+        """
+        return self._get_assets_latest_prices(
+            dt, asset_symbols, 'get_asks', 'get_ask'
+        )
+
+    def get_assets_latest_mid_prices(self, dt, asset_symbols):
+        """
+        Obtain the latest mid prices for many assets at once.
+
+        As with get_asset_latest_bid_ask_price, OHLCV data only
+        provides a single price, so the bid is used for both sides.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The time at which to obtain the prices.
+        asset_symbols : `list[str]`
+            The asset symbols to obtain prices for.
+
+        Returns
+        -------
+        `np.ndarray`
+            The mid prices, ordered as the provided asset symbols.
+        """
+        bids = self.get_assets_latest_bid_prices(dt, asset_symbols)
+        return (bids + bids) / 2.0
+
+    def get_assets_latest_bid_ask_prices(self, dt, asset_symbols):
+        """
+        Obtain the latest bid and ask prices for many assets at once.
+
+        As with get_asset_latest_bid_ask_price, OHLCV data only
+        provides a single price, so the bid is used for both sides.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The time at which to obtain the prices.
+        asset_symbols : `list[str]`
+            The asset symbols to obtain prices for.
+
+        Returns
+        -------
+        `tuple(np.ndarray, np.ndarray)`
+            The bid and ask prices, ordered as the provided asset symbols.
+        """
+        bids = self.get_assets_latest_bid_prices(dt, asset_symbols)
+        return (bids, bids)
+
+    def _get_assets_prices_at(self, dts, asset_symbols, batch_method, latest_method):
+        """
+        Obtain the prices of many assets at many timestamps, taking
+        the first non-NaN price for each asset and timestamp across
+        the data sources.
+
+        If every data source implements the batched method each is
+        queried once for all timestamps, otherwise the latest prices
+        are obtained separately for each timestamp. Should the batched
+        query raise, each asset is queried separately from that data
+        source, leaving the prices of any asset that raises as NaN.
+
+        Parameters
+        ----------
+        dts : `pd.DatetimeIndex`
+            The times at which to obtain the prices.
+        asset_symbols : `list[str]`
+            The asset symbols to obtain prices for.
+        batch_method : `str`
+            The name of the batched data source price method.
+        latest_method : `str`
+            The name of the latest prices method of this handler.
+
+        Returns
+        -------
+        `np.ndarray`
+            The (timestamps x assets) prices.
+        """
+        asset_symbols = list(asset_symbols)
+        if not all(hasattr(ds, batch_method) for ds in self.data_sources):
+            return np.array([
+                getattr(self, latest_method)(dt, asset_symbols) for dt in dts
+            ]).reshape(len(dts), len(asset_symbols))
+
+        prices = np.full((len(dts), len(asset_symbols)), np.nan)
+        for ds in self.data_sources:
+            missing = np.isnan(prices)
+            if not missing.any():
+                break
+            try:
+                ds_prices = getattr(ds, batch_method)(dts, asset_symbols)
+            except Exception:
+                ds_prices = np.full((len(dts), len(asset_symbols)), np.nan)
+                for idx, asset_symbol in enumerate(asset_symbols):
+                    try:
+                        ds_prices[:, idx] = getattr(ds, batch_method)(
+                            dts, [asset_symbol]
+                        )[:, 0]
+                    except Exception:
+                        pass
+            prices = np.where(missing, ds_prices, prices)
+        return prices
+
+    def get_assets_bid_prices_at(self, dts, asset_symbols):
+        """
+        Obtain the bid prices of many assets at many timestamps,
+        such as those of an entire simulation.
+
+        Parameters
+        ----------
+        dts : `pd.DatetimeIndex`
+            The times at which to obtain the prices.
+        asset_symbols : `list[str]`
+            The asset symbols to obtain prices for.
+
+        Returns
+        -------
+        `np.ndarray`
+            The (timestamps x assets) bid prices.
+        """
+        return self._get_assets_prices_at(
+            dts, asset_symbols, 'get_bids_at', 'get_assets_latest_bid_prices'
+        )
+
+    def get_assets_ask_prices_at(self, dts, asset_symbols):
+        """
+        Obtain the ask prices of many assets at many timestamps,
+        such as those of an entire simulation.
+
+        Parameters
+        ----------
+        dts : `pd.DatetimeIndex`
+            The times at which to obtain the prices.
+        asset_symbols : `list[str]`
+            The asset symbols to obtain prices for.
+
+        Returns
+        -------
+        `np.ndarray`
+            The (timestamps x assets) ask prices.
+        """
+        return self._get_assets_prices_at(
+            dts, asset_symbols, 'get_asks_at', 'get_assets_latest_ask_prices'
+        )
+
     def get_asset_dividend(self, dt, asset_symbol):
         dividend = 0.0
         for ds in self.data_sources:
@@ -105,6 +404,55 @@ class BacktestDataHandler(object):
                 dividend = 0.0
         return dividend
 
+    def get_assets_dividends_at(self, dts, asset_symbols):
+        """
+        Obtain the dividends of many assets at many timestamps, such
+        as the market closes of an entire simulation, taking the
+        dividend of each asset from the first data source providing it.
+
+        If every data source implements batched dividends each is
+        queried once for all timestamps, otherwise each dividend is
+        obtained separately. Should the batched query raise, each
+        asset is queried separately from that data source.
+
+        Parameters
+        ----------
+        dts : `pd.DatetimeIndex`
+            The times at which to obtain the dividends.
+        asset_symbols : `list[str]`
+            The asset symbols to obtain dividends for.
+
+        Returns
+        -------
+        `np.ndarray`
+            The (timestamps x assets) dividends.
+        """
+        asset_symbols = list(asset_symbols)
+        if not all(hasattr(ds, 'get_dividends_at') for ds in self.data_sources):
+            return np.array([
+                [self.get_asset_dividend(dt, asset_symbol) for asset_symbol in asset_symbols]
+                for dt in dts
+            ], dtype=np.float64).reshape(len(dts), len(asset_symbols))
+
+        dividends = np.full((len(dts), len(asset_symbols)), np.nan)
+        for ds in self.data_sources:
+            missing = np.isnan(dividends)
+            if not missing.any():
+                break
+            try:
+                ds_dividends = ds.get_dividends_at(dts, asset_symbols)
+            except Exception:
+                ds_dividends = np.full((len(dts), len(asset_symbols)), np.nan)
+                for idx, asset_symbol in enumerate(asset_symbols):
+                    try:
+                        ds_dividends[:, idx] = ds.get_dividends_at(
+                            dts, [asset_symbol]
+                        )[:, 0]
+                    except Exception:
+                        pass
+            dividends = np.where(missing, ds_dividends, dividends)
+        return np.where(np.isnan(dividends), 0.0, dividends)
+
     def get_assets_historical_range_close_price(
         self, start_dt, end_dt, asset_symbols
     ):
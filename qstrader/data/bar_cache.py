@@ -0,0 +1,209 @@
+import hashlib
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+
+CACHE_FORMAT_VERSION = 1
+
+
+class BarFrameCache(object):
+    """
+    Stores already-parsed daily bar and bid/ask DataFrames on disk
+    in a columnar NumPy '.npz' format, such that repeated loading of
+    the same CSV files avoids re-parsing, re-localising and
+    re-converting the data.
+
+    Each cache entry is keyed on a hash of the absolute CSV file path,
+    its modification time and size, along with whether prices are
+    adjusted. Modifying a CSV file therefore invalidates its entry.
+
+    Parameters
+    ----------
+    cache_dir : `str`
+        The directory in which to store the cache files. Created if
+        it does not already exist.
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _cache_key(self, csv_path, adjust_prices):
+        """
+        Create the hashed cache key for a CSV file.
+
+        Parameters
+        ----------
+        csv_path : `str`
+            The full path to the CSV file.
+        adjust_prices : `Boolean`
+            Whether the cached prices are corporate-action adjusted.
+
+        Returns
+        -------
+        `str`
+            The hexadecimal cache key.
+        """
+        csv_stat = os.stat(csv_path)
+        key_str = '%s|%s|%s|%s|%s' % (
+            os.path.abspath(csv_path), csv_stat.st_mtime_ns,
+            csv_stat.st_size, bool(adjust_prices), CACHE_FORMAT_VERSION
+        )
+        return hashlib.sha1(key_str.encode('utf-8')).hexdigest()
+
+    def _cache_path(self, csv_path, adjust_prices):
+        """
+        Determine the cache file path for a CSV file.
+
+        Parameters
+        ----------
+        csv_path : `str`
+            The full path to the CSV file.
+        adjust_prices : `Boolean`
+            Whether the cached prices are corporate-action adjusted.
+
+        Returns
+        -------
+        `str`
+            The full path to the cache file.
+        """
+        csv_name = os.path.splitext(os.path.basename(csv_path))[0]
+        return os.path.join(
+            self.cache_dir, '%s-%s.npz' % (
+                csv_name, self._cache_key(csv_path, adjust_prices)
+            )
+        )
+
+    @staticmethod
+    def _frame_to_arrays(prefix, df):
+        """
+        Convert a datetime-indexed DataFrame into a dictionary of
+        NumPy arrays, one per column along with the index.
+
+        Parameters
+        ----------
+        prefix : `str`
+            The prefix used to namespace the array keys.
+        df : `pd.DataFrame`
+            The datetime-indexed DataFrame to convert.
+
+        Returns
+        -------
+        `dict{str: np.ndarray}`
+            The arrays representing the DataFrame.
+        """
+        index = df.index
+        arrays = {
+            '%s_index' % prefix: index.as_unit('ns').asi8,
+            '%s_meta' % prefix: np.array([
+                str(index.tz), index.unit, index.name or ''
+            ]),
+            '%s_columns' % prefix: np.array(list(df.columns), dtype=str)
+        }
+        for col_idx, column in enumerate(df.columns):
+            arrays['%s_col_%d' % (prefix, col_idx)] = df[column].to_numpy()
+        return arrays
+
+    @staticmethod
+    def _arrays_to_frame(prefix, arrays):
+        """
+        Reconstruct a datetime-indexed DataFrame from its
+        dictionary of NumPy arrays.
+
+        Parameters
+        ----------
+        prefix : `str`
+            The prefix used to namespace the array keys.
+        arrays : `dict{str: np.ndarray}`
+            The arrays representing the DataFrame.
+
+        Returns
+        -------
+        `pd.DataFrame`
+            The reconstructed DataFrame.
+        """
+        tz, unit, name = arrays['%s_meta' % prefix].tolist()
+        index = pd.DatetimeIndex(
+            pd.to_datetime(arrays['%s_index' % prefix], unit='ns', utc=True)
+        ).tz_convert(tz).as_unit(unit)
+        index.name = name if name != '' else None
+        columns = arrays['%s_columns' % prefix].tolist()
+        return pd.DataFrame(
+            {
+                column: arrays['%s_col_%d' % (prefix, col_idx)]
+                for col_idx, column in enumerate(columns)
+            },
+            index=index,
+            columns=columns
+        )
+
+    def load(self, csv_path, adjust_prices):
+        """
+        Load the cached bar and bid/ask DataFrames for a CSV file.
+
+        Parameters
+        ----------
+        csv_path : `str`
+            The full path to the CSV file.
+        adjust_prices : `Boolean`
+            Whether the cached prices are corporate-action adjusted.
+
+        Returns
+        -------
+        `tuple(pd.DataFrame, pd.DataFrame)` or None
+            The bar and bid/ask DataFrames, or None if not cached.
+        """
+        cache_path = self._cache_path(csv_path, adjust_prices)
+        if not os.path.exists(cache_path):
+            return None
+        with np.load(cache_path, allow_pickle=False) as npz:
+            arrays = {key: npz[key] for key in npz.files}
+        return (
+            BarFrameCache._arrays_to_frame('bar', arrays),
+            BarFrameCache._arrays_to_frame('bid_ask', arrays)
+        )
+
+    def save(self, csv_path, adjust_prices, bar_df, bid_ask_df):
+        """
+        Store the bar and bid/ask DataFrames for a CSV file. Frames
+        containing non-numeric columns are not cached.
+
+        The cache file is written atomically, such that concurrent
+        backtests sharing a cache directory never read partial files.
+
+        Parameters
+        ----------
+        csv_path : `str`
+            The full path to the CSV file.
+        adjust_prices : `Boolean`
+            Whether the cached prices are corporate-action adjusted.
+        bar_df : `pd.DataFrame`
+            The daily 'bar' OHLCV DataFrame.
+        bid_ask_df : `pd.DataFrame`
+            The individually-timestamped bid/ask DataFrame.
+
+        Returns
+        -------
+        `Boolean`
+            Whether the frames were cached.
+        """
+        for df in (bar_df, bid_ask_df):
+            if any(dtype.kind not in 'biuf' for dtype in df.dtypes):
+                return False
+
+        arrays = BarFrameCache._frame_to_arrays('bar', bar_df)
+        arrays.update(BarFrameCache._frame_to_arrays('bid_ask', bid_ask_df))
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as tmp_file:
+                np.savez(tmp_file, **arrays)
+            os.replace(tmp_path, self._cache_path(csv_path, adjust_prices))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return True
@@ -1,10 +1,109 @@
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import functools
+import itertools
 import os
 
 import numpy as np
 import pandas as pd
 import pytz
 from qstrader import settings
+from qstrader.data.bar_cache import BarFrameCache
+from qstrader.data.price_store import ArrayPriceStore
+
+
+def _bar_frame_to_bid_ask_df(bar_df, adjust_prices):
+    """
+    Converts the DataFrame from daily OHLCV 'bars' into a DataFrame
+    of open and closing price timestamps.
+
+    Defined at module level such that it can be dispatched to the
+    worker processes of a process pool.
+
+    Parameters
+    ----------
+    bar_df : `pd.DataFrame`
+        The daily 'bar' OHLCV DataFrame.
+    adjust_prices : `Boolean`
+        Whether to adjust the open/close prices for corporate actions
+        using the 'Adj Close' column.
+
+    Returns
+    -------
+    `pd.DataFrame`
+        The individually-timestamped open/closing prices, optionally
+        adjusted for corporate actions.
+    """
+    bar_df = bar_df.sort_index()
+    if adjust_prices:
+        if 'Adj Close' not in bar_df.columns:
+            raise ValueError(
+                "Unable to locate Adjusted Close pricing column in CSV data file. "
+                "Prices cannot be adjusted. Exiting."
+            )
+
+        # Restrict solely to the open/closing prices
+        oc_df = bar_df.loc[:, ['Open', 'Close', 'Adj Close']]
+
+        # Adjust opening prices
+        oc_df['Adj Open'] = (oc_df['Adj Close'] / oc_df['Close']) * oc_df['Open']
+        oc_df = oc_df.loc[:, ['Adj Open', 'Adj Close']]
+        oc_df.columns = ['Open', 'Close']
+    else:
+        oc_df = bar_df.loc[:, ['Open', 'Close']]
+
+    # Convert bars into separate rows for open/close prices
+    # appropriately timestamped
+    seq_oc_df = oc_df.T.unstack(level=0).reset_index()
+    seq_oc_df.columns = ['Date', 'Market', 'Price']
+    seq_oc_df.loc[seq_oc_df['Market'] == 'Open', 'Date'] += pd.Timedelta(hours=9, minutes=30)
+    seq_oc_df.loc[seq_oc_df['Market'] == 'Close', 'Date'] += pd.Timedelta(hours=16, minutes=00)
+
+    # TODO: Unable to distinguish between Bid/Ask, implement later
+    dp_df = seq_oc_df[['Date', 'Price']]
+    dp_df['Bid'] = dp_df['Price']
+    dp_df['Ask'] = dp_df['Price']
+    dp_df = dp_df.loc[:, ['Date', 'Bid', 'Ask']].ffill().set_index('Date').sort_index()
+    return dp_df
+
+
+class LazyAssetFrames(Mapping):
+    """
+    A read-only asset symbol keyed mapping of DataFrames that only
+    loads the DataFrame for an asset upon first access.
+
+    Membership, iteration and length are determined by the available
+    asset symbols, without loading any data.
+
+    Parameters
+    ----------
+    asset_symbols : `dict{str: str}` or `list[str]`
+        The asset symbols available to be loaded.
+    loader : `callable`
+        Called with a list of asset symbols, populating the `frames`
+        dictionary of this mapping for each of them.
+    """
+
+    def __init__(self, asset_symbols, loader):
+        self.asset_symbols = asset_symbols
+        self.loader = loader
+        self.frames = {}
+
+    def __getitem__(self, asset):
+        if asset not in self.frames:
+            if asset not in self.asset_symbols:
+                raise KeyError(asset)
+            self.loader([asset])
+        return self.frames[asset]
+
+    def __contains__(self, asset):
+        return asset in self.asset_symbols
+
+    def __iter__(self):
+        return iter(self.asset_symbols)
+
+    def __len__(self):
+        return len(self.asset_symbols)
 
 
 class CSVDailyBarDataSource(object):
@@ -30,47 +129,224 @@ class CSVDailyBarDataSource(object):
         An optional list of CSV symbols to restrict the data source to.
         The alternative is to convert all CSVs found within the
         provided directory.
+    array_store : `Boolean`, optional
+        Whether to pack all bid/ask prices into contiguous NumPy
+        arrays on a shared timestamp axis, giving O(1) price lookups
+        without the per-call DataFrame indexing and caching. Defaults
+        to False. Note that prices at timestamps absent from the bars
+        of an asset differ between the two. The array store
+        forward-fills the latest price, which is NaN prior to the
+        first bar of the asset, while the DataFrame lookups obtain the
+        final price of the asset. Hence a backtest including assets
+        listed after its start, e.g. sizing orders with a NaN price,
+        may raise with the array store where it would not otherwise.
+    cache_dir : `str`, optional
+        An optional directory in which to cache the parsed and
+        converted price DataFrames, keyed on each CSV file's path,
+        modification time, size and the price adjustment setting.
+        Subsequent data sources loading unmodified CSV files read
+        the cache rather than re-parsing the CSV files.
+    lazy : `Boolean`, optional
+        Whether to defer parsing each CSV file until its asset is
+        first queried, rather than loading every CSV file upon
+        construction. The price DataFrame dictionaries become
+        LazyAssetFrames mappings. Defaults to False.
+    workers : `int`, optional
+        The number of workers utilised to load the CSV files
+        concurrently. Files are parsed within a thread pool and
+        converted into bid/ask DataFrames within a process pool.
+        Results are identical to, and ordered as, sequential loading.
+        Defaults to None, which loads sequentially.
     """
 
-    def __init__(self, csv_dir, asset_type, adjust_prices=False, csv_symbols=None):
+    def __init__(
+        self,
+        csv_dir,
+        asset_type,
+        adjust_prices=False,
+        csv_symbols=None,
+        array_store=False,
+        cache_dir=None,
+        lazy=False,
+        workers=None
+    ):
         self.csv_dir = csv_dir
         self.asset_type = asset_type
         self.adjust_prices = adjust_prices
         self.csv_symbols = csv_symbols
+        self.array_store = array_store
+        self.lazy = lazy
+        self.workers = workers
+        self.cache = self._create_cache(cache_dir)
+
+        self.asset_csv_files = self._obtain_asset_csv_files_by_symbol()
+        self._cached_bid_ask_frames = {}
+        self._dividend_lookups = {}
+        if self.lazy:
+            self.asset_bar_frames = LazyAssetFrames(self.asset_csv_files, self.prefetch)
+            self.asset_bid_ask_frames = LazyAssetFrames(self.asset_csv_files, self.prefetch)
+            self.dividend_frames = LazyAssetFrames(self.asset_csv_files, self.prefetch)
+        else:
+            self.asset_bar_frames = self._load_csvs_into_dfs()
+            self.asset_bid_ask_frames = self._convert_bars_into_bid_ask_dfs()
+            self.dividend_frames = self._extract_dividends()
+        self.price_store = self._create_price_store()
+
 
-        self.asset_bar_frames = self._load_csvs_into_dfs()
-        self.asset_bid_ask_frames = self._convert_bars_into_bid_ask_dfs()
-        self.dividend_frames = self._extract_dividends()
+    def _create_cache(self, cache_dir):
+        """
+        Create the on-disk cache of parsed price DataFrames, if
+        a cache directory has been provided.
 
+        Parameters
+        ----------
+        cache_dir : `str` or None
+            The (potential) cache directory.
+
+        Returns
+        -------
+        `BarFrameCache` or None
+            The on-disk DataFrame cache, if utilised.
+        """
+        if cache_dir is None:
+            return None
+        return BarFrameCache(cache_dir)
+
+    def prefetch(self, assets):
+        """
+        Ensure the price and dividend data for the provided assets is
+        loaded. Only applicable to lazily-loading data sources, where
+        assets not already loaded are parsed and, if utilised, their
+        columns are added to the array-backed price store.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbols to load. Symbols without a
+            corresponding CSV file are ignored.
+        """
+        if not self.lazy:
+            return
+        unloaded_assets = [
+            asset for asset in assets
+            if asset in self.asset_csv_files
+            and asset not in self.asset_bar_frames.frames
+        ]
+        if len(unloaded_assets) == 0:
+            return
+
+        bar_frames = self._load_csvs_into_dfs(unloaded_assets)
+        bid_ask_frames = self._convert_bars_into_bid_ask_dfs(bar_frames)
+        for asset_symbol, bar_df in bar_frames.items():
+            self.asset_bar_frames.frames[asset_symbol] = bar_df
+            self.asset_bid_ask_frames.frames[asset_symbol] = bid_ask_frames[asset_symbol]
+            self.dividend_frames.frames[asset_symbol] = \
+                self._extract_dividend_frame(asset_symbol, bar_df)
+
+        if self.array_store:
+            self.price_store.add_assets(bid_ask_frames)
+
+    def _extract_dividend_frame(self, asset_symbol, bar_df):
+        """
+        Extract the dividends for a single asset from its daily
+        'bar' DataFrame, timestamped at market close.
+
+        Parameters
+        ----------
+        asset_symbol : `str`
+            The asset symbol of the bar DataFrame.
+        bar_df : `pd.DataFrame`
+            The daily 'bar' OHLCV DataFrame.
+
+        Returns
+        -------
+        `pd.DataFrame`
+            The dividends DataFrame, empty if no dividends are present.
+        """
+        if 'Dividends' in bar_df.columns:
+            dividend_df = bar_df[['Dividends']].dropna()  # Keep only non-NaN dividends
+            # Set the index (date) to market close (16:00:00 New York time) using Timedelta
+            dividend_df.index = dividend_df.index + pd.Timedelta(hours=16)
+            return dividend_df
+        else:
+            if settings.PRINT_EVENTS:
+                print(f"No 'Dividends' column found for {asset_symbol}")
+            return pd.DataFrame(columns=['Dividends'])  # Empty frame if no dividends
 
     def _extract_dividends(self):
         dividend_frames = {}
         for asset_symbol, bar_df in self.asset_bar_frames.items():
-            if 'Dividends' in bar_df.columns:
-                dividend_df = bar_df[['Dividends']].dropna()  # Keep only non-NaN dividends
-                # Set the index (date) to market close (16:00:00 New York time) using Timedelta
-                dividend_df.index = dividend_df.index + pd.Timedelta(hours=16)
-                
-
-                dividend_frames[asset_symbol] = dividend_df
-            else:
-                if settings.PRINT_EVENTS:
-                    print(f"No 'Dividends' column found for {asset_symbol}")
-                dividend_frames[asset_symbol] = pd.DataFrame(columns=['Dividends'])  # Empty frame if no dividends
+            dividend_frames[asset_symbol] = \
+                self._extract_dividend_frame(asset_symbol, bar_df)
         return dividend_frames
 
-    @functools.lru_cache(maxsize=1024 * 1024)
+    def _dividend_lookup(self, asset):
+        """
+        Obtain the timestamp-keyed dividend dictionary of an asset,
+        creating it upon first usage.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol to obtain the dividends for.
+
+        Returns
+        -------
+        `tuple(dict{int: float}, float)`
+            The dividends keyed by int64 nanosecond timestamp, along
+            with the final dividend, which is returned for timestamps
+            not present in the dividend DataFrame.
+        """
+        lookup = self._dividend_lookups.get(asset)
+        if lookup is None:
+            div_df = self.dividend_frames[asset]
+            dividends = div_df['Dividends'].to_numpy(dtype=np.float64)
+            lookup = (
+                dict(zip(div_df.index.as_unit('ns').asi8.tolist(), dividends.tolist())),
+                dividends[-1]
+            )
+            self._dividend_lookups[asset] = lookup
+        return lookup
+
     def get_dividend(self, dt, asset):
         if asset in self.dividend_frames and not self.dividend_frames[asset].empty:
-            div_df = self.dividend_frames[asset]
-            div_series = div_df.iloc[div_df.index.get_indexer([dt])]['Dividends']
-            try:
-                dividend = div_series.iloc[0]
-            except IndexError:  # Changed from KeyError to IndexError
-                return 0.0
+            dividends, final_dividend = self._dividend_lookup(asset)
+            dividend = dividends.get(dt.value, final_dividend)
             return dividend if not np.isnan(dividend) else 0.0
         return 0.0
 
+    def get_dividends_at(self, dts, assets):
+        """
+        Obtain the dividends of many assets at many timestamps, with
+        a single dividend lookup per asset.
+
+        As with get_dividend, timestamps absent from the dividends of
+        an asset obtain its final dividend.
+
+        Parameters
+        ----------
+        dts : `pd.DatetimeIndex`
+            When to obtain the dividends for.
+        assets : `list[str]`
+            The asset symbols to obtain the dividends for.
+
+        Returns
+        -------
+        `np.ndarray`
+            The (timestamps x assets) dividends, zero for any asset
+            without dividends.
+        """
+        dt_values = pd.DatetimeIndex(dts).as_unit('ns').asi8.tolist()
+        dividends = np.zeros((len(dt_values), len(assets)))
+        for col, asset in enumerate(assets):
+            if asset in self.dividend_frames and not self.dividend_frames[asset].empty:
+                asset_dividends, final_dividend = self._dividend_lookup(asset)
+                dividends[:, col] = [
+                    asset_dividends.get(dt_value, final_dividend)
+                    for dt_value in dt_values
+                ]
+        return np.where(np.isnan(dividends), 0.0, dividends)
+
     def _obtain_asset_csv_files(self):
         """
         Obtain the list of all CSV filenames in the CSV directory.
@@ -85,6 +361,27 @@ class CSVDailyBarDataSource(object):
             if file.endswith('.csv')
         ]
 
+    def _obtain_asset_csv_files_by_symbol(self):
+        """
+        Obtain the CSV filenames to load, keyed by the QSTrader
+        symbology of their asset.
+
+        Returns
+        -------
+        `dict{str: str}`
+            The asset symbol keyed CSV filenames.
+        """
+        if self.csv_symbols is not None:
+            # TODO/NOTE: This assumes existence of CSV symbols
+            # within the provided directory.
+            csv_files = ['%s.csv' % symbol for symbol in self.csv_symbols]
+        else:
+            csv_files = self._obtain_asset_csv_files()
+        return {
+            self._obtain_asset_symbol_from_filename(csv_file): csv_file
+            for csv_file in csv_files
+        }
+
     def _obtain_asset_symbol_from_filename(self, csv_file):
         """
         Return the QSTrader symbology for the asset.
@@ -129,10 +426,35 @@ class CSVDailyBarDataSource(object):
         csv_df = csv_df.set_index(csv_df.index.tz_localize('America/New_York'))
         return csv_df
 
-    def _load_csvs_into_dfs(self):
+    def _use_workers(self, num_tasks):
+        """
+        Determine whether to utilise a pool of workers for the
+        provided number of tasks.
+
+        Parameters
+        ----------
+        num_tasks : `int`
+            The number of tasks to carry out.
+
+        Returns
+        -------
+        `Boolean`
+            Whether to utilise a pool of workers.
+        """
+        return (
+            self.workers is not None and self.workers > 1 and num_tasks > 1
+        )
+
+    def _load_csvs_into_dfs(self, asset_symbols=None):
         """
         Load all CSVs in the CSV directory into Pandas DataFrames.
 
+        Parameters
+        ----------
+        asset_symbols : `list[str]`, optional
+            Restrict loading to these asset symbols. Defaults to
+            all of the available asset symbols.
+
         Returns
         -------
         `dict{pd.DataFrame}`
@@ -141,21 +463,52 @@ class CSVDailyBarDataSource(object):
         """
         if settings.PRINT_EVENTS:
             print("Loading CSV files into DataFrames...")
-        if self.csv_symbols is not None:
-            # TODO/NOTE: This assumes existence of CSV symbols
-            # within the provided directory.
-            csv_files = ['%s.csv' % symbol for symbol in self.csv_symbols]
+        if asset_symbols is None:
+            asset_symbols = list(self.asset_csv_files.keys())
+
+        if self._use_workers(len(asset_symbols)):
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                bar_frames = list(
+                    executor.map(self._load_asset_bar_frame, asset_symbols)
+                )
         else:
-            csv_files = self._obtain_asset_csv_files()
+            bar_frames = [
+                self._load_asset_bar_frame(asset_symbol)
+                for asset_symbol in asset_symbols
+            ]
+        return dict(zip(asset_symbols, bar_frames))
 
-        asset_frames = {}
-        for csv_file in csv_files:
-            asset_symbol = self._obtain_asset_symbol_from_filename(csv_file)
-            if settings.PRINT_EVENTS:
-                print("Loading CSV file for symbol '%s'..." % asset_symbol)
-            csv_df = self._load_csv_into_df(csv_file)
-            asset_frames[asset_symbol] = csv_df
-        return asset_frames
+    def _load_asset_bar_frame(self, asset_symbol):
+        """
+        Load the daily 'bar' DataFrame of a single asset, from the
+        on-disk cache if available, otherwise from its CSV file.
+
+        Any cached bid/ask DataFrame is retained for subsequent usage
+        by _convert_bars_into_bid_ask_dfs.
+
+        Parameters
+        ----------
+        asset_symbol : `str`
+            The asset symbol to load.
+
+        Returns
+        -------
+        `pd.DataFrame`
+            DataFrame of the CSV file with localised timestamps.
+        """
+        csv_file = self.asset_csv_files[asset_symbol]
+        if self.cache is not None:
+            cached_frames = self.cache.load(
+                os.path.join(self.csv_dir, csv_file), self.adjust_prices
+            )
+            if cached_frames is not None:
+                if settings.PRINT_EVENTS:
+                    print("Loading cached data for symbol '%s'..." % asset_symbol)
+                self._cached_bid_ask_frames[asset_symbol] = cached_frames[1]
+                return cached_frames[0]
+        if settings.PRINT_EVENTS:
+            print("Loading CSV file for symbol '%s'..." % asset_symbol)
+        return self._load_csv_into_df(csv_file)
 
     def _convert_bar_frame_into_bid_ask_df(self, bar_df):
         """
@@ -176,43 +529,22 @@ class CSVDailyBarDataSource(object):
             The individually-timestamped open/closing prices, optionally
             adjusted for corporate actions.
         """
-        bar_df = bar_df.sort_index()
-        if self.adjust_prices:
-            if 'Adj Close' not in bar_df.columns:
-                raise ValueError(
-                    "Unable to locate Adjusted Close pricing column in CSV data file. "
-                    "Prices cannot be adjusted. Exiting."
-                )
-
-            # Restrict solely to the open/closing prices
-            oc_df = bar_df.loc[:, ['Open', 'Close', 'Adj Close']]
-
-            # Adjust opening prices
-            oc_df['Adj Open'] = (oc_df['Adj Close'] / oc_df['Close']) * oc_df['Open']
-            oc_df = oc_df.loc[:, ['Adj Open', 'Adj Close']]
-            oc_df.columns = ['Open', 'Close']
-        else:
-            oc_df = bar_df.loc[:, ['Open', 'Close']]
+        return _bar_frame_to_bid_ask_df(bar_df, self.adjust_prices)
 
-        # Convert bars into separate rows for open/close prices
-        # appropriately timestamped
-        seq_oc_df = oc_df.T.unstack(level=0).reset_index()
-        seq_oc_df.columns = ['Date', 'Market', 'Price']
-        seq_oc_df.loc[seq_oc_df['Market'] == 'Open', 'Date'] += pd.Timedelta(hours=9, minutes=30)
-        seq_oc_df.loc[seq_oc_df['Market'] == 'Close', 'Date'] += pd.Timedelta(hours=16, minutes=00)
-
-        # TODO: Unable to distinguish between Bid/Ask, implement later
-        dp_df = seq_oc_df[['Date', 'Price']]
-        dp_df['Bid'] = dp_df['Price']
-        dp_df['Ask'] = dp_df['Price']
-        dp_df = dp_df.loc[:, ['Date', 'Bid', 'Ask']].ffill().set_index('Date').sort_index()
-        return dp_df
-
-    def _convert_bars_into_bid_ask_dfs(self):
+    def _convert_bars_into_bid_ask_dfs(self, asset_bar_frames=None):
         """
         Convert all of the daily OHLCV 'bar' based DataFrames into
         individually-timestamped open/closing price DataFrames.
 
+        Bid/ask DataFrames retrieved from the on-disk cache are used
+        directly, while the remainder are converted and then cached.
+
+        Parameters
+        ----------
+        asset_bar_frames : `dict{pd.DataFrame}`, optional
+            The asset symbol keyed bar DataFrames to convert. Defaults
+            to all of the loaded bar DataFrames.
+
         Returns
         -------
         `dict{pd.DataFrame}`
@@ -220,19 +552,250 @@ class CSVDailyBarDataSource(object):
         """
         if settings.PRINT_EVENTS:
             print("Loading pricing in CSV files...")
-        asset_bid_ask_frames = {}
-        for asset_symbol, bar_df in self.asset_bar_frames.items():
+        if asset_bar_frames is None:
+            asset_bar_frames = self.asset_bar_frames
+
+        cached_frames = {
+            asset_symbol: self._cached_bid_ask_frames.pop(asset_symbol)
+            for asset_symbol in asset_bar_frames.keys()
+            if asset_symbol in self._cached_bid_ask_frames
+        }
+        unconverted_assets = [
+            asset_symbol for asset_symbol in asset_bar_frames.keys()
+            if asset_symbol not in cached_frames
+        ]
+        unconverted_frames = [
+            asset_bar_frames[asset_symbol] for asset_symbol in unconverted_assets
+        ]
+
+        if self._use_workers(len(unconverted_assets)):
+            chunksize = max(1, len(unconverted_assets) // (self.workers * 4))
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                converted_frames = list(
+                    executor.map(
+                        _bar_frame_to_bid_ask_df,
+                        unconverted_frames,
+                        itertools.repeat(self.adjust_prices),
+                        chunksize=chunksize
+                    )
+                )
+        else:
+            converted_frames = [
+                self._convert_bar_frame_into_bid_ask_df(bar_df)
+                for bar_df in unconverted_frames
+            ]
+
+        for asset_symbol, bid_ask_df in zip(unconverted_assets, converted_frames):
             if settings.PRINT_EVENTS:
                 print("Loading CSV file for symbol '%s'..." % asset_symbol)
-            asset_bid_ask_frames[asset_symbol] = \
-                self._convert_bar_frame_into_bid_ask_df(bar_df)
-        return asset_bid_ask_frames
+            if self.cache is not None:
+                self.cache.save(
+                    os.path.join(self.csv_dir, self.asset_csv_files[asset_symbol]),
+                    self.adjust_prices, asset_bar_frames[asset_symbol], bid_ask_df
+                )
+            cached_frames[asset_symbol] = bid_ask_df
+
+        return {
+            asset_symbol: cached_frames[asset_symbol]
+            for asset_symbol in asset_bar_frames.keys()
+        }
+
+    def _create_price_store(self):
+        """
+        Packs the bid/ask DataFrames into an array-backed price
+        store, if requested.
+
+        Returns
+        -------
+        `ArrayPriceStore` or None
+            The array-backed price store, if utilised.
+        """
+        if not self.array_store:
+            return None
+        if self.lazy:
+            return ArrayPriceStore.from_bid_ask_frames(self.asset_bid_ask_frames.frames)
+        return ArrayPriceStore.from_bid_ask_frames(self.asset_bid_ask_frames)
 
-    @functools.lru_cache(maxsize=1024 * 1024)
     def get_bid(self, dt, asset):
         """
         Obtain the bid price of an asset at the provided timestamp.
 
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the bid price for.
+        asset : `str`
+            The asset symbol to obtain the bid price for.
+
+        Returns
+        -------
+        `float`
+            The bid price.
+        """
+        if self.lazy:
+            self.prefetch([asset])
+        if self.price_store is not None:
+            return self.price_store.get_bid(dt, asset)
+        return self._get_frame_bid(dt, asset)
+
+    def get_ask(self, dt, asset):
+        """
+        Obtain the ask price of an asset at the provided timestamp.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the ask price for.
+        asset : `str`
+            The asset symbol to obtain the ask price for.
+
+        Returns
+        -------
+        `float`
+            The ask price.
+        """
+        if self.lazy:
+            self.prefetch([asset])
+        if self.price_store is not None:
+            return self.price_store.get_ask(dt, asset)
+        return self._get_frame_ask(dt, asset)
+
+    def get_bids(self, dt, assets):
+        """
+        Obtain the bid prices of many assets at the provided timestamp.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the bid prices for.
+        assets : `list[str]`
+            The asset symbols to obtain the bid prices for.
+
+        Returns
+        -------
+        `np.ndarray`
+            The bid prices, NaN for any asset not in the data source.
+        """
+        if self.lazy:
+            self.prefetch(assets)
+        if self.price_store is not None:
+            return self.price_store.get_bids(dt, assets)
+        return np.array([
+            self._get_frame_bid(dt, asset)
+            if asset in self.asset_bid_ask_frames else np.nan
+            for asset in assets
+        ], dtype=np.float64)
+
+    def get_asks(self, dt, assets):
+        """
+        Obtain the ask prices of many assets at the provided timestamp.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the ask prices for.
+        assets : `list[str]`
+            The asset symbols to obtain the ask prices for.
+
+        Returns
+        -------
+        `np.ndarray`
+            The ask prices, NaN for any asset not in the data source.
+        """
+        if self.lazy:
+            self.prefetch(assets)
+        if self.price_store is not None:
+            return self.price_store.get_asks(dt, assets)
+        return np.array([
+            self._get_frame_ask(dt, asset)
+            if asset in self.asset_bid_ask_frames else np.nan
+            for asset in assets
+        ], dtype=np.float64)
+
+    def _get_frame_prices_at(self, dts, assets, column):
+        """
+        Obtain the prices of many assets at many timestamps from the
+        bid/ask DataFrames, with a single index lookup per asset.
+
+        As with the single timestamp lookup, timestamps absent from
+        the DataFrame of an asset obtain its final price.
+
+        Parameters
+        ----------
+        dts : `pd.DatetimeIndex`
+            When to obtain the prices for.
+        assets : `list[str]`
+            The asset symbols to obtain the prices for.
+        column : `str`
+            Either 'Bid' or 'Ask'.
+
+        Returns
+        -------
+        `np.ndarray`
+            The (timestamps x assets) prices, NaN for any asset not
+            in the data source.
+        """
+        prices = np.full((len(dts), len(assets)), np.nan)
+        for col, asset in enumerate(assets):
+            if asset in self.asset_bid_ask_frames:
+                bid_ask_df = self.asset_bid_ask_frames[asset]
+                prices[:, col] = bid_ask_df[column].to_numpy(dtype=np.float64)[
+                    bid_ask_df.index.get_indexer(dts)
+                ]
+        return prices
+
+    def get_bids_at(self, dts, assets):
+        """
+        Obtain the bid prices of many assets at many timestamps.
+
+        Parameters
+        ----------
+        dts : `pd.DatetimeIndex`
+            When to obtain the bid prices for.
+        assets : `list[str]`
+            The asset symbols to obtain the bid prices for.
+
+        Returns
+        -------
+        `np.ndarray`
+            The (timestamps x assets) bid prices, NaN for any asset
+            not in the data source.
+        """
+        if self.lazy:
+            self.prefetch(assets)
+        if self.price_store is not None:
+            return self.price_store.get_bids_at(dts, assets)
+        return self._get_frame_prices_at(dts, assets, 'Bid')
+
+    def get_asks_at(self, dts, assets):
+        """
+        Obtain the ask prices of many assets at many timestamps.
+
+        Parameters
+        ----------
+        dts : `pd.DatetimeIndex`
+            When to obtain the ask prices for.
+        assets : `list[str]`
+            The asset symbols to obtain the ask prices for.
+
+        Returns
+        -------
+        `np.ndarray`
+            The (timestamps x assets) ask prices, NaN for any asset
+            not in the data source.
+        """
+        if self.lazy:
+            self.prefetch(assets)
+        if self.price_store is not None:
+            return self.price_store.get_asks_at(dts, assets)
+        return self._get_frame_prices_at(dts, assets, 'Ask')
+
+    @functools.lru_cache(maxsize=1024 * 1024)
+    def _get_frame_bid(self, dt, asset):
+        """
+        Obtain the bid price of an asset at the provided timestamp
+        from the bid/ask DataFrame.
+
         Parameters
         ----------
         dt : `pd.Timestamp`
@@ -254,9 +817,10 @@ class CSVDailyBarDataSource(object):
         return bid
 
     @functools.lru_cache(maxsize=1024 * 1024)
-    def get_ask(self, dt, asset):
+    def _get_frame_ask(self, dt, asset):
         """
-        Obtain the ask price of an asset at the provided timestamp.
+        Obtain the ask price of an asset at the provided timestamp
+        from the bid/ask DataFrame.
 
         Parameters
         ----------
@@ -0,0 +1,126 @@
+import numpy as np
+
+
+class EventPriceDataHandler(object):
+    """
+    Wraps a BacktestDataHandler, answering the latest price queries
+    at the current simulation event from bid and ask prices obtained
+    upfront for every event, such as by a vectorised backtest.
+
+    As with the BacktestDataHandler, OHLCV data only provides a single
+    price, so the bid is used for both sides of the bid and ask and
+    mid prices. Queries at any other time, or for assets without
+    precomputed prices, along with all other attributes, are passed
+    through to the wrapped data handler.
+
+    Parameters
+    ----------
+    data_handler : `BacktestDataHandler`
+        The wrapped data handler.
+    event_times : `pd.DatetimeIndex`
+        The simulation event timestamps.
+    bids : `dict{str: np.ndarray}`
+        The bid prices of each asset at every simulation event.
+    asks : `dict{str: np.ndarray}`
+        The ask prices of each asset at every simulation event.
+    """
+
+    def __init__(self, data_handler, event_times, bids, asks):
+        self.data_handler = data_handler
+        self.event_ns = event_times.as_unit('ns').asi8
+        self.bids = bids
+        self.asks = asks
+        self.event_idx = None
+
+    def __getattr__(self, name):
+        return getattr(self.data_handler, name)
+
+    def set_event(self, event_idx):
+        """
+        Set the current simulation event, at which the latest
+        prices are answered from the precomputed prices.
+
+        Parameters
+        ----------
+        event_idx : `int`
+            The index of the current simulation event.
+        """
+        self.event_idx = event_idx
+
+    def _is_current(self, dt):
+        """
+        Whether the provided time is that of the current event.
+        """
+        return (
+            self.event_idx is not None and
+            dt.value == self.event_ns[self.event_idx]
+        )
+
+    def _get_assets_latest_prices(self, dt, asset_symbols, prices, method):
+        """
+        Obtain the latest prices of many assets from the precomputed
+        prices at the current event, otherwise from the wrapped data
+        handler.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The time at which to obtain the prices.
+        asset_symbols : `list[str]`
+            The asset symbols to obtain prices for.
+        prices : `dict{str: np.ndarray}`
+            The precomputed prices of each asset.
+        method : `str`
+            The name of the batched method of the wrapped data handler.
+
+        Returns
+        -------
+        `np.ndarray`
+            The prices, ordered as the provided asset symbols.
+        """
+        if self._is_current(dt) and all(asset in prices for asset in asset_symbols):
+            return np.array(
+                [prices[asset][self.event_idx] for asset in asset_symbols],
+                dtype=np.float64
+            )
+        return getattr(self.data_handler, method)(dt, asset_symbols)
+
+    def get_asset_latest_bid_price(self, dt, asset_symbol):
+        if self._is_current(dt) and asset_symbol in self.bids:
+            return self.bids[asset_symbol][self.event_idx]
+        return self.data_handler.get_asset_latest_bid_price(dt, asset_symbol)
+
+    def get_asset_latest_ask_price(self, dt, asset_symbol):
+        if self._is_current(dt) and asset_symbol in self.asks:
+            return self.asks[asset_symbol][self.event_idx]
+        return self.data_handler.get_asset_latest_ask_price(dt, asset_symbol)
+
+    def get_asset_latest_bid_ask_price(self, dt, asset_symbol):
+        if self._is_current(dt) and asset_symbol in self.bids:
+            bid = self.bids[asset_symbol][self.event_idx]
+            return (bid, bid)
+        return self.data_handler.get_asset_latest_bid_ask_price(dt, asset_symbol)
+
+    def get_asset_latest_mid_price(self, dt, asset_symbol):
+        if self._is_current(dt) and asset_symbol in self.bids:
+            bid = self.bids[asset_symbol][self.event_idx]
+            return (bid + bid) / 2.0
+        return self.data_handler.get_asset_latest_mid_price(dt, asset_symbol)
+
+    def get_assets_latest_bid_prices(self, dt, asset_symbols):
+        return self._get_assets_latest_prices(
+            dt, asset_symbols, self.bids, 'get_assets_latest_bid_prices'
+        )
+
+    def get_assets_latest_ask_prices(self, dt, asset_symbols):
+        return self._get_assets_latest_prices(
+            dt, asset_symbols, self.asks, 'get_assets_latest_ask_prices'
+        )
+
+    def get_assets_latest_mid_prices(self, dt, asset_symbols):
+        bids = self.get_assets_latest_bid_prices(dt, asset_symbols)
+        return (bids + bids) / 2.0
+
+    def get_assets_latest_bid_ask_prices(self, dt, asset_symbols):
+        bids = self.get_assets_latest_bid_prices(dt, asset_symbols)
+        return (bids, bids)
@@ -0,0 +1,43 @@
+import numpy as np
+
+
+def get_assets_latest_prices(data_handler, dt, asset_symbols, price_type):
+    """
+    Obtain the latest prices of many assets from a data handler, in a
+    single call if the data handler provides the batched price methods
+    of the BacktestDataHandler, otherwise querying each asset in turn.
+
+    Support for the batched method is determined from the class of the
+    data handler, such that data handlers resolving attributes
+    dynamically (e.g. via __getattr__) are queried per asset unless
+    they define the batched method.
+
+    Parameters
+    ----------
+    data_handler : `DataHandler`
+        The data handler to obtain the prices from.
+    dt : `pd.Timestamp`
+        The time at which to obtain the prices.
+    asset_symbols : `list[str]`
+        The asset symbols to obtain prices for.
+    price_type : `str`
+        One of 'bid', 'ask', 'mid' or 'bid_ask'.
+
+    Returns
+    -------
+    `np.ndarray` or `tuple(np.ndarray, np.ndarray)`
+        The prices, ordered as the provided asset symbols. For
+        'bid_ask' the bid prices and the ask prices.
+    """
+    batch_method = 'get_assets_latest_%s_prices' % price_type
+    if hasattr(type(data_handler), batch_method):
+        return getattr(data_handler, batch_method)(dt, asset_symbols)
+
+    single_method = getattr(data_handler, 'get_asset_latest_%s_price' % price_type)
+    prices = [single_method(dt, asset) for asset in asset_symbols]
+    if price_type == 'bid_ask':
+        return (
+            np.array([bid for bid, ask in prices], dtype=np.float64),
+            np.array([ask for bid, ask in prices], dtype=np.float64)
+        )
+    return np.array(prices, dtype=np.float64)
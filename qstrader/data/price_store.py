@@ -0,0 +1,449 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+
+class ArrayPriceStore(object):
+    """
+    Packs the bid/ask prices of many assets into contiguous
+    two-dimensional NumPy arrays sharing a single timestamp axis.
+
+    The timestamp axis is stored as int64 nanoseconds since the
+    epoch (UTC) along with a precomputed timestamp-to-row dictionary,
+    such that a price lookup is a single dictionary access followed
+    by an array index.
+
+    Prices are forward-filled along the shared axis so that a row
+    always holds the latest available price of each asset. Rows prior
+    to the first available price of an asset are NaN.
+
+    Further assets can be added in place via add_assets, with the
+    columns held within arrays of spare capacity that double in size
+    as required, such that adding assets one at a time is amortised
+    linear in the number of assets.
+
+    Parameters
+    ----------
+    timestamps : `np.ndarray`
+        The sorted int64 nanosecond timestamp axis.
+    assets : `list[str]`
+        The asset symbols, one per array column.
+    bids : `np.ndarray`
+        The (timestamps x assets) array of bid prices.
+    asks : `np.ndarray`
+        The (timestamps x assets) array of ask prices.
+    """
+
+    def __init__(self, timestamps, assets, bids, asks):
+        self.timestamps = timestamps
+        self.assets = list(assets)
+        self._bid_columns = bids
+        self._ask_columns = asks
+        self.bids = bids
+        self.asks = asks
+        self.asset_index = {
+            asset: col for col, asset in enumerate(self.assets)
+        }
+        self.row_index = {
+            ts: row for row, ts in enumerate(self.timestamps.tolist())
+        }
+
+    @classmethod
+    def from_bid_ask_frames(cls, bid_ask_frames):
+        """
+        Constructs the price store from a dictionary of
+        individually-timestamped bid/ask DataFrames.
+
+        Parameters
+        ----------
+        bid_ask_frames : `dict{str: pd.DataFrame}`
+            The asset symbol keyed bid/ask DataFrames.
+
+        Returns
+        -------
+        `ArrayPriceStore`
+            The array-backed price store.
+        """
+        assets = list(bid_ask_frames.keys())
+        if len(assets) == 0:
+            empty = np.empty((0, 0), dtype=np.float64)
+            return cls(np.empty(0, dtype=np.int64), assets, empty, empty.copy())
+
+        axis = bid_ask_frames[assets[0]].index
+        for asset in assets[1:]:
+            axis = axis.union(bid_ask_frames[asset].index)
+
+        bids = np.full((len(axis), len(assets)), np.nan)
+        asks = np.full((len(axis), len(assets)), np.nan)
+        for col, asset in enumerate(assets):
+            aligned_df = bid_ask_frames[asset].reindex(axis).ffill()
+            bids[:, col] = aligned_df['Bid'].to_numpy(dtype=np.float64)
+            asks[:, col] = aligned_df['Ask'].to_numpy(dtype=np.float64)
+        return cls(axis.asi8.copy(), assets, bids, asks)
+
+    def _realign(self, timestamps):
+        """
+        Move the existing columns onto an extended timestamp axis,
+        carrying the latest price of each asset forward onto the
+        newly added timestamps.
+
+        Parameters
+        ----------
+        timestamps : `np.ndarray`
+            The sorted int64 nanosecond timestamp axis, a superset
+            of the existing axis.
+        """
+        rows = np.searchsorted(self.timestamps, timestamps, side='right') - 1
+        before_start = rows < 0
+        for attr in ('_bid_columns', '_ask_columns'):
+            columns = getattr(self, attr)
+            if len(self.timestamps) == 0:
+                columns = np.full((len(timestamps), columns.shape[1]), np.nan)
+            else:
+                columns = columns[np.maximum(rows, 0)]
+                columns[before_start] = np.nan
+            setattr(self, attr, columns)
+        self.timestamps = timestamps
+        self.row_index = {
+            ts: row for row, ts in enumerate(self.timestamps.tolist())
+        }
+
+    def _reserve(self, num_assets):
+        """
+        Ensure the column arrays have capacity for the provided
+        number of assets, doubling their capacity if not.
+
+        Parameters
+        ----------
+        num_assets : `int`
+            The required number of asset columns.
+        """
+        capacity = self._bid_columns.shape[1]
+        if num_assets <= capacity:
+            return
+        capacity = max(num_assets, 2 * capacity)
+        for attr in ('_bid_columns', '_ask_columns'):
+            columns = getattr(self, attr)
+            grown = np.full((len(self.timestamps), capacity), np.nan)
+            grown[:, :len(self.assets)] = columns[:, :len(self.assets)]
+            setattr(self, attr, grown)
+
+    def add_assets(self, bid_ask_frames):
+        """
+        Add the prices of further assets to the store in place,
+        extending the shared timestamp axis if the new assets are
+        priced at timestamps not already present.
+
+        Parameters
+        ----------
+        bid_ask_frames : `dict{str: pd.DataFrame}`
+            The asset symbol keyed bid/ask DataFrames. Assets already
+            within the store are ignored.
+        """
+        new_assets = [
+            asset for asset in bid_ask_frames if asset not in self.asset_index
+        ]
+        if len(new_assets) == 0:
+            return
+
+        timestamps = np.union1d(
+            self.timestamps,
+            np.concatenate([
+                bid_ask_frames[asset].index.as_unit('ns').asi8
+                for asset in new_assets
+            ])
+        )
+        if len(timestamps) != len(self.timestamps):
+            self._realign(timestamps)
+        self._reserve(len(self.assets) + len(new_assets))
+
+        for asset in new_assets:
+            col = len(self.assets)
+            bid_ask_df = bid_ask_frames[asset]
+            axis = pd.DatetimeIndex(self.timestamps.view('M8[ns]'))
+            if bid_ask_df.index.tz is not None:
+                axis = axis.tz_localize('UTC').tz_convert(bid_ask_df.index.tz)
+            aligned_df = bid_ask_df.reindex(axis.as_unit(bid_ask_df.index.unit)).ffill()
+            self._bid_columns[:, col] = aligned_df['Bid'].to_numpy(dtype=np.float64)
+            self._ask_columns[:, col] = aligned_df['Ask'].to_numpy(dtype=np.float64)
+            self.assets.append(asset)
+            self.asset_index[asset] = col
+
+        self.bids = self._bid_columns[:, :len(self.assets)]
+        self.asks = self._ask_columns[:, :len(self.assets)]
+
+    def save(self, directory):
+        """
+        Write the price store arrays into the provided directory as
+        uncompressed '.npy' files, such that they can be subsequently
+        memory-mapped via load.
+
+        Parameters
+        ----------
+        directory : `str`
+            The (existing) directory in which to write the arrays.
+        """
+        np.save(os.path.join(directory, 'timestamps.npy'), self.timestamps)
+        np.save(
+            os.path.join(directory, 'assets.npy'),
+            np.array(self.assets, dtype=str)
+        )
+        np.save(os.path.join(directory, 'bids.npy'), self.bids)
+        np.save(os.path.join(directory, 'asks.npy'), self.asks)
+
+    @classmethod
+    def load(cls, directory, mmap_mode=None):
+        """
+        Constructs the price store from arrays previously written
+        into the provided directory via save.
+
+        Parameters
+        ----------
+        directory : `str`
+            The directory containing the arrays.
+        mmap_mode : `str`, optional
+            The NumPy memory-mapping mode for the price arrays. Using
+            'r' shares a single read-only copy of the prices between
+            all processes loading the same directory.
+
+        Returns
+        -------
+        `ArrayPriceStore`
+            The array-backed price store.
+        """
+        return cls(
+            np.load(os.path.join(directory, 'timestamps.npy')),
+            np.load(os.path.join(directory, 'assets.npy')).tolist(),
+            np.load(os.path.join(directory, 'bids.npy'), mmap_mode=mmap_mode),
+            np.load(os.path.join(directory, 'asks.npy'), mmap_mode=mmap_mode)
+        )
+
+    def _row(self, dt):
+        """
+        Obtain the array row holding the latest prices at the
+        provided timestamp. Falls back to a binary search of the
+        timestamp axis if the timestamp is not present exactly.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The timestamp to obtain the row for.
+
+        Returns
+        -------
+        `int`
+            The row index, or -1 if prior to the start of the axis.
+        """
+        ts = dt.value
+        row = self.row_index.get(ts)
+        if row is None:
+            row = int(np.searchsorted(self.timestamps, ts, side='right')) - 1
+        return row
+
+    def _get_price(self, prices, dt, asset):
+        """
+        Obtain a single price from the provided price array.
+
+        Parameters
+        ----------
+        prices : `np.ndarray`
+            The bid or ask price array.
+        dt : `pd.Timestamp`
+            When to obtain the price for.
+        asset : `str`
+            The asset symbol to obtain the price for.
+
+        Returns
+        -------
+        `float`
+            The price, NaN if prior to the first available price.
+        """
+        col = self.asset_index[asset]
+        row = self._row(dt)
+        if row < 0:
+            return np.nan
+        return prices[row, col]
+
+    def get_bid(self, dt, asset):
+        """
+        Obtain the bid price of an asset at the provided timestamp.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the bid price for.
+        asset : `str`
+            The asset symbol to obtain the bid price for.
+
+        Returns
+        -------
+        `float`
+            The bid price.
+        """
+        return self._get_price(self.bids, dt, asset)
+
+    def get_ask(self, dt, asset):
+        """
+        Obtain the ask price of an asset at the provided timestamp.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the ask price for.
+        asset : `str`
+            The asset symbol to obtain the ask price for.
+
+        Returns
+        -------
+        `float`
+            The ask price.
+        """
+        return self._get_price(self.asks, dt, asset)
+
+    def _columns(self, assets):
+        """
+        Obtain the array columns of the provided assets.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbols to obtain columns for.
+
+        Returns
+        -------
+        `tuple(np.ndarray, np.ndarray)`
+            The column indices (zero for unknown assets) and the
+            boolean mask of assets present within the store.
+        """
+        cols = np.array(
+            [self.asset_index.get(asset, -1) for asset in assets],
+            dtype=np.int64
+        )
+        known = cols >= 0
+        return (np.where(known, cols, 0), known)
+
+    def _get_prices(self, prices, dt, assets):
+        """
+        Obtain the prices of many assets from the provided price
+        array via a single vectorised gather.
+
+        Parameters
+        ----------
+        prices : `np.ndarray`
+            The bid or ask price array.
+        dt : `pd.Timestamp`
+            When to obtain the prices for.
+        assets : `list[str]`
+            The asset symbols to obtain the prices for.
+
+        Returns
+        -------
+        `np.ndarray`
+            The prices, NaN for unknown assets or those prior to
+            their first available price.
+        """
+        cols, known = self._columns(assets)
+        row = self._row(dt)
+        if row < 0:
+            return np.full(len(cols), np.nan)
+        return np.where(known, prices[row, cols], np.nan)
+
+    def get_bids(self, dt, assets):
+        """
+        Obtain the bid prices of many assets at the provided timestamp.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the bid prices for.
+        assets : `list[str]`
+            The asset symbols to obtain the bid prices for.
+
+        Returns
+        -------
+        `np.ndarray`
+            The bid prices, ordered as the provided assets.
+        """
+        return self._get_prices(self.bids, dt, assets)
+
+    def get_asks(self, dt, assets):
+        """
+        Obtain the ask prices of many assets at the provided timestamp.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the ask prices for.
+        assets : `list[str]`
+            The asset symbols to obtain the ask prices for.
+
+        Returns
+        -------
+        `np.ndarray`
+            The ask prices, ordered as the provided assets.
+        """
+        return self._get_prices(self.asks, dt, assets)
+
+    def _get_prices_at(self, prices, dts, assets):
+        """
+        Obtain the prices of many assets at many timestamps from the
+        provided price array via a single vectorised gather.
+
+        Parameters
+        ----------
+        prices : `np.ndarray`
+            The bid or ask price array.
+        dts : `pd.DatetimeIndex`
+            When to obtain the prices for.
+        assets : `list[str]`
+            The asset symbols to obtain the prices for.
+
+        Returns
+        -------
+        `np.ndarray`
+            The (timestamps x assets) prices, NaN for unknown assets or
+            those prior to their first available price.
+        """
+        cols, known = self._columns(assets)
+        rows = np.searchsorted(
+            self.timestamps, dts.as_unit('ns').asi8, side='right'
+        ) - 1
+        values = prices[np.maximum(rows, 0)[:, None], cols[None, :]]
+        return np.where((rows >= 0)[:, None] & known[None, :], values, np.nan)
+
+    def get_bids_at(self, dts, assets):
+        """
+        Obtain the bid prices of many assets at many timestamps.
+
+        Parameters
+        ----------
+        dts : `pd.DatetimeIndex`
+            When to obtain the bid prices for.
+        assets : `list[str]`
+            The asset symbols to obtain the bid prices for.
+
+        Returns
+        -------
+        `np.ndarray`
+            The (timestamps x assets) bid prices.
+        """
+        return self._get_prices_at(self.bids, dts, assets)
+
+    def get_asks_at(self, dts, assets):
+        """
+        Obtain the ask prices of many assets at many timestamps.
+
+        Parameters
+        ----------
+        dts : `pd.DatetimeIndex`
+            When to obtain the ask prices for.
+        assets : `list[str]`
+            The asset symbols to obtain the ask prices for.
+
+        Returns
+        -------
+        `np.ndarray`
+            The (timestamps x assets) ask prices.
+        """
+        return self._get_prices_at(self.asks, dts, assets)
@@ -0,0 +1,354 @@
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from qstrader.data.daily_bar_csv import LazyAssetFrames
+from qstrader.data.price_store import ArrayPriceStore
+
+
+PANEL_FORMAT_VERSION = 1
+
+
+class SharedPanelDataSource(object):
+    """
+    A data source backed by a price panel stored on disk as
+    uncompressed NumPy arrays, which are memory-mapped read-only.
+
+    Any number of processes attaching to the same panel directory
+    share a single copy of the prices via the operating system page
+    cache, rather than each holding their own DataFrames.
+
+    The panel is built once from an existing data source via
+    build_panel. Price lookups follow the forward-filled semantics of
+    the ArrayPriceStore.
+
+    Parameters
+    ----------
+    panel_dir : `str`
+        The directory containing a panel written by build_panel.
+    """
+
+    def __init__(self, panel_dir):
+        self.panel_dir = panel_dir
+        with open(os.path.join(panel_dir, 'panel.json'), 'r') as meta_file:
+            self.meta = json.load(meta_file)
+        if self.meta['version'] != PANEL_FORMAT_VERSION:
+            raise ValueError(
+                "Price panel at '%s' has format version %s, expected %s." % (
+                    panel_dir, self.meta['version'], PANEL_FORMAT_VERSION
+                )
+            )
+
+        self.price_store = ArrayPriceStore.load(panel_dir, mmap_mode='r')
+        self.assets = self.price_store.assets
+        self.asset_index = self.price_store.asset_index
+        self.bar_dates = pd.DatetimeIndex(
+            pd.to_datetime(
+                np.load(os.path.join(panel_dir, 'bar_dates.npy')), unit='ns', utc=True
+            )
+        ).tz_convert(self.meta['tz']).as_unit(self.meta['unit'])
+        self.bar_dates.name = self.meta['name']
+        self.closes = np.load(os.path.join(panel_dir, 'closes.npy'), mmap_mode='r')
+        self.dividends = np.load(os.path.join(panel_dir, 'dividends.npy'), mmap_mode='r')
+        self.dividend_row_index = {
+            ts: row for row, ts in enumerate(
+                (self.bar_dates + pd.Timedelta(hours=16)).asi8.tolist()
+            )
+        }
+
+        # Individual asset DataFrames are only created when required
+        # by a consumer (such as the BacktestDataHandler statistics)
+        self.lazy = True
+        self.asset_bar_frames = LazyAssetFrames(self.asset_index, self.prefetch)
+
+    @staticmethod
+    def build_panel(panel_dir, data_source):
+        """
+        Build a price panel from the asset bar and bid/ask DataFrames
+        of an existing (eagerly-loaded) data source.
+
+        The panel is written into a temporary directory and then
+        renamed, such that processes never attach to a partial panel.
+
+        Parameters
+        ----------
+        panel_dir : `str`
+            The directory in which to write the panel. Must not exist.
+        data_source : `CSVDailyBarDataSource`
+            The data source containing the prices.
+
+        Returns
+        -------
+        `str`
+            The panel directory.
+        """
+        if os.path.exists(panel_dir):
+            raise ValueError(
+                "Unable to build price panel as '%s' already exists." % panel_dir
+            )
+        bar_frames = data_source.asset_bar_frames
+        assets = list(data_source.asset_bid_ask_frames.keys())
+        price_store = ArrayPriceStore.from_bid_ask_frames(
+            {asset: data_source.asset_bid_ask_frames[asset] for asset in assets}
+        )
+
+        if len(assets) > 0:
+            bar_dates = bar_frames[assets[0]].index
+            for asset in assets[1:]:
+                bar_dates = bar_dates.union(bar_frames[asset].index)
+        else:
+            bar_dates = pd.DatetimeIndex([], tz='America/New_York', name='Date')
+        closes = np.full((len(bar_dates), len(assets)), np.nan)
+        dividends = np.full((len(bar_dates), len(assets)), np.nan)
+        for col, asset in enumerate(assets):
+            aligned_df = bar_frames[asset].reindex(bar_dates)
+            closes[:, col] = aligned_df['Close'].to_numpy(dtype=np.float64)
+            if 'Dividends' in aligned_df.columns:
+                dividends[:, col] = aligned_df['Dividends'].to_numpy(dtype=np.float64)
+
+        meta = {
+            'version': PANEL_FORMAT_VERSION,
+            'tz': str(bar_dates.tz),
+            'unit': bar_dates.unit,
+            'name': bar_dates.name
+        }
+
+        parent_dir = os.path.dirname(os.path.abspath(panel_dir))
+        tmp_dir = tempfile.mkdtemp(dir=parent_dir, suffix='.tmp')
+        try:
+            price_store.save(tmp_dir)
+            np.save(os.path.join(tmp_dir, 'bar_dates.npy'), bar_dates.as_unit('ns').asi8)
+            np.save(os.path.join(tmp_dir, 'closes.npy'), closes)
+            np.save(os.path.join(tmp_dir, 'dividends.npy'), dividends)
+            with open(os.path.join(tmp_dir, 'panel.json'), 'w') as meta_file:
+                json.dump(meta, meta_file)
+            os.rename(tmp_dir, panel_dir)
+        except BaseException:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+        return panel_dir
+
+    def prefetch(self, assets):
+        """
+        Create the daily 'bar' DataFrames, restricted to the closing
+        prices and dividends, for the provided assets.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbols to create DataFrames for. Symbols not
+            present within the panel are ignored.
+        """
+        for asset in assets:
+            if asset not in self.asset_index or asset in self.asset_bar_frames.frames:
+                continue
+            col = self.asset_index[asset]
+            available = ~np.isnan(self.closes[:, col])
+            self.asset_bar_frames.frames[asset] = pd.DataFrame(
+                {
+                    'Close': self.closes[available, col],
+                    'Dividends': self.dividends[available, col]
+                },
+                index=self.bar_dates[available]
+            )
+
+    def get_bid(self, dt, asset):
+        """
+        Obtain the bid price of an asset at the provided timestamp.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the bid price for.
+        asset : `str`
+            The asset symbol to obtain the bid price for.
+
+        Returns
+        -------
+        `float`
+            The bid price.
+        """
+        return self.price_store.get_bid(dt, asset)
+
+    def get_ask(self, dt, asset):
+        """
+        Obtain the ask price of an asset at the provided timestamp.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the ask price for.
+        asset : `str`
+            The asset symbol to obtain the ask price for.
+
+        Returns
+        -------
+        `float`
+            The ask price.
+        """
+        return self.price_store.get_ask(dt, asset)
+
+    def get_bids(self, dt, assets):
+        """
+        Obtain the bid prices of many assets at the provided timestamp.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the bid prices for.
+        assets : `list[str]`
+            The asset symbols to obtain the bid prices for.
+
+        Returns
+        -------
+        `np.ndarray`
+            The bid prices, NaN for assets not present in the panel.
+        """
+        return self.price_store.get_bids(dt, assets)
+
+    def get_asks(self, dt, assets):
+        """
+        Obtain the ask prices of many assets at the provided timestamp.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the ask prices for.
+        assets : `list[str]`
+            The asset symbols to obtain the ask prices for.
+
+        Returns
+        -------
+        `np.ndarray`
+            The ask prices, NaN for assets not present in the panel.
+        """
+        return self.price_store.get_asks(dt, assets)
+
+    def get_bids_at(self, dts, assets):
+        """
+        Obtain the bid prices of many assets at many timestamps.
+
+        Parameters
+        ----------
+        dts : `pd.DatetimeIndex`
+            When to obtain the bid prices for.
+        assets : `list[str]`
+            The asset symbols to obtain the bid prices for.
+
+        Returns
+        -------
+        `np.ndarray`
+            The (timestamps x assets) bid prices, NaN for assets not
+            present in the panel.
+        """
+        return self.price_store.get_bids_at(dts, assets)
+
+    def get_asks_at(self, dts, assets):
+        """
+        Obtain the ask prices of many assets at many timestamps.
+
+        Parameters
+        ----------
+        dts : `pd.DatetimeIndex`
+            When to obtain the ask prices for.
+        assets : `list[str]`
+            The asset symbols to obtain the ask prices for.
+
+        Returns
+        -------
+        `np.ndarray`
+            The (timestamps x assets) ask prices, NaN for assets not
+            present in the panel.
+        """
+        return self.price_store.get_asks_at(dts, assets)
+
+    def get_dividend(self, dt, asset):
+        """
+        Obtain the dividend of an asset paid at the provided market
+        close timestamp.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The market close timestamp.
+        asset : `str`
+            The asset symbol to obtain the dividend for.
+
+        Returns
+        -------
+        `float`
+            The dividend, zero if none is paid.
+        """
+        col = self.asset_index.get(asset)
+        row = self.dividend_row_index.get(dt.value)
+        if col is None or row is None:
+            return 0.0
+        dividend = self.dividends[row, col]
+        return float(dividend) if not np.isnan(dividend) else 0.0
+
+    def get_dividends_at(self, dts, assets):
+        """
+        Obtain the dividends of many assets at many market close
+        timestamps.
+
+        Parameters
+        ----------
+        dts : `pd.DatetimeIndex`
+            The market close timestamps.
+        assets : `list[str]`
+            The asset symbols to obtain the dividends for.
+
+        Returns
+        -------
+        `np.ndarray`
+            The (timestamps x assets) dividends, zero where none
+            is paid.
+        """
+        rows = np.array([
+            self.dividend_row_index.get(dt_value, -1)
+            for dt_value in pd.DatetimeIndex(dts).as_unit('ns').asi8.tolist()
+        ], dtype=np.int64)
+        cols = np.array(
+            [self.asset_index.get(asset, -1) for asset in assets], dtype=np.int64
+        )
+        dividends = np.zeros((len(rows), len(cols)))
+        found = (rows[:, None] >= 0) & (cols[None, :] >= 0)
+        dividends[found] = self.dividends[
+            np.broadcast_to(rows[:, None], found.shape)[found],
+            np.broadcast_to(cols[None, :], found.shape)[found]
+        ]
+        return np.where(np.isnan(dividends), 0.0, dividends)
+
+    def get_assets_historical_closes(self, start_dt, end_dt, assets):
+        """
+        Obtain a multi-asset historical range of closing prices as a DataFrame,
+        indexed by timestamp with asset symbols as columns.
+
+        Parameters
+        ----------
+        start_dt : `pd.Timestamp`
+            The starting datetime of the range to obtain.
+        end_dt : `pd.Timestamp`
+            The ending datetime of the range to obtain.
+        assets : `list[str]`
+            The list of asset symbols to obtain closing prices for.
+
+        Returns
+        -------
+        `pd.DataFrame`
+            The multi-asset closing prices DataFrame.
+        """
+        assets = [asset for asset in assets if asset in self.asset_index]
+        cols = [self.asset_index[asset] for asset in assets]
+        start_row = self.bar_dates.searchsorted(start_dt, side='left')
+        end_row = self.bar_dates.searchsorted(end_dt, side='right')
+        prices_df = pd.DataFrame(
+            np.array(self.closes[start_row:end_row][:, cols]),
+            index=self.bar_dates[start_row:end_row],
+            columns=assets
+        )
+        return prices_df.dropna(how='all')
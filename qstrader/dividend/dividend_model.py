@@ -134,7 +134,7 @@ class DividendModel(object):
 
         # After iterating through all assets, append the aggregated info to stats
         if stats is not None:
-            stats['dividends'].append(daily_dividends)
+            stats.record_dividends(daily_dividends)
 
         # Execute reinvestment orders using the ExecutionHandler
         if all_reinvest_orders:
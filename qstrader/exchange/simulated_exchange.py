@@ -1,5 +1,8 @@
 import datetime
 
+import numpy as np
+import pandas as pd
+
 from qstrader.exchange.exchange import Exchange
 
 
@@ -50,3 +53,26 @@ class SimulatedExchange(Exchange):
         if dt.weekday() > 4:
             return False
         return self.open_dt <= dt.time() and dt.time() < self.close_dt
+
+    def is_open_at_datetimes(self, dts):
+        """
+        Check if the SimulatedExchange is open at each of many
+        provided timestamps, as per is_open_at_datetime.
+
+        Parameters
+        ----------
+        dts : `pd.DatetimeIndex`
+            The timestamps to check for open market hours.
+
+        Returns
+        -------
+        `np.ndarray`
+            Whether the exchange is open at each timestamp.
+        """
+        local_dts = dts if dts.tz is None else dts.tz_localize(None)
+        times = local_dts - local_dts.normalize()
+        open_time = pd.Timedelta(self.open_dt.isoformat())
+        close_time = pd.Timedelta(self.close_dt.isoformat())
+        return np.asarray(
+            (local_dts.weekday <= 4) & (times >= open_time) & (times < close_time)
+        )
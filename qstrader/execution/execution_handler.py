@@ -78,9 +78,14 @@ class ExecutionHandler(object):
             dt, rebalance_orders
         )
 
-        # If order submission is specified then send the
-        # individual order items to the Broker instance
-        if self.submit_orders:
-            for order in final_orders:
-                self.broker.submit_order(self.broker_portfolio_id, order)
-                self.broker.update(dt)
+        # If order submission is specified then send the orders
+        # to the Broker instance, as a single batch where supported
+        if self.submit_orders and len(final_orders) > 0:
+            if hasattr(self.broker, 'submit_orders'):
+                self.broker.submit_orders(
+                    self.broker_portfolio_id, final_orders, dt
+                )
+            else:
+                for order in final_orders:
+                    self.broker.submit_order(self.broker_portfolio_id, order)
+                    self.broker.update(dt)
@@ -1,7 +1,14 @@
+import itertools
 import uuid
 
 import numpy as np
 
+from qstrader import settings
+
+
+# The process-wide counter used for sequential order IDs
+_ORDER_ID_SEQUENCE = itertools.count(1)
+
 
 class Order(object):
     """
@@ -10,7 +17,7 @@ class Order(object):
 
     A commission can be added here to override the commission
     model, if known. An order_id can be added if required,
-    otherwise it will be randomly assigned.
+    otherwise it will be assigned as per settings.ORDER_IDS.
 
     Parameters
     ----------
@@ -27,6 +34,11 @@ class Order(object):
         The order ID of the order, if known.
     """
 
+    __slots__ = (
+        'created_dt', 'cur_dt', 'asset', 'quantity',
+        'commission', 'direction', 'order_id'
+    )
+
     def __init__(
         self,
         dt,
@@ -93,7 +105,9 @@ class Order(object):
 
     def _set_or_generate_order_id(self, order_id=None):
         """
-        Sets or generates a unique order ID for the order, using a UUID.
+        Sets or generates a unique order ID for the order, using either
+        a UUID or the next integer of a process-wide sequence, as per
+        settings.ORDER_IDS.
 
         Parameters
         ----------
@@ -106,6 +120,8 @@ class Order(object):
             The order ID string for the Order.
         """
         if order_id is None:
+            if settings.ORDER_IDS == 'sequential':
+                return str(next(_ORDER_ID_SEQUENCE))
             return uuid.uuid4().hex
         else:
             return order_id
@@ -1,5 +1,6 @@
 import numpy as np
 
+from qstrader.data.latest_prices import get_assets_latest_prices
 from qstrader.portcon.order_sizer.order_sizer import OrderSizer
 
 
@@ -144,8 +145,14 @@ class DollarWeightedCashBufferedOrderSizer(OrderSizer):
         # Ensure weight vector sums to unity
         normalised_weights = self._normalise_weights(weights)
 
+        # Obtain the latest ask prices of all assets in a single pass
+        sorted_weights = sorted(normalised_weights.items())
+        asset_prices = get_assets_latest_prices(
+            self.data_handler, dt, [asset for asset, weight in sorted_weights], 'ask'
+        )
+
         target_portfolio = {}
-        for asset, weight in sorted(normalised_weights.items()):
+        for (asset, weight), asset_price in zip(sorted_weights, asset_prices):
             pre_cost_dollar_weight = cash_buffered_total_equity * weight
 
             # Estimate broker fees for this asset
@@ -156,9 +163,6 @@ class DollarWeightedCashBufferedOrderSizer(OrderSizer):
 
             # Calculate integral target asset quantity assuming broker costs
             after_cost_dollar_weight = pre_cost_dollar_weight - est_costs
-            asset_price = self.data_handler.get_asset_latest_ask_price(
-                dt, asset
-            )
 
             if np.isnan(asset_price):
                 raise ValueError(
@@ -1,8 +1,7 @@
 from qstrader import settings
+from qstrader.data.latest_prices import get_assets_latest_prices
 from qstrader.execution.order import Order
 
-import copy
-
 
 class PortfolioConstructionModel(object):
     """
@@ -250,8 +249,8 @@ class PortfolioConstructionModel(object):
         dt : `pd.Timestamp`
             The date-time used to for Asset list determination and
             weight generation.
-        stats : `dict`, optional
-            An optional statistics dictionary to append values to
+        stats : `StatsRecorder`, optional
+            An optional statistics recorder to record values to
             throughout the simulation lifetime.
 
         Returns
@@ -259,6 +258,8 @@ class PortfolioConstructionModel(object):
         `list[Order]`
             The list of rebalancing orders to be sent to Execution.
         """
+        event_type = event.event_type if event else None
+
         # If an AlphaModel is provided use its suggestions, otherwise
         # create a null weight vector (zero for all Assets).
         if self.alpha_model:
@@ -267,9 +268,7 @@ class PortfolioConstructionModel(object):
             weights = self._create_zero_target_weights_vector(dt)
 
         if stats is not None:
-            stats['alpha_weights'].append(
-                {'date': dt, 'event': event.event_type if event else None, 'weights': copy.deepcopy(weights)}
-            )
+            stats.record_weights('alpha_weights', dt, event_type, weights)
 
         # If a risk model is present use it to potentially
         # override the alpha model weights
@@ -277,17 +276,13 @@ class PortfolioConstructionModel(object):
             weights = self.risk_model(dt, weights)
 
         if stats is not None:
-            stats['risk_weights'].append(
-               {'date': dt, 'event': event.event_type if event else None, 'weights': copy.deepcopy(weights)}
-            )
+            stats.record_weights('risk_weights', dt, event_type, weights)
 
         # Run the portfolio optimisation
         optimised_weights = self.optimiser(dt, initial_weights=weights)
 
         if stats is not None:
-            stats['optimised_weights'].append(
-                {'date': dt, 'event': event.event_type if event else None, 'weights': copy.deepcopy(weights)}
-            )
+            stats.record_weights('optimised_weights', dt, event_type, weights)
 
         # Ensure any Assets in the Broker Portfolio are sold out if
         # they are not specifically referenced on the optimised weights
@@ -313,17 +308,21 @@ class PortfolioConstructionModel(object):
 
         if stats is not None:
             target_portfolio_with_prices = {}
-            for asset, details in target_portfolio.items():
-                # Get the sizing price *here*, before it's potentially
-                # modified by the broker.
-                sizing_price = self.data_handler.get_asset_latest_ask_price(dt, asset)
+            # Get the sizing prices *here*, before they're potentially
+            # modified by the broker.
+            sizing_prices = get_assets_latest_prices(
+                self.data_handler, dt, list(target_portfolio.keys()), 'ask'
+            )
+            for (asset, details), sizing_price in zip(
+                target_portfolio.items(), sizing_prices
+            ):
                 target_portfolio_with_prices[asset] = {
                     'quantity': details['quantity'],
                     'sizing_price': sizing_price
                 }
 
-        stats['target_portfolio'].append(
-                {'date': dt, 'event': event.event_type if event else None, 'portfolio': copy.deepcopy(target_portfolio_with_prices)}
+            stats.record_portfolio(
+                'target_portfolio', dt, event_type, target_portfolio_with_prices
             )
 
         self.recent_target_portfolio = target_portfolio  # Store portfolio
@@ -333,8 +332,8 @@ class PortfolioConstructionModel(object):
         current_portfolio = self._obtain_current_portfolio()
 
         if stats is not None:
-            stats['current_portfolio'].append(
-                {'date': dt, 'event': event.event_type if event else None, 'portfolio': copy.deepcopy(current_portfolio)}
+            stats.record_portfolio(
+                'current_portfolio', dt, event_type, current_portfolio
             )
 
         # Create rebalance trade Orders
@@ -343,14 +342,7 @@ class PortfolioConstructionModel(object):
         )
 
         if stats is not None:
-            # Convert Order objects to dictionaries.  NEW BLOCK.
-            order_dicts = [
-                {'asset': order.asset, 'quantity': order.quantity, 'order_id': order.order_id}
-                for order in rebalance_orders
-            ]
-            stats['rebalance_orders'].append(
-                {'date': dt, 'event': event.event_type if event else None, 'orders': order_dicts}
-            )
+            stats.record_rebalance_orders(dt, event_type, rebalance_orders)
         # TODO: Implement cost model
 
         return rebalance_orders
@@ -13,7 +13,22 @@ LOGGING = {
 
 PRINT_EVENTS = True
 
+# How Order IDs are generated when not provided, either as random
+# 'uuid' hex strings or as 'sequential' integer strings, the latter
+# being considerably cheaper to generate but only unique per process
+ORDER_IDS = 'uuid'
+
 
 def set_print_events(print_events=True):
     global PRINT_EVENTS
     PRINT_EVENTS = print_events
+
+
+def set_order_ids(order_ids='uuid'):
+    global ORDER_IDS
+    if order_ids not in ('uuid', 'sequential'):
+        raise ValueError(
+            "Unknown order ID generation '%s'. Must be one of "
+            "'uuid' or 'sequential'." % order_ids
+        )
+    ORDER_IDS = order_ids
@@ -1,11 +1,21 @@
-from collections import deque
+import numpy as np
 
 
 class AssetPriceBuffers(object):
     """
-    Utility class to store double-ended queue ("deque")
-    based price buffers for usage in lookback-based
-    indicator calculations.
+    Utility class to store price buffers for usage in
+    lookback-based indicator calculations.
+
+    The prices of all assets are stored within a single
+    two-dimensional NumPy ring buffer, with one row per asset and
+    a capacity of the maximum lookback. Each price is written twice,
+    at its ring position and at that position offset by the capacity,
+    such that the most recent prices for any lookback always form a
+    contiguous slice of the row and can be returned as a view.
+
+    The rows of the initial assets are allocated at once, while the
+    rows of subsequently added assets are allocated by doubling the
+    number of rows, such that adding assets is amortised O(1).
 
     Parameters
     ----------
@@ -18,59 +28,61 @@ class AssetPriceBuffers(object):
     def __init__(self, assets, lookbacks=[12]):
         self.assets = assets
         self.lookbacks = lookbacks
-        self.prices = self._create_all_assets_prices_buffer_dict()
-
-    @staticmethod
-    def _asset_lookback_key(asset, lookback):
-        """
-        Create the buffer dictionary lookup key based
-        on asset name and lookback period.
-
-        Parameters
-        ----------
-        asset : `str`
-            The asset symbol name.
-        lookback : `int`
-            The lookback period.
-
-        Returns
-        -------
-        `str`
-            The lookup key.
-        """
-        return '%s_%s' % (asset, lookback)
+        self.capacity = max(lookbacks)
+        self.asset_index = {}
+        self.row_assets = []
+        self.values = np.full((len(self.assets), 2 * self.capacity), np.nan)
+        self.counts = np.zeros(len(self.assets), dtype=np.int64)
+        for asset in self.assets:
+            if asset not in self.asset_index:
+                self.asset_index[asset] = len(self.row_assets)
+                self.row_assets.append(asset)
 
-    def _create_single_asset_prices_buffer_dict(self, asset):
+    @property
+    def prices(self):
         """
-        Creates a dictionary of asset-lookback pair
-        price buffers for a single asset.
+        The most recent prices of each asset-lookback pair, keyed
+        as '<asset>_<lookback>', retained for compatibility with the
+        prior dictionary of price buffers. Each value is a view onto
+        the ring buffer, as per get_prices.
 
         Returns
         -------
-        `dict{str: deque[float]}`
+        `dict{str: np.ndarray}`
             The price buffer dictionary.
         """
         return {
-            AssetPriceBuffers._asset_lookback_key(
-                asset, lookback
-            ): deque(maxlen=lookback)
+            '%s_%s' % (asset, lookback): self.get_prices(asset, lookback)
+            for asset in self.row_assets
             for lookback in self.lookbacks
         }
 
-    def _create_all_assets_prices_buffer_dict(self):
+    def _add_row(self, asset):
         """
-        Creates a dictionary of asset-lookback pair
-        price buffers for all assets.
+        Add a ring buffer row for an asset.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol name.
 
         Returns
         -------
-        `dict{str: deque[float]}`
-            The price buffer dictionary.
+        `int`
+            The row of the asset.
         """
-        prices = {}
-        for asset in self.assets:
-            prices.update(self._create_single_asset_prices_buffer_dict(asset))
-        return prices
+        row = len(self.row_assets)
+        if row == len(self.values):
+            num_rows = max(1, 2 * row)
+            values = np.full((num_rows, 2 * self.capacity), np.nan)
+            values[:row] = self.values[:row]
+            counts = np.zeros(num_rows, dtype=np.int64)
+            counts[:row] = self.counts[:row]
+            self.values = values
+            self.counts = counts
+        self.asset_index[asset] = row
+        self.row_assets.append(asset)
+        return row
 
     def add_asset(self, asset):
         """
@@ -88,12 +100,63 @@ class AssetPriceBuffers(object):
                 'Unable to add asset "%s" since it already '
                 'exists in this price buffer.' % asset
             )
-        else:
-            self.prices.update(self._create_single_asset_prices_buffer_dict(asset))
+        elif asset not in self.asset_index:
+            self._add_row(asset)
+
+    def rows(self, assets):
+        """
+        Obtain the ring buffer rows of the provided assets, creating
+        rows for any assets added to the universe subsequent to the
+        beginning of the backtest.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbol names.
+
+        Returns
+        -------
+        `np.ndarray`
+            The rows of the assets.
+        """
+        return np.array(
+            [
+                self.asset_index[asset] if asset in self.asset_index
+                else self._add_row(asset)
+                for asset in assets
+            ],
+            dtype=np.int64
+        )
+
+    def append_rows(self, rows, prices):
+        """
+        Append a new price onto the ring buffer of each of the
+        provided rows.
+
+        Parameters
+        ----------
+        rows : `np.ndarray`
+            The rows of the assets.
+        prices : `np.ndarray`
+            The new prices of the assets, ordered as the rows.
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        invalid = np.flatnonzero(prices <= 0.0)
+        if len(invalid) > 0:
+            raise ValueError(
+                'Unable to append non-positive price of "%0.2f" '
+                'to metrics buffer for Asset "%s".' % (
+                    prices[invalid[0]], self.row_assets[rows[invalid[0]]]
+                )
+            )
+        positions = self.counts[rows] % self.capacity
+        self.values[rows, positions] = prices
+        self.values[rows, positions + self.capacity] = prices
+        self.counts[rows] += 1
 
     def append(self, asset, price):
         """
-        Append a new price onto the price deque for
+        Append a new price onto the price buffer for
         the specific asset provided.
 
         Parameters
@@ -103,22 +166,105 @@ class AssetPriceBuffers(object):
         price : `float`
             The new price of the asset.
         """
-        if price <= 0.0:
+        self.append_many([price], assets=[asset])
+
+    def append_many(self, prices, assets=None):
+        """
+        Append a new price onto the price buffer of each of
+        many assets at once.
+
+        Parameters
+        ----------
+        prices : `np.ndarray`
+            The new prices of the assets.
+        assets : `list[str]`, optional
+            The asset symbol names, ordered as the prices. Defaults
+            to the list of current assets.
+        """
+        if assets is None:
+            assets = self.assets
+        self.append_rows(self.rows(assets), prices)
+
+    def price_indices(self, counts, offsets):
+        """
+        Obtain the ring buffer column of the prices a number of
+        periods prior to the latest appended price.
+
+        Parameters
+        ----------
+        counts : `np.ndarray` or `int`
+            The number of prices appended to each row.
+        offsets : `np.ndarray` or `int`
+            The number of periods prior to the latest price, which
+            must be less than the capacity.
+
+        Returns
+        -------
+        `np.ndarray` or `int`
+            The ring buffer columns.
+        """
+        return (counts - 1 - offsets) % self.capacity
+
+    def get_prices(self, asset, lookback):
+        """
+        Obtain the most recent prices of an asset for a lookback
+        period, as a view onto the ring buffer.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol name.
+        lookback : `int`
+            The lookback period, no greater than the maximum lookback.
+
+        Returns
+        -------
+        `np.ndarray`
+            The (up to) lookback most recent prices, oldest first.
+        """
+        if lookback > self.capacity:
             raise ValueError(
-                'Unable to append non-positive price of "%0.2f" '
-                'to metrics buffer for Asset "%s".' % (price, asset)
+                'Unable to obtain prices for lookback "%s" since it exceeds '
+                'the maximum lookback "%s" of the price buffer.' % (
+                    lookback, self.capacity
+                )
             )
+        row = self.asset_index[asset]
+        count = self.counts[row]
+        num_prices = min(count, lookback)
+        end = (count - 1) % self.capacity + self.capacity + 1
+        return self.values[row, end - num_prices:end]
+
+    def get_windows(self, rows, lookback):
+        """
+        Obtain the most recent prices of many assets for a lookback
+        period, as a two-dimensional array.
+
+        Parameters
+        ----------
+        rows : `np.ndarray`
+            The rows of the assets.
+        lookback : `int`
+            The lookback period, no greater than the maximum lookback.
 
-        # The asset may have been added to the universe subsequent
-        # to the beginning of the backtest and as such needs a
-        # newly created pricing buffer
-        asset_lookback_key = AssetPriceBuffers._asset_lookback_key(asset, self.lookbacks[0])
-        if asset_lookback_key not in self.prices:
-            self.prices.update(self._create_single_asset_prices_buffer_dict(asset))
-
-        for lookback in self.lookbacks:
-            self.prices[
-                AssetPriceBuffers._asset_lookback_key(
-                    asset, lookback
+        Returns
+        -------
+        `tuple(np.ndarray, np.ndarray)`
+            The (rows x lookback) prices, oldest first and left-padded
+            with NaN where fewer prices are available, along with the
+            number of available prices of each row.
+        """
+        if lookback > self.capacity:
+            raise ValueError(
+                'Unable to obtain prices for lookback "%s" since it exceeds '
+                'the maximum lookback "%s" of the price buffer.' % (
+                    lookback, self.capacity
                 )
-            ].append(price)
+            )
+        counts = self.counts[rows]
+        ends = (counts - 1) % self.capacity + self.capacity + 1
+        columns = np.arange(lookback)
+        windows = self.values[rows[:, None], ends[:, None] - lookback + columns]
+        num_prices = np.minimum(counts, lookback)
+        windows[columns[None, :] < (lookback - num_prices)[:, None]] = np.nan
+        return windows, num_prices
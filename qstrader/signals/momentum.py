@@ -1,5 +1,4 @@
 import numpy as np
-import pandas as pd
 
 from qstrader.signals.signal import Signal
 
@@ -12,7 +11,9 @@ class MomentumSignal(Signal):
 
     If the number of available returns is less than the
     lookback parameter the momentum is calculated on
-    this subset.
+    this subset. Missing (NaN) prices are skipped, such that
+    the momentum is calculated between the first and last
+    available prices of the lookback window.
 
     Parameters
     ----------
@@ -28,11 +29,11 @@ class MomentumSignal(Signal):
         bumped_lookbacks = [lookback + 1 for lookback in lookbacks]
         super().__init__(start_dt, universe, bumped_lookbacks)
 
-    @staticmethod
-    def _asset_lookback_key(asset, lookback):
+    def _cumulative_return(self, asset, lookback):
         """
-        Create the buffer dictionary lookup key based
-        on asset name and lookback period.
+        Calculate the cumulative returns for the provided
+        lookback period ('momentum') based on the price
+        buffers for a particular asset.
 
         Parameters
         ----------
@@ -43,38 +44,63 @@ class MomentumSignal(Signal):
 
         Returns
         -------
-        `str`
-            The lookup key.
+        `float`
+            The cumulative return ('momentum') for the period.
         """
-        return '%s_%s' % (asset, lookback + 1)
+        # The cumulative product of the one-period gross returns
+        # telescopes to the ratio of the buffer end-point prices
+        prices = self.buffers.get_prices(asset, lookback + 1)
+        if len(prices) > 0 and (np.isnan(prices[0]) or np.isnan(prices[-1])):
+            prices = prices[~np.isnan(prices)]
+        if len(prices) < 2:
+            return 0.0
+        else:
+            return prices[-1] / prices[0] - 1.0
 
-    def _cumulative_return(self, asset, lookback):
+    def cross_section(self, lookback, assets=None):
         """
-        Calculate the cumulative returns for the provided
-        lookback period ('momentum') based on the price
-        buffers for a particular asset.
+        Calculate the lookback-period momentum for many
+        assets at once.
 
         Parameters
         ----------
-        asset : `str`
-            The asset symbol name.
         lookback : `int`
             The lookback period.
+        assets : `list[str]`, optional
+            The asset symbol names. Defaults to the current
+            assets of the signal.
 
         Returns
         -------
-        `float`
-            The cumulative return ('momentum') for the period.
+        `np.ndarray`
+            The momentum for the period, ordered as the assets.
         """
-        series = pd.Series(
-            self.buffers.prices[MomentumSignal._asset_lookback_key(asset, lookback)]
-        )
-        returns = series.pct_change().dropna().to_numpy()
-
-        if len(returns) < 1:
-            return 0.0
-        else:
-            return (np.cumprod(1.0 + np.array(returns)) - 1.0)[-1]
+        rows = self.buffers.rows(self.assets if assets is None else assets)
+        counts = self.buffers.counts[rows]
+        num_prices = np.minimum(counts, lookback + 1)
+        momenta = np.zeros(len(rows))
+        full = num_prices >= 2
+        last_prices = self.buffers.values[
+            rows[full], self.buffers.price_indices(counts[full], 0)
+        ]
+        first_prices = self.buffers.values[
+            rows[full], self.buffers.price_indices(counts[full], num_prices[full] - 1)
+        ]
+
+        # Windows with a missing end-point price fall back to
+        # the first and last available prices of the window
+        missing = np.isnan(first_prices) | np.isnan(last_prices)
+        if missing.any():
+            windows, _ = self.buffers.get_windows(rows[full][missing], lookback + 1)
+            available = ~np.isnan(windows)
+            window_rows = np.arange(len(windows))
+            first_prices[missing] = windows[window_rows, np.argmax(available, axis=1)]
+            last_prices[missing] = windows[
+                window_rows, lookback - np.argmax(available[:, ::-1], axis=1)
+            ]
+
+        momenta[full] = np.nan_to_num(last_prices / first_prices - 1.0)
+        return momenta
 
     def __call__(self, asset, lookback):
         """
@@ -1,12 +1,14 @@
 from abc import ABCMeta, abstractmethod
 
+import numpy as np
+
 from qstrader.signals.buffer import AssetPriceBuffers
 
 
 class Signal(object):
     """
     Abstract class to provide historical price range-based
-    rolling signals utilising deque-based 'buffers'.
+    rolling signals utilising ring buffer-based 'buffers'.
 
     Parameters
     ----------
@@ -40,6 +42,32 @@ class Signal(object):
             self.assets, lookbacks=self.lookbacks
         )
 
+    def _pad_rows(self, aggregate):
+        """
+        Pad a per-asset aggregate array with zeroed rows for any
+        assets added to the price buffers since its creation.
+
+        Parameters
+        ----------
+        aggregate : `np.ndarray`
+            The (assets x lookbacks) aggregate array.
+
+        Returns
+        -------
+        `np.ndarray`
+            The aggregate array with a row for each buffered asset.
+        """
+        num_rows = len(self.buffers.row_assets)
+        if aggregate.shape[0] < num_rows:
+            aggregate = np.vstack([
+                aggregate,
+                np.zeros(
+                    (num_rows - aggregate.shape[0], aggregate.shape[1]),
+                    dtype=aggregate.dtype
+                )
+            ])
+        return aggregate
+
     def append(self, asset, price):
         """
         Append a new price onto the price buffer for
@@ -52,7 +80,22 @@ class Signal(object):
         price : `float`
             The new price of the asset.
         """
-        self.buffers.append(asset, price)
+        self.append_many(np.array([price], dtype=np.float64), assets=[asset])
+
+    def append_many(self, prices, assets=None):
+        """
+        Append a new price onto the price buffer of each
+        of many assets at once.
+
+        Parameters
+        ----------
+        prices : `np.ndarray`
+            The new prices of the assets.
+        assets : `list[str]`, optional
+            The asset symbol names, ordered as the prices. Defaults
+            to the current assets of the signal.
+        """
+        self.buffers.append_many(prices, assets=assets)
 
     def update_assets(self, dt):
         """
@@ -71,6 +114,31 @@ class Signal(object):
         for extra_asset in extra_assets:
             self.assets.append(extra_asset)
 
+    def cross_section(self, lookback, assets=None):
+        """
+        Calculate the lookback-period signal values for many
+        assets at once. Derived classes override this to compute
+        the values in a single vectorised calculation.
+
+        Parameters
+        ----------
+        lookback : `int`
+            The lookback period.
+        assets : `list[str]`, optional
+            The asset symbol names. Defaults to the current
+            assets of the signal.
+
+        Returns
+        -------
+        `np.ndarray`
+            The signal values, ordered as the assets.
+        """
+        if assets is None:
+            assets = self.assets
+        return np.array(
+            [self(asset, lookback) for asset in assets], dtype=np.float64
+        )
+
     @abstractmethod
     def __call__(self, asset, lookback):
         raise NotImplementedError(
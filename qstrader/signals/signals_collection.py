@@ -1,3 +1,6 @@
+from qstrader.data.latest_prices import get_assets_latest_prices
+
+
 class SignalsCollection(object):
     """
     Provides a mechanism for aggregating all signals
@@ -56,7 +59,6 @@ class SignalsCollection(object):
         # Update all of the signals with new prices
         for name, signal in self.signals.items():
             assets = signal.assets
-            for asset in assets:
-                price = self.data_handler.get_asset_latest_mid_price(dt, asset)
-                self.signals[name].append(asset, price)
+            prices = get_assets_latest_prices(self.data_handler, dt, assets, 'mid')
+            self.signals[name].append_many(prices, assets=assets)
         self.warmup += 1
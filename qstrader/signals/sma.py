@@ -8,6 +8,16 @@ class SMASignal(Signal):
     Indicator class to calculate simple moving average
     of last N periods for a set of prices.
 
+    A running sum of each lookback window is maintained upon
+    appending prices, such that each average is O(1). The running
+    sum is recalculated each time its window has been fully
+    replaced, to prevent the accumulation of rounding errors.
+
+    Missing (NaN) prices are masked out of the running sums, with
+    the number of missing prices within each window tracked
+    separately. As with the mean of a window containing missing
+    prices, the average of such a window is NaN.
+
     Parameters
     ----------
     start_dt : `pd.Timestamp`
@@ -20,6 +30,57 @@ class SMASignal(Signal):
 
     def __init__(self, start_dt, universe, lookbacks):
         super().__init__(start_dt, universe, lookbacks)
+        self.lookback_index = {
+            lookback: idx for idx, lookback in enumerate(self.lookbacks)
+        }
+        self.sums = np.zeros((0, len(self.lookbacks)))
+        self.appends = np.zeros((0, len(self.lookbacks)), dtype=np.int64)
+        self.nan_counts = np.zeros((0, len(self.lookbacks)), dtype=np.int64)
+
+    def append_many(self, prices, assets=None):
+        """
+        Append a new price onto the price buffer of each of many
+        assets at once, updating the running sum of each lookback.
+
+        Parameters
+        ----------
+        prices : `np.ndarray`
+            The new prices of the assets.
+        assets : `list[str]`, optional
+            The asset symbol names, ordered as the prices. Defaults
+            to the current assets of the signal.
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        rows = self.buffers.rows(self.assets if assets is None else assets)
+        self.sums = self._pad_rows(self.sums)
+        self.appends = self._pad_rows(self.appends)
+        self.nan_counts = self._pad_rows(self.nan_counts)
+
+        # Determine the prices leaving each lookback window
+        counts = self.buffers.counts[rows]
+        evicted_prices = np.zeros((len(rows), len(self.lookbacks)))
+        for idx, lookback in enumerate(self.lookbacks):
+            full = counts >= lookback
+            evicted_prices[full, idx] = self.buffers.values[
+                rows[full], self.buffers.price_indices(counts[full], lookback - 1)
+            ]
+
+        super().append_many(prices, assets=assets)
+
+        missing = np.isnan(prices)
+        evicted_missing = np.isnan(evicted_prices)
+        self.sums[rows] += (
+            np.where(missing, 0.0, prices)[:, None] -
+            np.where(evicted_missing, 0.0, evicted_prices)
+        )
+        self.nan_counts[rows] += missing[:, None].astype(np.int64) - evicted_missing
+        self.appends[rows] += 1
+        for idx, lookback in enumerate(self.lookbacks):
+            resync_rows = rows[self.appends[rows, idx] >= lookback]
+            if len(resync_rows) > 0:
+                windows, num_prices = self.buffers.get_windows(resync_rows, lookback)
+                self.sums[resync_rows, idx] = np.nansum(windows, axis=1)
+                self.appends[resync_rows, idx] = 0
 
     def _simple_moving_average(self, asset, lookback):
         """
@@ -39,7 +100,41 @@ class SMASignal(Signal):
         `float`
             The SMA value ('trend') for the period.
         """
-        return np.mean(self.buffers.prices['%s_%s' % (asset, lookback)])
+        row = self.buffers.asset_index[asset]
+        idx = self.lookback_index[lookback]
+        num_prices = min(self.buffers.counts[row], lookback)
+        if num_prices == 0 or self.nan_counts[row, idx] > 0:
+            return np.nan
+        return self.sums[row, idx] / num_prices
+
+    def cross_section(self, lookback, assets=None):
+        """
+        Calculate the lookback-period trend for many
+        assets at once.
+
+        Parameters
+        ----------
+        lookback : `int`
+            The lookback period.
+        assets : `list[str]`, optional
+            The asset symbol names. Defaults to the current
+            assets of the signal.
+
+        Returns
+        -------
+        `np.ndarray`
+            The trend (SMA) for the period, ordered as the assets.
+        """
+        rows = self.buffers.rows(self.assets if assets is None else assets)
+        self.sums = self._pad_rows(self.sums)
+        self.appends = self._pad_rows(self.appends)
+        self.nan_counts = self._pad_rows(self.nan_counts)
+        idx = self.lookback_index[lookback]
+        num_prices = np.minimum(self.buffers.counts[rows], lookback)
+        trends = np.full(len(rows), np.nan)
+        available = (num_prices > 0) & (self.nan_counts[rows, idx] == 0)
+        trends[available] = self.sums[rows[available], idx] / num_prices[available]
+        return trends
 
     def __call__(self, asset, lookback):
         """
@@ -1,5 +1,4 @@
 import numpy as np
-import pandas as pd
 
 from qstrader.signals.signal import Signal
 
@@ -13,6 +12,21 @@ class VolatilitySignal(Signal):
     lookback parameter the volatility is calculated on
     this subset.
 
+    Running sums and sums of squares of the returns within each
+    lookback window are maintained upon appending prices, such that
+    each volatility is O(1). These are recalculated each time their
+    window has been fully replaced, to prevent the accumulation of
+    rounding errors. Where the variance obtained from these sums has
+    cancelled to nearly zero, e.g. for a single return, it is instead
+    calculated about the mean of the returns of the window.
+
+    Missing (NaN) prices are forward-filled within each lookback
+    window, with returns only available subsequent to the first
+    available price of the window. While a window contains missing
+    prices its running sums are instead recalculated from the
+    window upon each append, restoring the O(1) updates once the
+    missing prices have left the window.
+
     Parameters
     ----------
     start_dt : `pd.Timestamp`
@@ -26,26 +40,173 @@ class VolatilitySignal(Signal):
     def __init__(self, start_dt, universe, lookbacks):
         bumped_lookbacks = [lookback + 1 for lookback in lookbacks]
         super().__init__(start_dt, universe, bumped_lookbacks)
+        self.lookback_index = {
+            lookback: idx for idx, lookback in enumerate(self.lookbacks)
+        }
+        self.return_sums = np.zeros((0, len(self.lookbacks)))
+        self.return_sq_sums = np.zeros((0, len(self.lookbacks)))
+        self.num_returns = np.zeros((0, len(self.lookbacks)), dtype=np.int64)
+        self.appends = np.zeros((0, len(self.lookbacks)), dtype=np.int64)
+        self.nan_counts = np.zeros((0, len(self.lookbacks)), dtype=np.int64)
 
     @staticmethod
-    def _asset_lookback_key(asset, lookback):
+    def _window_returns(windows):
         """
-        Create the buffer dictionary lookup key based
-        on asset name and lookback period.
+        Calculate the returns of many windows of prices,
+        forward-filling missing prices within each window.
 
         Parameters
         ----------
-        asset : `str`
-            The asset symbol name.
-        lookback : `int`
-            The lookback period.
+        windows : `np.ndarray`
+            The (rows x lookback) prices, oldest first.
 
         Returns
         -------
-        `str`
-            The lookup key.
+        `np.ndarray`
+            The (rows x lookback - 1) returns, NaN prior to the
+            first available price of each row.
+        """
+        columns = np.where(~np.isnan(windows), np.arange(windows.shape[1]), 0)
+        filled = windows[
+            np.arange(len(windows))[:, None], np.maximum.accumulate(columns, axis=1)
+        ]
+        return filled[:, 1:] / filled[:, :-1] - 1.0
+
+    @staticmethod
+    def _window_return_sums(windows):
         """
-        return '%s_%s' % (asset, lookback + 1)
+        Calculate the sums and sums of squares of the returns of
+        many windows of prices, forward-filling missing prices
+        within each window.
+
+        Parameters
+        ----------
+        windows : `np.ndarray`
+            The (rows x lookback) prices, oldest first.
+
+        Returns
+        -------
+        `tuple(np.ndarray, np.ndarray, np.ndarray)`
+            The sums and sums of squares of the returns, along
+            with the number of available returns of each row.
+        """
+        window_returns = VolatilitySignal._window_returns(windows)
+        return (
+            np.nansum(window_returns, axis=1),
+            np.nansum(window_returns * window_returns, axis=1),
+            np.sum(~np.isnan(window_returns), axis=1)
+        )
+
+    def append_many(self, prices, assets=None):
+        """
+        Append a new price onto the price buffer of each of many
+        assets at once, updating the running sums and sums of squares
+        of the returns of each lookback.
+
+        Parameters
+        ----------
+        prices : `np.ndarray`
+            The new prices of the assets.
+        assets : `list[str]`, optional
+            The asset symbol names, ordered as the prices. Defaults
+            to the current assets of the signal.
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        rows = self.buffers.rows(self.assets if assets is None else assets)
+        self.return_sums = self._pad_rows(self.return_sums)
+        self.return_sq_sums = self._pad_rows(self.return_sq_sums)
+        self.num_returns = self._pad_rows(self.num_returns)
+        self.appends = self._pad_rows(self.appends)
+        self.nan_counts = self._pad_rows(self.nan_counts)
+
+        # Determine the new returns along with the returns
+        # leaving each lookback window
+        counts = self.buffers.counts[rows]
+        has_return = counts >= 1
+        returns = np.zeros(len(rows))
+        returns[has_return] = prices[has_return] / self.buffers.values[
+            rows[has_return], self.buffers.price_indices(counts[has_return], 0)
+        ] - 1.0
+        evicted_returns = np.zeros((len(rows), len(self.lookbacks)))
+        evicted_missing = np.zeros((len(rows), len(self.lookbacks)), dtype=np.int64)
+        for idx, lookback in enumerate(self.lookbacks):
+            full = counts >= lookback
+            evicted_missing[full, idx] = np.isnan(self.buffers.values[
+                rows[full], self.buffers.price_indices(counts[full], lookback - 1)
+            ])
+            full &= lookback > 1
+            evicted_returns[full, idx] = self.buffers.values[
+                rows[full], self.buffers.price_indices(counts[full], lookback - 2)
+            ] / self.buffers.values[
+                rows[full], self.buffers.price_indices(counts[full], lookback - 1)
+            ] - 1.0
+
+        super().append_many(prices, assets=assets)
+
+        # Windows containing missing prices prior to or subsequent
+        # to the append are recalculated rather than updated
+        missing_rows = self.nan_counts[rows] > 0
+        self.nan_counts[rows] += np.isnan(prices)[:, None] - evicted_missing
+        missing_rows |= self.nan_counts[rows] > 0
+        self.num_returns[rows] = np.minimum(
+            self.buffers.counts[rows, None], self.lookbacks
+        ) - 1
+
+        return_rows = rows[has_return]
+        returns = returns[has_return, None]
+        evicted_returns = evicted_returns[has_return]
+        self.return_sums[return_rows] += returns - evicted_returns
+        self.return_sq_sums[return_rows] += (
+            returns * returns - evicted_returns * evicted_returns
+        )
+        self.appends[return_rows] += 1
+        for idx, lookback in enumerate(self.lookbacks):
+            resync_rows = rows[
+                (has_return & (self.appends[rows, idx] >= lookback)) |
+                missing_rows[:, idx]
+            ]
+            if len(resync_rows) > 0:
+                windows, num_prices = self.buffers.get_windows(resync_rows, lookback)
+                (
+                    self.return_sums[resync_rows, idx],
+                    self.return_sq_sums[resync_rows, idx],
+                    self.num_returns[resync_rows, idx]
+                ) = self._window_return_sums(windows)
+                self.appends[resync_rows, idx] = 0
+
+    def _return_variances(self, rows, idx):
+        """
+        Calculate the variances of the returns within a lookback
+        window for many assets from the running sums.
+
+        Subtracting the squared mean from the mean of the squares
+        leaves only rounding error where the two nearly cancel, such
+        as for a single return, so these variances are instead
+        calculated about the mean of the returns of the window.
+
+        Parameters
+        ----------
+        rows : `np.ndarray`
+            The rows of the assets, each with at least one return.
+        idx : `int`
+            The index of the lookback.
+
+        Returns
+        -------
+        `np.ndarray`
+            The variances of returns, ordered as the rows.
+        """
+        num_returns = self.num_returns[rows, idx]
+        mean_returns = self.return_sums[rows, idx] / num_returns
+        mean_sq_returns = self.return_sq_sums[rows, idx] / num_returns
+        variances = mean_sq_returns - mean_returns * mean_returns
+        cancelled = variances <= 1e-8 * mean_sq_returns
+        if cancelled.any():
+            windows, num_prices = self.buffers.get_windows(
+                rows[cancelled], self.lookbacks[idx]
+            )
+            variances[cancelled] = np.nanvar(self._window_returns(windows), axis=1)
+        return variances
 
     def _annualised_vol(self, asset, lookback):
         """
@@ -65,19 +226,46 @@ class VolatilitySignal(Signal):
         `float`
             The annualised volatility of returns.
         """
-        series = pd.Series(
-            self.buffers.prices[
-                VolatilitySignal._asset_lookback_key(
-                    asset, lookback
-                )
-            ]
-        )
-        returns = series.pct_change().dropna().to_numpy()
-
-        if len(returns) < 1:
+        row = self.buffers.asset_index[asset]
+        idx = self.lookback_index[lookback + 1]
+        num_returns = self.num_returns[row, idx]
+        if num_returns < 1:
             return 0.0
         else:
-            return np.std(returns) * np.sqrt(252)
+            variance = self._return_variances(np.array([row]), idx)[0]
+            return np.sqrt(variance) * np.sqrt(252)
+
+    def cross_section(self, lookback, assets=None):
+        """
+        Calculate the annualised volatility of returns for
+        many assets at once.
+
+        Parameters
+        ----------
+        lookback : `int`
+            The lookback period.
+        assets : `list[str]`, optional
+            The asset symbol names. Defaults to the current
+            assets of the signal.
+
+        Returns
+        -------
+        `np.ndarray`
+            The annualised volatility of returns, ordered as the assets.
+        """
+        rows = self.buffers.rows(self.assets if assets is None else assets)
+        self.return_sums = self._pad_rows(self.return_sums)
+        self.return_sq_sums = self._pad_rows(self.return_sq_sums)
+        self.num_returns = self._pad_rows(self.num_returns)
+        self.appends = self._pad_rows(self.appends)
+        self.nan_counts = self._pad_rows(self.nan_counts)
+        idx = self.lookback_index[lookback + 1]
+        num_returns = self.num_returns[rows, idx]
+        vols = np.zeros(len(rows))
+        available = num_returns >= 1
+        variances = self._return_variances(rows[available], idx)
+        vols[available] = np.sqrt(variances) * np.sqrt(252)
+        return vols
 
     def __call__(self, asset, lookback):
         """
@@ -1,5 +1,4 @@
-import datetime
-
+import numpy as np
 import pandas as pd
 from pandas.tseries.offsets import BDay
 import pytz
@@ -22,6 +21,10 @@ class DailyBusinessDaySimulationEngine(SimulationEngine):
     a market closing event and a post-market event for every day
     between the starting and ending dates.
 
+    The full timeline of events is precomputed upon construction as
+    the event_times (America/New_York) and event_types arrays, which
+    can also be used directly by vectorised consumers.
+
     Parameters
     ----------
     starting_day : `pd.Timestamp`
@@ -48,6 +51,7 @@ class DailyBusinessDaySimulationEngine(SimulationEngine):
         self.pre_market = pre_market
         self.post_market = post_market
         self.business_days = self._generate_business_days()
+        self.event_times, self.event_types = self._generate_event_timeline()
 
     def _generate_business_days(self):
         """
@@ -64,22 +68,62 @@ class DailyBusinessDaySimulationEngine(SimulationEngine):
         )
 
         if self.data_handler and self.data_handler.data_sources:
-            longest_asset = self.data_handler.get_longest_asset()
-            if longest_asset is None:
-                return []  # No data available
-
-            # Use .asset_bar_frames for consistency
-            available_days = self.data_handler.data_sources[0].asset_bar_frames[longest_asset].index
-
-            # Filter all_days to keep only those present in available_days
-            filtered_days = [
-                day for day in all_days if day in available_days
-            ]
-            return pd.DatetimeIndex(filtered_days)  # Return as DatetimeIndex
+            # Keep only those days present within the master trading calendar
+            available_days = self.data_handler.get_trading_days()
+            return pd.DatetimeIndex(all_days[all_days.isin(available_days)], freq=None)
 
         else:
             return pd.DatetimeIndex([])  # No data handler, return empty list
 
+    def _generate_event_timeline(self):
+        """
+        Generate the timestamps and event types of all events, with
+        the events of each business day occurring at fixed local
+        (America/New_York) times.
+
+        Returns
+        -------
+        `tuple(pd.DatetimeIndex, np.ndarray)`
+            The event timestamps and event type strings.
+        """
+        event_offsets = []
+        if self.pre_market:
+            event_offsets.append((pd.Timedelta(0), 'pre_market'))
+        event_offsets.append((pd.Timedelta(hours=9, minutes=30), 'market_open'))
+        event_offsets.append((pd.Timedelta(hours=16), 'market_close'))
+        if self.post_market:
+            event_offsets.append((pd.Timedelta(hours=23, minutes=59), 'post_market'))
+
+        # Use the calendar date of each business day within its own timezone
+        days = pd.DatetimeIndex(self.business_days)
+        if days.tz is not None:
+            days = days.tz_localize(None)
+        days = days.normalize().as_unit('us').asi8
+
+        offsets = np.array(
+            [offset // pd.Timedelta(microseconds=1) for offset, _ in event_offsets],
+            dtype=np.int64
+        )
+        event_times = pd.DatetimeIndex(
+            (days[:, None] + offsets[None, :]).ravel().astype('datetime64[us]')
+        ).tz_localize('America/New_York')
+        event_types = np.tile(
+            np.array([event_type for _, event_type in event_offsets], dtype=object),
+            len(days)
+        )
+        return event_times, event_types
+
+    def __len__(self):
+        """
+        The number of simulation events.
+
+        Returns
+        -------
+        `int`
+            The number of simulation events.
+        """
+        return len(self.event_times)
+
     def __iter__(self):
         """
         Generate the daily timestamps and event information
@@ -90,35 +134,5 @@ class DailyBusinessDaySimulationEngine(SimulationEngine):
         `SimulationEvent`
             Market time simulation event to yield
         """
-        for index, bday in enumerate(self.business_days):
-            year = bday.year
-            month = bday.month
-            day = bday.day
-
-            if self.pre_market:
-                yield SimulationEvent(
-                    pd.Timestamp(
-                        datetime.datetime(year, month, day), tz='America/New_York'
-                    ), event_type="pre_market"
-                )
-
-            yield SimulationEvent(
-                pd.Timestamp(
-                    datetime.datetime(year, month, day, 9, 30),
-                    tz='America/New_York'
-                ), event_type="market_open"
-            )
-
-            yield SimulationEvent(
-                pd.Timestamp(
-                    datetime.datetime(year, month, day, 16, 00),
-                    tz='America/New_York'
-                ), event_type="market_close"
-            )
-
-            if self.post_market:
-                yield SimulationEvent(
-                    pd.Timestamp(
-                        datetime.datetime(year, month, day, 23, 59), tz='America/New_York'
-                    ), event_type="post_market"
-                )
+        for ts, event_type in zip(self.event_times, self.event_types):
+            yield SimulationEvent(ts, event_type)
@@ -0,0 +1,142 @@
+import numpy as np
+import pandas as pd
+
+import qstrader.statistics.performance as perf
+
+
+class BatchStatistics(object):
+    """
+    Standalone class to calculate the backtesting statistics of
+    many equity curves at once, such as those of a parameter sweep.
+
+    All statistics are calculated column-wise across the curves in
+    vectorised form, following the definitions of JSONStatistics, and
+    are collected into a tidy table with a row per curve.
+
+    Parameters
+    ----------
+    equity_curves : `pd.DataFrame`
+        The equity curves indexed by date-time, one column per curve,
+        aligned on a common index.
+    periods : `int`, optional
+        The number of periods to use for Sharpe ratio calculation.
+    """
+
+    def __init__(self, equity_curves, periods=252):
+        self.equity_curves = equity_curves
+        self.periods = periods
+        self.returns, self.cum_returns = self._calculate_returns(equity_curves)
+        self.monthly_returns = self._aggregate_returns(self.returns, 'monthly')
+        self.yearly_returns = self._aggregate_returns(self.returns, 'yearly')
+        (
+            self.drawdowns, self.max_drawdowns, self.max_drawdown_durations
+        ) = perf.create_drawdowns_batch(self.cum_returns)
+        self.statistics = self._create_statistics()
+
+    @staticmethod
+    def _calculate_returns(equity_curves):
+        """
+        Calculate the returns and cumulative returns of each
+        equity curve.
+
+        Parameters
+        ----------
+        equity_curves : `pd.DataFrame`
+            The equity curves.
+
+        Returns
+        -------
+        `tuple(pd.DataFrame, pd.DataFrame)`
+            The returns and cumulative returns.
+        """
+        returns = equity_curves.pct_change().fillna(0.0)
+        cum_returns = np.exp(np.log(1 + returns).cumsum())
+        return returns, cum_returns
+
+    @staticmethod
+    def _aggregate_returns(returns, convert_to):
+        """
+        Aggregate the returns of each equity curve by month or year,
+        compounding via the sum of the log returns within each period.
+
+        Parameters
+        ----------
+        returns : `pd.DataFrame`
+            The returns of each equity curve.
+        convert_to : `str`
+            Either 'monthly' or 'yearly'.
+
+        Returns
+        -------
+        `pd.DataFrame`
+            The aggregated returns, indexed by (year, month) or year.
+        """
+        if convert_to == 'monthly':
+            groups = [returns.index.year, returns.index.month]
+        elif convert_to == 'yearly':
+            groups = [returns.index.year]
+        else:
+            raise ValueError(
+                'Unable to aggregate returns "%s". Must be '
+                'monthly or yearly.' % convert_to
+            )
+        return np.exp(np.log(1 + returns).groupby(groups).sum()) - 1
+
+    def _create_statistics(self):
+        """
+        Create the tidy table of statistics, with a row per
+        equity curve.
+
+        Returns
+        -------
+        `pd.DataFrame`
+            The statistics of each equity curve.
+        """
+        returns = self.returns.to_numpy(dtype=np.float64)
+        final_cum_returns = self.cum_returns.iloc[-1].to_numpy(dtype=np.float64)
+        years = len(returns) / float(self.periods)
+        mean_returns = np.mean(returns, axis=0)
+        stdev_returns = np.std(returns, axis=0)
+
+        # The Sortino ratio uses the (population) standard
+        # deviation of the negative returns alone
+        negative = returns < 0
+        num_negative = negative.sum(axis=0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            negative_means = np.where(negative, returns, 0.0).sum(axis=0) / num_negative
+            downside_stdev = np.sqrt(
+                np.where(negative, (returns - negative_means) ** 2, 0.0).sum(axis=0) /
+                num_negative
+            )
+            sharpe = np.sqrt(self.periods) * mean_returns / stdev_returns
+            sortino = np.sqrt(self.periods) * mean_returns / downside_stdev
+
+        return pd.DataFrame(
+            {
+                'total_return': final_cum_returns - 1.0,
+                'cagr': final_cum_returns ** (1.0 / years) - 1.0,
+                'mean_returns': mean_returns,
+                'stdev_returns': stdev_returns,
+                'annualised_vol': stdev_returns * np.sqrt(self.periods),
+                'sharpe': sharpe,
+                'sortino': sortino,
+                'max_drawdown': self.max_drawdowns.to_numpy(),
+                'max_drawdown_duration': self.max_drawdown_durations.to_numpy(),
+                'best_month': self.monthly_returns.max().to_numpy(),
+                'worst_month': self.monthly_returns.min().to_numpy(),
+                'best_year': self.yearly_returns.max().to_numpy(),
+                'worst_year': self.yearly_returns.min().to_numpy()
+            },
+            index=self.equity_curves.columns
+        )
+
+    def get_results(self):
+        """
+        Return the tidy table of statistics.
+
+        Returns
+        -------
+        `pd.DataFrame`
+            The statistics of each equity curve, indexed by curve.
+        """
+        return self.statistics
@@ -1,5 +1,3 @@
-from itertools import groupby
-
 import numpy as np
 import pandas as pd
 
@@ -65,6 +63,37 @@ def create_sortino_ratio(returns, periods=252):
     return np.sqrt(periods) * (np.mean(returns)) / np.std(returns[returns < 0])
 
 
+def _drawdowns_and_durations(returns):
+    """
+    Calculate the drawdowns of each column of a two-dimensional array
+    of cumulative returns, along with the longest run of consecutive
+    periods spent in drawdown for each column.
+
+    Parameters:
+    returns - A (periods x curves) NumPy array of cumulative returns.
+
+    Returns:
+    drawdowns, durations
+    """
+    # The High Water Mark starts at zero and ignores missing values
+    hwm = np.fmax.accumulate(
+        np.vstack([np.zeros((1, returns.shape[1])), returns[1:]]), axis=0
+    )
+    with np.errstate(divide='ignore', invalid='ignore'):
+        drawdowns = (hwm - returns) / hwm
+    drawdowns[:1] = 0.0
+
+    # The duration of the current drawdown run at each period is
+    # the number of periods elapsed since the last period at the
+    # High Water Mark
+    periods = np.arange(len(drawdowns))[:, np.newaxis]
+    last_peak = np.maximum.accumulate(
+        np.where(drawdowns != 0, -1, periods), axis=0
+    )
+    durations = (periods - last_peak).max(axis=0)
+    return drawdowns, durations
+
+
 def create_drawdowns(returns):
     """
     Calculate the largest peak-to-trough drawdown of the equity curve
@@ -77,22 +106,33 @@ def create_drawdowns(returns):
     Returns:
     drawdown, drawdown_max, duration
     """
-    # Calculate the cumulative returns curve
-    # and set up the High Water Mark
-    idx = returns.index
-    hwm = np.zeros(len(idx))
-
-    # Create the high water mark
-    for t in range(1, len(idx)):
-        hwm[t] = max(hwm[t - 1], returns.iloc[t])
-
-    # Calculate the drawdown and duration statistics
-    perf = pd.DataFrame(index=idx)
-    perf["Drawdown"] = (hwm - returns) / hwm
-    perf.loc[perf.index[0], 'Drawdown'] = 0.0
-    perf["DurationCheck"] = np.where(perf["Drawdown"] == 0, 0, 1)
-    duration = max(
-        sum(1 for i in g if i == 1)
-        for k, g in groupby(perf["DurationCheck"])
+    drawdowns, durations = _drawdowns_and_durations(
+        returns.to_numpy(dtype=np.float64)[:, np.newaxis]
+    )
+    drawdown = pd.Series(drawdowns[:, 0], index=returns.index, name='Drawdown')
+    return drawdown, np.max(drawdown), int(durations[0])
+
+
+def create_drawdowns_batch(returns):
+    """
+    Calculate the drawdowns, largest peak-to-trough drawdown and
+    duration of the drawdown of many equity curves at once, as per
+    create_drawdowns for each column.
+
+    Parameters:
+    returns - A pandas DataFrame of cumulative returns, one column per curve.
+
+    Returns:
+    drawdowns, drawdown_maxes, durations
+    """
+    drawdowns, durations = _drawdowns_and_durations(
+        returns.to_numpy(dtype=np.float64)
+    )
+    drawdowns = pd.DataFrame(
+        drawdowns, index=returns.index, columns=returns.columns
+    )
+    return (
+        drawdowns,
+        drawdowns.max(),
+        pd.Series(durations, index=returns.columns, name='Duration')
     )
-    return perf["Drawdown"], np.max(perf["Drawdown"]), duration
@@ -0,0 +1,1070 @@
+import numpy as np
+import pandas as pd
+
+
+STATS_GRANULARITIES = ('off', 'rebalance', 'event')
+WEIGHTS_KEYS = ('alpha_weights', 'risk_weights', 'optimised_weights')
+PORTFOLIO_KEYS = ('target_portfolio', 'current_portfolio')
+
+
+class AssetPanel(object):
+    """
+    Columnar storage of per-asset values recorded at many timestamps.
+
+    Each per-asset field is stored as a preallocated (rows x assets)
+    NumPy array, with per-row scalar fields (such as cash) stored as
+    one-dimensional arrays. Rows and asset columns are grown
+    geometrically when the preallocated capacity is exhausted.
+
+    The order of the assets within each recorded row is retained, such
+    that rows can be reconstructed as originally provided.
+
+    Parameters
+    ----------
+    fields : `list[str]`
+        The per-asset fields to store.
+    row_fields : `list[str]`, optional
+        The per-row scalar fields to store.
+    assets : `list[str]`, optional
+        The assets to preallocate columns for.
+    capacity : `int`, optional
+        The number of rows to preallocate.
+    """
+
+    def __init__(self, fields, row_fields=(), assets=(), capacity=16):
+        self.fields = list(fields)
+        self.row_fields = list(row_fields)
+        self.num_rows = 0
+        self.assets = []
+        self.asset_index = {}
+        self.tz = None
+        self.unit = 'ns'
+
+        row_capacity = max(capacity, 1)
+        col_capacity = max(len(assets), 1)
+        self.dates = np.zeros(row_capacity, dtype=np.int64)
+        self.events = np.empty(row_capacity, dtype=object)
+        self.ranks = np.full((row_capacity, col_capacity), -1, dtype=np.int32)
+        self.values = {
+            field: np.full((row_capacity, col_capacity), np.nan)
+            for field in self.fields
+        }
+        self.row_values = {
+            field: np.full(row_capacity, np.nan) for field in self.row_fields
+        }
+        self.columns(assets)
+
+    def __len__(self):
+        return self.num_rows
+
+    def _grow(self, num_rows, num_cols):
+        """
+        Grow the preallocated arrays, if necessary, such that they
+        can store at least the provided number of rows and columns.
+
+        Parameters
+        ----------
+        num_rows : `int`
+            The required number of rows.
+        num_cols : `int`
+            The required number of asset columns.
+        """
+        row_capacity, col_capacity = self.ranks.shape
+        if num_rows <= row_capacity and num_cols <= col_capacity:
+            return
+        if num_rows > row_capacity:
+            row_capacity = max(num_rows, 2 * row_capacity)
+        if num_cols > col_capacity:
+            col_capacity = max(num_cols, 2 * col_capacity)
+
+        def _resize(array, fill_value):
+            shape = (row_capacity,) + (
+                (col_capacity,) if array.ndim == 2 else ()
+            )
+            resized = np.full(shape, fill_value, dtype=array.dtype)
+            resized[tuple(slice(0, size) for size in array.shape)] = array
+            return resized
+
+        self.dates = _resize(self.dates, 0)
+        self.events = _resize(self.events, None)
+        self.ranks = _resize(self.ranks, -1)
+        self.values = {
+            field: _resize(values, np.nan) for field, values in self.values.items()
+        }
+        self.row_values = {
+            field: _resize(values, np.nan) for field, values in self.row_values.items()
+        }
+
+    def _set_timezone(self, dt):
+        """
+        Store the timezone and resolution of the recorded timestamps
+        from the first recorded timestamp.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The recorded timestamp.
+        """
+        if self.num_rows == 0:
+            self.tz = dt.tz
+            self.unit = dt.unit
+
+    def columns(self, assets):
+        """
+        Obtain the column indices of the provided assets, adding
+        columns for any assets not previously recorded.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbols.
+
+        Returns
+        -------
+        `np.ndarray`
+            The column indices of the assets.
+        """
+        for asset in assets:
+            if asset not in self.asset_index:
+                self.asset_index[asset] = len(self.assets)
+                self.assets.append(asset)
+        self._grow(self.num_rows, len(self.assets))
+        return np.array(
+            [self.asset_index[asset] for asset in assets], dtype=np.int64
+        )
+
+    def append(self, dt, event_type, assets, values, row_values=None):
+        """
+        Record the values of many assets at a single timestamp.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The timestamp of the values.
+        event_type : `str`
+            The simulation event type of the values.
+        assets : `list[str]`
+            The asset symbols.
+        values : `dict{str: list}`
+            The values of each per-asset field, ordered as the assets.
+        row_values : `dict{str: float}`, optional
+            The values of each per-row field.
+        """
+        self._set_timezone(dt)
+        cols = self.columns(assets)
+        row = self.num_rows
+        self._grow(row + 1, len(self.assets))
+        self.dates[row] = dt.value
+        self.events[row] = event_type
+        self.ranks[row, cols] = np.arange(len(cols))
+        for field in self.fields:
+            self.values[field][row, cols] = values[field]
+        for field in self.row_fields:
+            self.row_values[field][row] = row_values[field]
+        self.num_rows += 1
+
+    def extend(self, dts, event_types, assets, values, row_values=None):
+        """
+        Record the values of the same assets at many timestamps.
+
+        Parameters
+        ----------
+        dts : `list[pd.Timestamp]`
+            The timestamps of the values.
+        event_types : `list[str]`
+            The simulation event types of the values.
+        assets : `list[str]`
+            The asset symbols.
+        values : `dict{str: np.ndarray}`
+            The (timestamps x assets) values of each per-asset field.
+        row_values : `dict{str: np.ndarray}`, optional
+            The values of each per-row field at each timestamp.
+        """
+        if len(dts) == 0:
+            return
+        self._set_timezone(dts[0])
+        cols = self.columns(assets)
+        start = self.num_rows
+        end = start + len(dts)
+        self._grow(end, len(self.assets))
+        self.dates[start:end] = [dt.value for dt in dts]
+        self.events[start:end] = event_types
+        self.ranks[start:end, cols] = np.arange(len(cols))
+        for field in self.fields:
+            self.values[field][start:end, cols] = values[field]
+        for field in self.row_fields:
+            self.row_values[field][start:end] = row_values[field]
+        self.num_rows = end
+
+    def timestamps(self):
+        """
+        Obtain the recorded timestamps.
+
+        Returns
+        -------
+        `pd.DatetimeIndex`
+            The recorded timestamps.
+        """
+        return pd.DatetimeIndex(
+            pd.to_datetime(self.dates[:self.num_rows], unit='ns', utc=True)
+        ).tz_convert(self.tz).as_unit(self.unit)
+
+    def rows(self):
+        """
+        Iterate over the recorded rows.
+
+        Yields
+        ------
+        `tuple(pd.Timestamp, str, list[str], np.ndarray)`
+            The timestamp, event type, asset symbols and asset column
+            indices of each row, with the assets ordered as recorded.
+        """
+        dates = self.timestamps()
+        ranks = self.ranks[:self.num_rows, :len(self.assets)]
+        for row in range(self.num_rows):
+            cols = np.flatnonzero(ranks[row] >= 0)
+            cols = cols[np.argsort(ranks[row, cols])]
+            yield (
+                dates[row], self.events[row],
+                [self.assets[col] for col in cols], cols
+            )
+
+    def to_frame(self, columns, row_columns=None):
+        """
+        Create a long-format DataFrame of the recorded values, indexed
+        by timestamp and asset symbol, in a single constructor call.
+
+        Parameters
+        ----------
+        columns : `dict{str: str}`
+            The DataFrame column name of each per-asset field.
+        row_columns : `dict{str: tuple(str, str)}`, optional
+            The asset label and DataFrame column name of each per-row
+            field, which are placed after the assets of each row with
+            the remaining columns set to NaN.
+
+        Returns
+        -------
+        `pd.DataFrame`
+            The (Date, Asset) indexed DataFrame.
+        """
+        num_assets = len(self.assets)
+        ranks = self.ranks[:self.num_rows, :num_assets]
+        rows, cols = np.nonzero(ranks >= 0)
+        row_ranks = [ranks[rows, cols]]
+        all_rows = [rows]
+        labels = [np.array(self.assets, dtype=object)[cols]]
+        data = {
+            name: [self.values[field][rows, cols]]
+            for field, name in columns.items()
+        }
+
+        for offset, (field, (label, name)) in enumerate(
+            (row_columns or {}).items()
+        ):
+            all_rows.append(np.arange(self.num_rows))
+            row_ranks.append(np.full(self.num_rows, num_assets + offset))
+            labels.append(np.full(self.num_rows, label, dtype=object))
+            for column, values in data.items():
+                values.append(
+                    self.row_values[field][:self.num_rows] if column == name
+                    else np.full(self.num_rows, np.nan)
+                )
+
+        rows = np.concatenate(all_rows)
+        order = np.lexsort((np.concatenate(row_ranks), rows))
+        index = pd.MultiIndex.from_arrays(
+            [self.timestamps()[rows[order]], np.concatenate(labels)[order]],
+            names=['Date', 'Asset']
+        )
+        return pd.DataFrame(
+            {name: np.concatenate(values)[order] for name, values in data.items()},
+            index=index
+        )
+
+
+class RecordTable(object):
+    """
+    Columnar storage of flat records, with a list per column.
+
+    Parameters
+    ----------
+    columns : `list[str]`
+        The record columns.
+    """
+
+    def __init__(self, columns):
+        self.columns = {column: [] for column in columns}
+        self.num_rows = 0
+
+    def __len__(self):
+        return self.num_rows
+
+    def append(self, record):
+        """
+        Record a single record. Columns absent from the record are
+        stored as None.
+
+        Parameters
+        ----------
+        record : `dict`
+            The record.
+        """
+        for column, values in self.columns.items():
+            values.append(record.get(column))
+        self.num_rows += 1
+
+    def to_records(self, start=0, end=None):
+        """
+        Reconstruct the stored records as dictionaries.
+
+        Parameters
+        ----------
+        start : `int`, optional
+            The first record to reconstruct.
+        end : `int`, optional
+            The index after the last record to reconstruct.
+
+        Returns
+        -------
+        `list[dict]`
+            The records.
+        """
+        columns = list(self.columns.keys())
+        return [
+            dict(zip(columns, row)) for row in zip(
+                *[self.columns[column][start:end] for column in columns]
+            )
+        ]
+
+    def to_frame(self, columns, dates=None, events=None):
+        """
+        Create a long-format DataFrame of the stored records, indexed
+        by timestamp and asset symbol, in a single constructor call.
+
+        Parameters
+        ----------
+        columns : `dict{str: str}`
+            The DataFrame column name of each record column.
+        dates : `list[pd.Timestamp]`, optional
+            The timestamp of each record. Defaults to the 'date' column.
+        events : `list[str]`, optional
+            The simulation event type of each record, stored in the
+            'Event' column if provided.
+
+        Returns
+        -------
+        `pd.DataFrame`
+            The (Date, Asset) indexed DataFrame.
+        """
+        if dates is None:
+            dates = self.columns['date']
+        index = pd.MultiIndex.from_arrays(
+            [pd.DatetimeIndex(dates), self.columns['asset']],
+            names=['Date', 'Asset']
+        )
+        data = {name: self.columns[column] for column, name in columns.items()}
+        if events is not None:
+            data['Event'] = events
+        return pd.DataFrame(data, index=index)
+
+
+class GroupedRecordTable(object):
+    """
+    Columnar storage of groups of flat records, such as the orders
+    of each rebalance. Each group is stored as a row of the groups
+    table, with the boundaries of its records stored alongside.
+
+    Parameters
+    ----------
+    group_columns : `list[str]`
+        The per-group columns, in addition to the date and event.
+    record_columns : `list[str]`
+        The per-record columns.
+    """
+
+    def __init__(self, group_columns, record_columns):
+        self.groups = RecordTable(['date', 'event'] + list(group_columns))
+        self.records = RecordTable(record_columns)
+        self.group_ends = []
+
+    def __len__(self):
+        return len(self.groups)
+
+    def append(self, group, records):
+        """
+        Record a group of records.
+
+        Parameters
+        ----------
+        group : `dict`
+            The per-group values.
+        records : `list[dict]`
+            The records of the group.
+        """
+        self.groups.append(group)
+        for record in records:
+            self.records.append(record)
+        self.group_ends.append(len(self.records))
+
+    def to_groups(self, records_key):
+        """
+        Reconstruct the stored groups as dictionaries.
+
+        Parameters
+        ----------
+        records_key : `str`
+            The key under which to store the records of each group.
+
+        Returns
+        -------
+        `list[dict]`
+            The groups.
+        """
+        groups = self.groups.to_records()
+        start = 0
+        for group, end in zip(groups, self.group_ends):
+            group[records_key] = self.records.to_records(start, end)
+            start = end
+        return groups
+
+    def to_frame(self, columns):
+        """
+        Create a long-format DataFrame of the stored records, indexed
+        by the timestamp of their group and asset symbol, along with
+        the simulation event type of their group.
+
+        Parameters
+        ----------
+        columns : `dict{str: str}`
+            The DataFrame column name of each record column.
+
+        Returns
+        -------
+        `pd.DataFrame`
+            The (Date, Asset) indexed DataFrame.
+        """
+        groups = np.repeat(
+            np.arange(len(self.groups)), np.diff(self.group_ends, prepend=0)
+        )
+        dates = np.array(self.groups.columns['date'], dtype=object)[groups]
+        events = np.array(self.groups.columns['event'], dtype=object)[groups]
+        return self.records.to_frame(columns, dates=dates, events=events)
+
+
+class StatsRecorder(object):
+    """
+    Records the statistics of a backtest into columnar storage,
+    at a configurable granularity:
+
+    * 'event' - Portfolio snapshots at every simulation event along
+      with the weights, portfolios and orders of every rebalance,
+      executed orders and dividends.
+    * 'rebalance' - As 'event', but portfolio snapshots (and their
+      dates and events) are only recorded at rebalances.
+    * 'off' - Only the equity curve is recorded.
+
+    Values are copied into the storage as they are recorded, such that
+    callers need not copy the dictionaries they provide.
+
+    The recorded statistics are accessible via dictionary-like syntax
+    as lists of dictionaries, e.g. ``recorder['alpha_weights']``.
+
+    If a sink is provided the equity curve, portfolio snapshots,
+    rebalance orders, executed orders and dividends are streamed to it
+    as flat records while the backtest runs. Other than the equity
+    curve, these are then not retained in memory.
+
+    Parameters
+    ----------
+    granularity : `str`, optional
+        The granularity at which to record statistics.
+    sink : `JSONLinesStatsSink`, optional
+        The optional sink to stream statistics to.
+    """
+
+    def __init__(self, granularity='event', sink=None):
+        if granularity not in STATS_GRANULARITIES:
+            raise ValueError(
+                'Unknown statistics granularity "%s" provided. Must be '
+                'one of %s.' % (granularity, ', '.join(STATS_GRANULARITIES))
+            )
+        self.granularity = granularity
+        self.sink = sink
+        self.reset()
+
+    def reset(self, num_events=0, num_rebalances=0, assets=()):
+        """
+        Discard all recorded statistics, preallocating storage for
+        a new backtest.
+
+        Parameters
+        ----------
+        num_events : `int`, optional
+            The expected number of simulation events.
+        num_rebalances : `int`, optional
+            The expected number of rebalances.
+        assets : `list[str]`, optional
+            The expected assets.
+        """
+        if self.granularity == 'event':
+            num_snapshots = num_events
+        elif self.granularity == 'rebalance':
+            num_snapshots = num_rebalances
+        else:
+            num_snapshots = 0
+
+        self.snapshots = AssetPanel(
+            ['net_quantity', 'market_value', 'current_price'],
+            row_fields=['cash'], assets=assets, capacity=num_snapshots
+        )
+        self.weights = {
+            key: AssetPanel(['weight'], assets=assets, capacity=num_rebalances)
+            for key in WEIGHTS_KEYS
+        }
+        self.portfolios = {
+            'target_portfolio': AssetPanel(
+                ['quantity', 'sizing_price'],
+                assets=assets, capacity=num_rebalances
+            ),
+            'current_portfolio': AssetPanel(
+                [
+                    'quantity', 'market_value', 'unrealised_pnl',
+                    'realised_pnl', 'total_pnl'
+                ],
+                assets=assets, capacity=num_rebalances
+            )
+        }
+        self.rebalance_orders = GroupedRecordTable(
+            [], ['asset', 'quantity', 'order_id']
+        )
+        self.executed_orders = RecordTable(
+            ['date', 'asset', 'quantity', 'price', 'order_id', 'commission']
+        )
+        self.dividends = GroupedRecordTable(
+            ['total_cash_dividend', 'total_reinvested_quantity'],
+            [
+                'asset', 'dividend', 'quantity', 'cash_dividend',
+                'reinvest_price', 'reinvested_quantity'
+            ]
+        )
+        self.equity_dates = []
+        self.equity = []
+        if self.sink is not None:
+            self.sink.open()
+
+    def close(self):
+        """
+        Write any statistics buffered by the sink upon
+        completion of the backtest.
+        """
+        if self.sink is not None:
+            self.sink.close()
+
+    @property
+    def records_rebalances(self):
+        """
+        Whether rebalance, order and dividend statistics are recorded.
+        """
+        return self.granularity != 'off'
+
+    def records_snapshot(self, is_rebalance):
+        """
+        Whether a portfolio snapshot is recorded for a simulation event.
+
+        Parameters
+        ----------
+        is_rebalance : `Boolean`
+            Whether the simulation event is a rebalance.
+
+        Returns
+        -------
+        `Boolean`
+            Whether to record a snapshot.
+        """
+        return self.granularity == 'event' or (
+            self.granularity == 'rebalance' and is_rebalance
+        )
+
+    def record_snapshot(
+        self, dt, event_type, assets, net_quantities,
+        market_values, current_prices, cash
+    ):
+        """
+        Record a snapshot of the portfolio holdings and cash.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The timestamp of the snapshot.
+        event_type : `str`
+            The simulation event type of the snapshot.
+        assets : `list[str]`
+            The held asset symbols.
+        net_quantities : `list[float]`
+            The net quantities of the held assets.
+        market_values : `list[float]`
+            The market values of the held assets.
+        current_prices : `list[float]`
+            The current prices of the held assets.
+        cash : `float`
+            The portfolio cash balance.
+        """
+        if self.sink is not None:
+            self.sink.write(
+                'portfolio_snapshots',
+                self._snapshot_records(
+                    dt, event_type, assets, net_quantities,
+                    market_values, current_prices, cash
+                )
+            )
+            return
+        self.snapshots.append(
+            dt, event_type, assets,
+            {
+                'net_quantity': net_quantities,
+                'market_value': market_values,
+                'current_price': current_prices
+            },
+            row_values={'cash': cash}
+        )
+
+    def record_snapshots(
+        self, dts, event_types, assets, net_quantities,
+        market_values, current_prices, cash
+    ):
+        """
+        Record snapshots of the same portfolio holdings at many
+        simulation events.
+
+        Parameters
+        ----------
+        dts : `list[pd.Timestamp]`
+            The timestamps of the snapshots.
+        event_types : `list[str]`
+            The simulation event types of the snapshots.
+        assets : `list[str]`
+            The held asset symbols.
+        net_quantities : `np.ndarray`
+            The (timestamps x assets) net quantities.
+        market_values : `np.ndarray`
+            The (timestamps x assets) market values.
+        current_prices : `np.ndarray`
+            The (timestamps x assets) current prices.
+        cash : `np.ndarray`
+            The portfolio cash balance at each timestamp.
+        """
+        if self.sink is not None:
+            net_quantities = np.asarray(net_quantities).tolist()
+            market_values = np.asarray(market_values).tolist()
+            current_prices = np.asarray(current_prices).tolist()
+            cash = np.asarray(cash).tolist()
+            for row, dt in enumerate(dts):
+                self.sink.write(
+                    'portfolio_snapshots',
+                    self._snapshot_records(
+                        dt, event_types[row], assets, net_quantities[row],
+                        market_values[row], current_prices[row], cash[row]
+                    )
+                )
+            return
+        self.snapshots.extend(
+            dts, event_types, assets,
+            {
+                'net_quantity': net_quantities,
+                'market_value': market_values,
+                'current_price': current_prices
+            },
+            row_values={'cash': cash}
+        )
+
+    def record_weights(self, key, dt, event_type, weights):
+        """
+        Record a weight vector of a rebalance.
+
+        Parameters
+        ----------
+        key : `str`
+            One of 'alpha_weights', 'risk_weights' or 'optimised_weights'.
+        dt : `pd.Timestamp`
+            The timestamp of the rebalance.
+        event_type : `str`
+            The simulation event type of the rebalance.
+        weights : `dict{str: float}`
+            The asset symbol keyed weights.
+        """
+        self.weights[key].append(
+            dt, event_type, list(weights.keys()),
+            {'weight': list(weights.values())}
+        )
+
+    def record_portfolio(self, key, dt, event_type, portfolio):
+        """
+        Record a portfolio of a rebalance.
+
+        Parameters
+        ----------
+        key : `str`
+            One of 'target_portfolio' or 'current_portfolio'.
+        dt : `pd.Timestamp`
+            The timestamp of the rebalance.
+        event_type : `str`
+            The simulation event type of the rebalance.
+        portfolio : `dict{str: dict}`
+            The asset symbol keyed portfolio details.
+        """
+        panel = self.portfolios[key]
+        assets = list(portfolio.keys())
+        panel.append(
+            dt, event_type, assets,
+            {
+                field: [portfolio[asset][field] for asset in assets]
+                for field in panel.fields
+            }
+        )
+
+    def record_rebalance_orders(self, dt, event_type, orders):
+        """
+        Record the orders generated by a rebalance.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The timestamp of the rebalance.
+        event_type : `str`
+            The simulation event type of the rebalance.
+        orders : `list[Order]`
+            The rebalance orders.
+        """
+        if self.sink is not None:
+            self.sink.write('rebalance_orders', [
+                {
+                    'date': dt,
+                    'event': event_type,
+                    'asset': order.asset,
+                    'quantity': order.quantity,
+                    'order_id': order.order_id
+                } for order in orders
+            ])
+            return
+        self.rebalance_orders.append(
+            {'date': dt, 'event': event_type},
+            [
+                {
+                    'asset': order.asset,
+                    'quantity': order.quantity,
+                    'order_id': order.order_id
+                } for order in orders
+            ]
+        )
+
+    def record_executed_orders(self, executed_orders):
+        """
+        Record orders executed by the broker.
+
+        Parameters
+        ----------
+        executed_orders : `list[dict]`
+            The executed order details.
+        """
+        if self.sink is not None:
+            self.sink.write('executed_orders', executed_orders)
+            return
+        for executed_order in executed_orders:
+            self.executed_orders.append(executed_order)
+
+    def record_dividends(self, daily_dividends):
+        """
+        Record the dividends paid at a market close.
+
+        Parameters
+        ----------
+        daily_dividends : `dict`
+            The aggregated dividends, with the individual asset
+            dividends under the 'dividends' key.
+        """
+        if self.sink is not None:
+            self.sink.write('dividends', [
+                dict(
+                    dividend,
+                    date=daily_dividends['date'],
+                    event=daily_dividends['event']
+                ) for dividend in daily_dividends['dividends']
+            ])
+            return
+        self.dividends.append(daily_dividends, daily_dividends['dividends'])
+
+    def record_equity(self, dt, equity):
+        """
+        Record a point of the equity curve.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The timestamp of the total equity.
+        equity : `float`
+            The total account equity.
+        """
+        self.equity_dates.append(dt)
+        self.equity.append(equity)
+        if self.sink is not None:
+            self.sink.write('equity_curve', [{'date': dt, 'equity': equity}])
+
+    @staticmethod
+    def _snapshot_records(
+        dt, event_type, assets, net_quantities,
+        market_values, current_prices, cash
+    ):
+        """
+        Create the flat records of a portfolio snapshot, with a record
+        per held asset followed by a 'Cash' record.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The timestamp of the snapshot.
+        event_type : `str`
+            The simulation event type of the snapshot.
+        assets : `list[str]`
+            The held asset symbols.
+        net_quantities : `list[float]`
+            The net quantities of the held assets.
+        market_values : `list[float]`
+            The market values of the held assets.
+        current_prices : `list[float]`
+            The current prices of the held assets.
+        cash : `float`
+            The portfolio cash balance.
+
+        Returns
+        -------
+        `list[dict]`
+            The snapshot records.
+        """
+        records = [
+            {
+                'date': dt,
+                'event': event_type,
+                'asset': asset,
+                'net_quantity': net_quantity,
+                'market_value': market_value,
+                'current_price': current_price
+            } for asset, net_quantity, market_value, current_price in zip(
+                assets, net_quantities, market_values, current_prices
+            )
+        ]
+        records.append({
+            'date': dt,
+            'event': event_type,
+            'asset': 'Cash',
+            'net_quantity': None,
+            'market_value': cash,
+            'current_price': None
+        })
+        return records
+
+    def _snapshots_to_dicts(self):
+        """
+        Reconstruct the portfolio snapshots as dictionaries.
+
+        Returns
+        -------
+        `list[dict]`
+            The portfolio snapshots.
+        """
+        panel = self.snapshots
+        snapshots = []
+        for row, (dt, event_type, assets, cols) in enumerate(panel.rows()):
+            values = {
+                field: panel.values[field][row, cols].tolist()
+                for field in panel.fields
+            }
+            snapshots.append({
+                'date': dt,
+                'assets': {
+                    asset: {
+                        field: values[field][idx] for field in panel.fields
+                    } for idx, asset in enumerate(assets)
+                },
+                'cash': float(panel.row_values['cash'][row])
+            })
+        return snapshots
+
+    def _weights_to_dicts(self, key):
+        """
+        Reconstruct the weight vectors as dictionaries.
+
+        Parameters
+        ----------
+        key : `str`
+            One of 'alpha_weights', 'risk_weights' or 'optimised_weights'.
+
+        Returns
+        -------
+        `list[dict]`
+            The weight vectors of each rebalance.
+        """
+        panel = self.weights[key]
+        return [
+            {
+                'date': dt,
+                'event': event_type,
+                'weights': dict(zip(assets, panel.values['weight'][row, cols].tolist()))
+            } for row, (dt, event_type, assets, cols) in enumerate(panel.rows())
+        ]
+
+    def _portfolios_to_dicts(self, key):
+        """
+        Reconstruct the portfolios as dictionaries.
+
+        Parameters
+        ----------
+        key : `str`
+            One of 'target_portfolio' or 'current_portfolio'.
+
+        Returns
+        -------
+        `list[dict]`
+            The portfolios of each rebalance.
+        """
+        panel = self.portfolios[key]
+        portfolios = []
+        for row, (dt, event_type, assets, cols) in enumerate(panel.rows()):
+            values = {
+                field: panel.values[field][row, cols].tolist()
+                for field in panel.fields
+            }
+            portfolios.append({
+                'date': dt,
+                'event': event_type,
+                'portfolio': {
+                    asset: {
+                        field: values[field][idx] for field in panel.fields
+                    } for idx, asset in enumerate(assets)
+                }
+            })
+        return portfolios
+
+    def to_dataframes(self):
+        """
+        Create long-format DataFrames of the recorded statistics.
+
+        The equity curve is indexed by timestamp, while all other
+        statistics are indexed by timestamp and asset symbol. Portfolio
+        snapshots include a 'Cash' asset for the cash balance. Only
+        statistics with recorded values are included.
+
+        Returns
+        -------
+        `dict{str: pd.DataFrame}`
+            The statistics name keyed DataFrames.
+        """
+        stats_dfs = {
+            'equity_curve': pd.DataFrame(
+                {'Equity': self.equity},
+                index=pd.DatetimeIndex(self.equity_dates, name='Date')
+            )
+        }
+        if len(self.snapshots) > 0:
+            stats_dfs['portfolio_snapshots'] = self.snapshots.to_frame(
+                {
+                    'net_quantity': 'NetQuantity',
+                    'market_value': 'MarketValue',
+                    'current_price': 'CurrentPrice'
+                },
+                row_columns={'cash': ('Cash', 'MarketValue')}
+            )
+        for key in WEIGHTS_KEYS:
+            if len(self.weights[key]) > 0:
+                stats_dfs[key] = self.weights[key].to_frame({'weight': 'Weight'})
+        if len(self.portfolios['target_portfolio']) > 0:
+            stats_dfs['target_portfolio'] = self.portfolios['target_portfolio'].to_frame(
+                {'quantity': 'Quantity', 'sizing_price': 'SizingPrice'}
+            )
+        if len(self.portfolios['current_portfolio']) > 0:
+            stats_dfs['current_portfolio'] = self.portfolios['current_portfolio'].to_frame(
+                {
+                    'quantity': 'Quantity',
+                    'market_value': 'MarketValue',
+                    'unrealised_pnl': 'UnrealisedPnL',
+                    'realised_pnl': 'RealisedPnL',
+                    'total_pnl': 'TotalPnL'
+                }
+            )
+        if len(self.rebalance_orders.records) > 0:
+            stats_dfs['rebalance_orders'] = self.rebalance_orders.to_frame(
+                {'quantity': 'Quantity', 'order_id': 'OrderID'}
+            )
+        if len(self.executed_orders) > 0:
+            stats_dfs['executed_orders'] = self.executed_orders.to_frame(
+                {
+                    'quantity': 'Quantity',
+                    'price': 'Price',
+                    'commission': 'Commission',
+                    'order_id': 'OrderID'
+                }
+            )
+        if len(self.dividends.records) > 0:
+            stats_dfs['dividends'] = self.dividends.to_frame(
+                {
+                    'dividend': 'Dividend',
+                    'quantity': 'Quantity',
+                    'cash_dividend': 'CashDividend',
+                    'reinvest_price': 'ReinvestPrice',
+                    'reinvested_quantity': 'ReinvestedQuantity'
+                }
+            )
+        return stats_dfs
+
+    def keys(self):
+        """
+        Obtain the names of the recorded statistics.
+
+        Returns
+        -------
+        `list[str]`
+            The statistics names.
+        """
+        return [
+            'dates', 'events', 'alpha_weights', 'risk_weights',
+            'optimised_weights', 'target_portfolio', 'current_portfolio',
+            'rebalance_orders', 'executed_orders', 'equity_curve',
+            'portfolio_snapshots', 'dividends'
+        ]
+
+    def __contains__(self, key):
+        return key in self.keys()
+
+    def __getitem__(self, key):
+        """
+        Reconstruct a recorded statistic as a list.
+
+        Parameters
+        ----------
+        key : `str`
+            The statistic name.
+
+        Returns
+        -------
+        `list`
+            The recorded statistic.
+        """
+        if key == 'dates':
+            return list(self.snapshots.timestamps())
+        elif key == 'events':
+            return self.snapshots.events[:len(self.snapshots)].tolist()
+        elif key in WEIGHTS_KEYS:
+            return self._weights_to_dicts(key)
+        elif key in PORTFOLIO_KEYS:
+            return self._portfolios_to_dicts(key)
+        elif key == 'rebalance_orders':
+            return self.rebalance_orders.to_groups('orders')
+        elif key == 'executed_orders':
+            return self.executed_orders.to_records()
+        elif key == 'equity_curve':
+            return list(zip(self.equity_dates, self.equity))
+        elif key == 'portfolio_snapshots':
+            return self._snapshots_to_dicts()
+        elif key == 'dividends':
+            return self.dividends.to_groups('dividends')
+        raise KeyError('Unknown statistic "%s" requested.' % key)
@@ -0,0 +1,155 @@
+import json
+import math
+import os
+
+import numpy as np
+import pandas as pd
+
+
+SINK_STREAMS = (
+    'equity_curve', 'portfolio_snapshots', 'rebalance_orders',
+    'executed_orders', 'dividends'
+)
+
+
+def _json_value(value):
+    """
+    Convert a recorded value into a JSON-serialisable value.
+
+    Parameters
+    ----------
+    value : `object`
+        The recorded value.
+
+    Returns
+    -------
+    `object`
+        The JSON-serialisable value, with timestamps as ISO 8601
+        strings and NaN as None.
+    """
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+
+class JSONLinesStatsSink(object):
+    """
+    Streams backtest statistics to append-only JSON lines files
+    while the backtest runs, rather than retaining them in memory.
+
+    Each statistic is written to its own file within the directory,
+    e.g. 'executed_orders.jsonl', with one flat record per line.
+    Records are buffered and appended in batches, such that the files
+    can be tailed to follow the progress of a running backtest.
+
+    Parameters
+    ----------
+    directory : `str`
+        The directory in which to write the statistics files.
+    batch_size : `int`, optional
+        The number of records of a statistic to buffer before
+        appending them to its file.
+    """
+
+    def __init__(self, directory, batch_size=1000):
+        self.directory = directory
+        self.batch_size = batch_size
+        self.buffers = {stream: [] for stream in SINK_STREAMS}
+
+    def path(self, stream):
+        """
+        Obtain the file path of a statistic.
+
+        Parameters
+        ----------
+        stream : `str`
+            The statistic name.
+
+        Returns
+        -------
+        `str`
+            The file path.
+        """
+        return os.path.join(self.directory, '%s.jsonl' % stream)
+
+    def open(self):
+        """
+        Create the statistics files, discarding any records written
+        by a previous backtest.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        for stream in SINK_STREAMS:
+            open(self.path(stream), 'w').close()
+            self.buffers[stream] = []
+
+    def write(self, stream, records):
+        """
+        Buffer records of a statistic, appending them to its file
+        once the batch size is reached.
+
+        Parameters
+        ----------
+        stream : `str`
+            The statistic name.
+        records : `list[dict]`
+            The flat records.
+        """
+        buffer = self.buffers[stream]
+        buffer.extend(records)
+        if len(buffer) >= self.batch_size:
+            self._flush_stream(stream)
+
+    def _flush_stream(self, stream):
+        """
+        Append the buffered records of a statistic to its file.
+
+        Parameters
+        ----------
+        stream : `str`
+            The statistic name.
+        """
+        buffer = self.buffers[stream]
+        if len(buffer) == 0:
+            return
+        with open(self.path(stream), 'a') as stream_file:
+            stream_file.write(''.join(
+                json.dumps(
+                    {key: _json_value(value) for key, value in record.items()}
+                ) + '\n' for record in buffer
+            ))
+        self.buffers[stream] = []
+
+    def flush(self):
+        """
+        Append the buffered records of all statistics to their files.
+        """
+        for stream in SINK_STREAMS:
+            self._flush_stream(stream)
+
+    def close(self):
+        """
+        Append any remaining buffered records upon completion
+        of the backtest.
+        """
+        self.flush()
+
+    def read(self, stream):
+        """
+        Read the written records of a statistic.
+
+        Parameters
+        ----------
+        stream : `str`
+            The statistic name.
+
+        Returns
+        -------
+        `list[dict]`
+            The flat records.
+        """
+        with open(self.path(stream), 'r') as stream_file:
+            return [json.loads(line) for line in stream_file if line.strip()]
@@ -160,8 +160,8 @@ class QuantTradingSystem(object):
         ----------
         dt : `pd.Timestamp`
             The current time.
-        stats : `dict`, optional
-            An optional statistics dictionary to append values to
+        stats : `StatsRecorder`, optional
+            An optional statistics recorder to record values to
             throughout the simulation lifetime.
 
         Returns
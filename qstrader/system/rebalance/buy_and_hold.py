@@ -33,15 +33,34 @@ class BuyAndHoldRebalance(Rebalance):
     def _generate_rebalances(self):
         """
         Outputs the rebalance timestamp offset to the next
-        business day.
+        trading day of the master trading calendar, or to the
+        next business day if no data is available.
 
-        Does not include holidays.
+        Does not include holidays when offsetting by business day.
 
         Returns
         -------
         `list[pd.Timestamp]`
             The rebalance timestamp list.
         """
+        if self.data_handler is not None and self.data_handler.data_sources:
+            available_days = self.data_handler.get_trading_days()
+            position = available_days.searchsorted(self.start_dt.normalize())
+            if position < len(available_days):
+                trading_date = available_days[position].date()
+                if trading_date == self.start_dt.date():
+                    return [self.start_dt]
+                # Retain the (local) time of day of the starting datetime
+                if self.start_dt.tz is None:
+                    local_start_dt = self.start_dt
+                else:
+                    local_start_dt = self.start_dt.tz_localize(None)
+                rebalance_date = pd.Timestamp(trading_date) + (
+                    local_start_dt - local_start_dt.normalize()
+                )
+                if self.start_dt.tz is not None:
+                    rebalance_date = rebalance_date.tz_localize(self.start_dt.tz)
+                return [rebalance_date]
         if not self._is_business_day():
             rebalance_date = self.start_dt + BusinessDay()
         else:
@@ -61,25 +61,10 @@ class DailyRebalance(Rebalance):
         )
 
         if self.data_handler.data_sources:
-
-            longest_asset = self.data_handler.get_longest_asset()
-            
-            if longest_asset is None:  # Handle case where no data is loaded
-                return []
-            
-            available_days = self.data_handler.data_sources[0].asset_bar_frames[longest_asset].index  # Use the first data frame
-            # Filter rebalance_dates first
-            filtered_rebalance_dates = [
-                date for date in rebalance_dates if date in available_days
-            ]
-
-            # Then create rebalance_times
-            rebalance_times = [
-                pd.Timestamp(
-                    "%s %s" % (date, self.market_time), tz='America/New_York'
-                )
-                for date in filtered_rebalance_dates
-            ]
-            return rebalance_times
+            available_days = self.data_handler.get_trading_days()
+            return self._rebalance_times(
+                rebalance_dates[rebalance_dates.isin(available_days)],
+                self.market_time
+            )
         else:
             return []
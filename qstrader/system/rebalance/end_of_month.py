@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytz
 
@@ -56,31 +57,25 @@ class EndOfMonthRebalance(Rebalance):
 
     def _generate_rebalances(self):
         if self.data_handler.data_sources:
-
-            longest_asset = self.data_handler.get_longest_asset()
-            
-            if longest_asset is None:
+            available_days = self.data_handler.get_trading_days()
+            if len(available_days) == 0:
                 return []
-            
-            available_days = self.data_handler.data_sources[0].asset_bar_frames[longest_asset].index
-            
-            rebalance_dates = []
-            for (year, month), month_df in available_days.to_series().groupby([available_days.year, available_days.month]):
-                last_day = month_df.index.max()  # Last available day of the month
-                rebalance_dates.append(last_day)
 
-            # Ensure rebalances are within start/end date range
-            filtered_rebalance_dates = [
-                date for date in rebalance_dates
-                if self.start_dt.date() <= date.date() <= self.end_dt.date()
-            ]
+            # Last available day of each month
+            months = np.asarray(available_days.year * 12 + available_days.month)
+            rebalance_dates = available_days[np.append(months[1:] != months[:-1], True)]
 
-            rebalance_times = [
-                 pd.Timestamp(
-                    "%s %s" % (date, self.market_time), tz='America/New_York'
-                )
-                for date in filtered_rebalance_dates
-            ]
-            return rebalance_times
+            # Ensure rebalances are within start/end date range
+            local_dates = (
+                rebalance_dates if rebalance_dates.tz is None
+                else rebalance_dates.tz_localize(None)
+            ).normalize()
+            within_range = (
+                (local_dates >= pd.Timestamp(self.start_dt.date())) &
+                (local_dates <= pd.Timestamp(self.end_dt.date()))
+            )
+            return self._rebalance_times(
+                rebalance_dates[within_range], self.market_time
+            )
         else:
             return []
@@ -1,5 +1,7 @@
 from abc import ABCMeta, abstractmethod
 
+import pandas as pd
+
 
 class Rebalance(object):
     """
@@ -14,3 +16,30 @@ class Rebalance(object):
         raise NotImplementedError(
             "Should implement output_rebalances()"
         )
+
+    @staticmethod
+    def _rebalance_times(dates, market_time):
+        """
+        Combine each rebalance date with the market time of the
+        rebalance, as America/New_York timestamps.
+
+        Parameters
+        ----------
+        dates : `pd.DatetimeIndex`
+            The rebalance dates.
+        market_time : `str`
+            The string representation of the market time.
+
+        Returns
+        -------
+        `list[pd.Timestamp]`
+            The rebalance timestamps.
+        """
+        dates = pd.DatetimeIndex(dates)
+        if dates.tz is None:
+            times = dates.normalize() + pd.Timedelta(market_time)
+            times = times.tz_localize('America/New_York')
+        else:
+            times = dates.tz_localize(None).normalize() + pd.Timedelta(market_time)
+            times = times.tz_localize(dates.tz).tz_convert('America/New_York')
+        return times.as_unit('s').tolist()
@@ -91,34 +91,26 @@ class WeeklyRebalance(Rebalance):
             freq=f'W-{self.weekday}'
         )
         if self.data_handler.data_sources:
-            
-            longest_asset = self.data_handler.get_longest_asset()
-            
-            if longest_asset is None:
-                return []
-            
-            available_days = self.data_handler.data_sources[0].asset_bar_frames[longest_asset].index
+            available_days = self.data_handler.get_trading_days()
 
-            filtered_rebalance_dates = []
-            for date in rebalance_dates:
-                if date in available_days:
-                    filtered_rebalance_dates.append(date)
-                else:
-                    # Find the next available trading day within the same week
-                    next_day = date + pd.Timedelta(days=1)
-                    while next_day.week == date.week and next_day <= self.end_date:
-                        if next_day in available_days:
-                            filtered_rebalance_dates.append(next_day)
-                            break  # Important: Exit inner loop once a valid day is found
-                        next_day += pd.Timedelta(days=1)
-            #convert to time
-            rebalance_times = [
-                pd.Timestamp(
-                    "%s %s" % (date, self.pre_market_time), tz='America/New_York'
-                )
-                for date in filtered_rebalance_dates
-            ]
-            return rebalance_times
+            # Rebalance on the first available trading day on or after
+            # each weekday, provided it occurs within the same week
+            rebalance_dates = rebalance_dates.normalize()
+            positions = available_days.searchsorted(rebalance_dates)
+            found = positions < len(available_days)
+            rebalance_dates = rebalance_dates[found]
+            trading_days = available_days[positions[found]]
+            same_week = (
+                (trading_days - rebalance_dates < pd.Timedelta(days=7)) &
+                (
+                    trading_days.isocalendar().week.to_numpy() ==
+                    rebalance_dates.isocalendar().week.to_numpy()
+                ) &
+                (trading_days <= self.end_date)
+            )
+            return self._rebalance_times(
+                trading_days[same_week], self.pre_market_time
+            )
 
         else:
             return []
@@ -1,8 +1,6 @@
 import os
 
-# for stats deep copy
-import copy
-
+import numpy as np
 import pandas as pd
 
 from qstrader.asset.equity import Equity
@@ -10,8 +8,11 @@ from qstrader.broker.simulated_broker import SimulatedBroker
 from qstrader.broker.fee_model.zero_fee_model import ZeroFeeModel
 from qstrader.data.backtest_data_handler import BacktestDataHandler
 from qstrader.data.daily_bar_csv import CSVDailyBarDataSource
+from qstrader.data.event_price_handler import EventPriceDataHandler
+from qstrader.data.latest_prices import get_assets_latest_prices
 from qstrader.exchange.simulated_exchange import SimulatedExchange
 from qstrader.simulation.daily_bday import DailyBusinessDaySimulationEngine
+from qstrader.statistics.recorder import StatsRecorder
 from qstrader.system.qts import QuantTradingSystem
 from qstrader.system.rebalance.buy_and_hold import BuyAndHoldRebalance
 from qstrader.system.rebalance.daily import DailyRebalance
@@ -66,6 +67,21 @@ class BacktestTradingSession(TradingSession):
     burn_in_dt : `pd.Timestamp`, optional
         The optional date provided to begin tracking strategy statistics,
         which is used for strategies requiring a period of data 'burn in'
+    process_dividends : `Boolean`, optional
+        Whether to credit dividends of held assets to the portfolio.
+    reinvest_dividends : `Boolean`, optional
+        Whether to reinvest any credited dividends.
+    stats_recorder : `StatsRecorder`, optional
+        The recorder of the backtest statistics, which determines the
+        granularity at which they are recorded. Defaults to recording
+        at every simulation event.
+    array_positions : `Boolean`, optional
+        Whether to store the portfolio positions within an array-backed
+        ArrayPositionHandler, which calculates the portfolio totals in
+        vectorised form.
+    max_history : `int`, optional
+        If provided, the portfolio retains only its most recent
+        'max_history' history events.
     """
 
     def __init__(
@@ -87,6 +103,9 @@ class BacktestTradingSession(TradingSession):
         data_handler=None,
         process_dividends = False,
         reinvest_dividends = False,
+        stats_recorder=None,
+        array_positions=False,
+        max_history=None,
         **kwargs
     ):
         self.start_dt = start_dt
@@ -103,6 +122,11 @@ class BacktestTradingSession(TradingSession):
         self.long_only = long_only
         self.fee_model = fee_model
         self.burn_in_dt = burn_in_dt
+        self.array_positions = array_positions
+        self.max_history = max_history
+        self.stats_recorder = (
+            stats_recorder if stats_recorder is not None else StatsRecorder()
+        )
 
         self.exchange = self._create_exchange()
         self.data_handler = self._create_data_handler(data_handler)
@@ -164,7 +188,41 @@ class BacktestTradingSession(TradingSession):
         `Boolean`
             Whether the timestamp is part of the rebalance schedule.
         """
-        return dt in self.rebalance_schedule
+        return dt.value in self._rebalance_lookup
+
+    @property
+    def rebalance_schedule(self):
+        """
+        The list of rebalance timestamps of the backtest.
+
+        Returns
+        -------
+        `List[pd.Timestamp]`
+            The list of rebalance timestamps.
+        """
+        return self._rebalance_schedule
+
+    @rebalance_schedule.setter
+    def rebalance_schedule(self, rebalance_schedule):
+        """
+        Set the rebalance timestamps, indexing them by their integer
+        nanoseconds since the epoch such that checking whether a
+        timestamp is a rebalance is a constant time set lookup,
+        rather than a scan of the list.
+
+        Timezone-naive timestamps never equal the timezone-aware
+        simulation event timestamps and so are excluded.
+
+        Parameters
+        ----------
+        rebalance_schedule : `List[pd.Timestamp]`
+            The list of rebalance timestamps.
+        """
+        self._rebalance_schedule = rebalance_schedule
+        self._rebalance_lookup = frozenset(
+            pd.Timestamp(rebalance_dt).value for rebalance_dt in rebalance_schedule
+            if pd.Timestamp(rebalance_dt).tz is not None
+        )
 
     def _create_exchange(self):
         """
@@ -238,7 +296,9 @@ class BacktestTradingSession(TradingSession):
             self.data_handler,
             account_id=self.account_name,
             initial_funds=self.initial_cash,
-            fee_model=self.fee_model
+            fee_model=self.fee_model,
+            array_positions=self.array_positions,
+            max_history=self.max_history
         )
         broker.create_portfolio(self.portfolio_id, self.portfolio_name)
         broker.subscribe_funds_to_portfolio(self.portfolio_id, self.initial_cash)
@@ -344,7 +404,7 @@ class BacktestTradingSession(TradingSession):
 
         return qts
 
-    def _update_equity_curve(self, dt,stats):
+    def _update_equity_curve(self, dt, stats):
         """
         Update the equity curve values.
 
@@ -352,6 +412,8 @@ class BacktestTradingSession(TradingSession):
         ----------
         dt : `pd.Timestamp`
             The time at which the total account equity is obtained.
+        stats : `StatsRecorder`
+            The statistics recorder.
         """
 
         total_equity = self.broker.get_account_total_equity()["master"]
@@ -359,29 +421,35 @@ class BacktestTradingSession(TradingSession):
             (dt, total_equity)
         )
 
-        stats['equity_curve'].append((dt, total_equity))
+        stats.record_equity(dt, total_equity)
 
-    def _record_portfolio_snapshot(self, dt, stats):
+    def _record_portfolio_snapshot(self, dt, event_type, stats):
         """
         Records a snapshot of the portfolio, including asset details and cash.
-        """
-        snapshot = {
-            'date': dt,
-            'assets': {}
-        }
 
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The time at which the snapshot is recorded.
+        event_type : `str`
+            The simulation event type.
+        stats : `StatsRecorder`
+            The statistics recorder.
+        """
         # Get current portfolio holdings from the broker.  This is the key.
         current_portfolio = self.broker.get_portfolio_as_dict(self.portfolio_id)
+        assets = list(current_portfolio.keys())
 
-        for asset, details in current_portfolio.items():
-            snapshot['assets'][asset] = {
-                'net_quantity': details['quantity'],
-                'market_value': details['market_value'],
-                'current_price': self.data_handler.get_asset_latest_mid_price(dt, asset)  # Get *current* price
-            }
+        # Get *current* prices for all held assets in a single pass
+        current_prices = get_assets_latest_prices(self.data_handler, dt, assets, 'mid')
 
-        snapshot['cash'] = self.broker.get_portfolio_cash_balance(self.portfolio_id)  # Explicitly get portfolio cash
-        stats['portfolio_snapshots'].append(copy.deepcopy(snapshot))
+        stats.record_snapshot(
+            dt, event_type, assets,
+            [details['quantity'] for details in current_portfolio.values()],
+            [details['market_value'] for details in current_portfolio.values()],
+            current_prices,
+            self.broker.get_portfolio_cash_balance(self.portfolio_id)
+        )
 
 
 
@@ -427,194 +495,386 @@ class BacktestTradingSession(TradingSession):
   
     def get_stats_dataframe(self):
         """
-        Creates DataFrames from the stats dictionary.
-        """
-        stats_dfs = {}
-
-        # Handle simple time series data (like equity_curve)
-        if 'equity_curve' in self.stats:
-            stats_dfs['equity_curve'] = pd.DataFrame(
-                self.stats['equity_curve'], columns=['Date', 'Equity']
-            ).set_index('Date')
-
-        # Handle portfolio snapshots.  NEW BLOCK.
-        if 'portfolio_snapshots' in self.stats:
-            df_list = []
-            for snapshot in self.stats['portfolio_snapshots']:
-                date = snapshot['date']
-                assets_data = snapshot['assets']
-                cash = snapshot['cash']
-
-                # Create a list of dictionaries, one for each asset
-                asset_rows = []
-                for asset, details in assets_data.items():
-                    row = {
-                        'Date': date,
-                        'Asset': asset,
-                        'NetQuantity': details['net_quantity'],
-                        'MarketValue': details['market_value'],
-                        'CurrentPrice': details['current_price'],
-                    }
-                    asset_rows.append(row)
-
-                # Add cash as a separate entry
-                asset_rows.append({
-                    'Date': date,
-                    'Asset': 'Cash',  # Use a consistent label for cash
-                    'NetQuantity': None,  # Cash doesn't have a quantity
-                    'MarketValue': cash,
-                    'CurrentPrice': None,  # Cash doesn't have a price
-                })
-                #creating individual dataframes
-                temp_df = pd.DataFrame(asset_rows)
-                if not temp_df.empty:
-                    temp_df.set_index('Date', inplace=True)
-                    df_list.append(temp_df)
-
-            if df_list:
-                stats_dfs['portfolio_snapshots'] = pd.concat(df_list)
-
-        # Handle weights/portfolio data
-        for key in [
-            'alpha_weights', 'risk_weights', 'optimised_weights',
-            'target_portfolio', 'current_portfolio', 'rebalance_orders',
-            'executed_orders'
-        ]:
-            if key in self.stats:
-                df_list = []
-                for entry in self.stats[key]:
-                    date = entry['date']
-                    event = entry.get('event', None)
-
-                    if key in ('target_portfolio', 'current_portfolio'):
-                        data = entry['portfolio']
-                    elif key in ('alpha_weights', 'risk_weights', 'optimised_weights'):
-                        data = entry['weights']
-                    elif key == 'rebalance_orders':
-                        data = entry['orders']
-                    elif key == 'executed_orders':
-                        data = entry
-
-                    else:
-                        data = None  # Should not happen
-
-                    if data is None:
-                        continue
+        Creates long-format DataFrames from the recorded statistics.
 
-                    # Handle dictionaries and lists of dictionaries
-                    if isinstance(data, dict):
-                        df_list.append(pd.DataFrame([data], index=[date]))
+        The equity curve is indexed by date, while the portfolio
+        snapshots, weights, portfolios, orders and dividends are
+        indexed by date and asset.
 
-                    elif isinstance(data, list):
-                        temp_df = pd.DataFrame(data)
-                        temp_df['Date'] = date
-                        temp_df['Event'] = event
-                        if not temp_df.empty:
-                            df_list.append(temp_df.set_index('Date'))
+        Returns
+        -------
+        `dict{str: pd.DataFrame}`
+            The statistics name keyed DataFrames.
+        """
+        return self.stats.to_dataframes()
 
+    def _process_event(self, event, stats):
+        """
+        Carry out the full event-driven logic for a single simulation
+        event, updating the broker, recording the portfolio and
+        rebalancing the quant trading system where scheduled.
 
-                    else:
-                        print(f"Unexpected data type for {key}: {type(data)}")
-                        continue
+        Parameters
+        ----------
+        event : `SimulationEvent`
+            The simulation event to process.
+        stats : `StatsRecorder`
+            The statistics recorder.
+        """
+        # Output the system event and timestamp
+        dt = event.ts
+        if settings.PRINT_EVENTS:
+            print("(%s) - %s" % (event.ts, event.event_type))
+
+        # Rebalance, order and dividend statistics are
+        # only provided to the models if being recorded
+        rebalance_stats = stats if stats.records_rebalances else None
+
+        # Update the simulated broker
+        self.broker.update(dt)
+
+        # if event.event_type == "market_open":
+        # might extend this in future to trade at current close or average of next open ohlc.
+        # so not filtering for market_open now. 
+        executed_orders = self.broker.get_executed_orders()
+        if executed_orders:
+            if rebalance_stats is not None:
+                rebalance_stats.record_executed_orders(executed_orders)
+            self.broker.clear_executed_orders() #reset after appending to stats
+
+        # Rebalances only occur once past the 'burn in' period
+        is_rebalance = (
+            (self.burn_in_dt is None or dt >= self.burn_in_dt) and
+            self._is_rebalance_event(dt)
+        )
+
+        if stats.records_snapshot(is_rebalance):
+            self._record_portfolio_snapshot(dt, event.event_type, stats)
+        
+        # Update any signals on a daily basis
+        if self.signals is not None and event.event_type == "market_close":
+            self.signals.update(dt)
+
+        # If we have hit a rebalance time then carry
+        # out a full run of the quant trading system
+        if is_rebalance:
+            if settings.PRINT_EVENTS:
+                print(
+                    "(%s) - trading logic "
+                    "and rebalance" % event.ts
+                )
+            self.qts(dt, event=event, stats=rebalance_stats)
+
+        # Out of market hours we want a daily
+        # performance update, but only if we
+        # are past the 'burn in' period
 
-                if df_list:
-                    stats_dfs[key] = pd.concat(df_list)
+        if self.dividend_model is not None and event.event_type == "market_close":
+            self.dividend_model(dt, event=event, stats=rebalance_stats)
 
-        return stats_dfs
+        if event.event_type == "market_close":
+            if self.burn_in_dt is not None:
+                if dt >= self.burn_in_dt:
+                    self._update_equity_curve(dt, stats)
+            else:
+                self._update_equity_curve(dt, stats)
 
-    def run(self, results=False):
+    def _add_vectorised_columns(self, assets, close_mask):
         """
-        Execute the simulation engine by iterating over all
-        simulation events, rebalancing the quant trading
-        system at the appropriate schedule.
+        Obtain the bid and ask prices (and dividends, if processed)
+        of the provided assets at every simulation event timestamp,
+        for those assets not already obtained.
 
         Parameters
         ----------
-        results : `Boolean`, optional
-            Whether to output the current portfolio holdings
+        assets : `list[str]`
+            The asset symbols to obtain columns for.
+        close_mask : `np.ndarray`
+            Whether each simulation event is a market close.
         """
-        if settings.PRINT_EVENTS:
-            print("Beginning backtest simulation...")
+        assets = [
+            asset for asset in dict.fromkeys(assets)
+            if asset not in self._vectorised_bids
+        ]
+        if len(assets) == 0:
+            return
+
+        event_times = self.sim_engine.event_times
+        bids = self.data_handler.get_assets_bid_prices_at(event_times, assets)
+        for col, asset in enumerate(assets):
+            self._vectorised_bids[asset] = bids[:, col]
+
+        asks = self.data_handler.get_assets_ask_prices_at(event_times, assets)
+        for col, asset in enumerate(assets):
+            self._vectorised_asks[asset] = asks[:, col]
+
+        if self.dividend_model is not None:
+            close_idx = np.flatnonzero(close_mask)
+            dividends = self.data_handler.get_assets_dividends_at(
+                event_times[close_idx], assets
+            )
+            for col, asset in enumerate(assets):
+                self._vectorised_dividend_idx[asset] = close_idx[
+                    dividends[:, col] > 0.0
+                ]
 
-        stats = {
-            'dates': [],
-            'events': [],
-            'alpha_weights': [],
-            'risk_weights': [],
-            'optimised_weights': [],
-            'target_portfolio': [],
-            'current_portfolio': [],
-            'rebalance_orders': [],
-            'executed_orders': [],
-            'equity_curve': [],
-            'portfolio_snapshots': [],
-            'dividends': [], 
-        }
+    def _record_vectorised_events(self, events, start, end, stats):
+        """
+        Record the simulation events between two active events, over
+        which the portfolio holdings and cash remain unchanged, marking
+        the positions to market with the bid prices of each event.
 
-        self.stats = stats
+        Parameters
+        ----------
+        events : `list[SimulationEvent]`
+            All of the simulation events.
+        start : `int`
+            The index of the first event to record.
+        end : `int`
+            The index after the last event to record.
+        stats : `StatsRecorder`
+            The statistics recorder.
+        """
+        portfolio = self.broker.portfolios[self.portfolio_id]
+        cash = portfolio.cash
+        assets = list(portfolio.pos_handler.positions.keys())
+        quantities = np.array([
+            pos.net_quantity for pos in portfolio.pos_handler.positions.values()
+        ], dtype=np.float64)
+        bids = np.empty((end - start, len(assets)))
+        for col, asset in enumerate(assets):
+            bids[:, col] = self._vectorised_bids[asset][start:end]
+
+        # Sum market values in position order, as per the PositionHandler
+        market_values = bids * quantities
+        total_market_value = np.zeros(end - start)
+        for col in range(len(assets)):
+            total_market_value = total_market_value + market_values[:, col]
+        total_equity = (0.0 + (total_market_value + cash)).tolist()
+
+        # Inactive events are never rebalances
+        if stats.records_snapshot(False):
+            stats.record_snapshots(
+                [event.ts for event in events[start:end]],
+                [event.event_type for event in events[start:end]],
+                assets,
+                np.broadcast_to(quantities, market_values.shape),
+                market_values,
+                (bids + bids) / 2.0,
+                np.full(end - start, cash)
+            )
 
-        for event in self.sim_engine:
-            # Output the system event and timestamp
-            dt = event.ts
-            if settings.PRINT_EVENTS:
-                print("(%s) - %s" % (event.ts, event.event_type))
+        for offset, event in enumerate(events[start:end]):
+            if event.event_type == "market_close":
+                dt = event.ts
+                if self.dividend_model is not None and stats.records_rebalances:
+                    stats.record_dividends({
+                        'date': dt,
+                        'dividends': [],
+                        'total_cash_dividend': 0.0,
+                        'total_reinvested_quantity': 0,
+                        'event': event.event_type
+                    })
+                if self.burn_in_dt is None or dt >= self.burn_in_dt:
+                    self.equity_curve.append((dt, total_equity[offset]))
+                    stats.record_equity(dt, total_equity[offset])
+
+    def _get_data_handler_users(self):
+        """
+        Obtain the backtest components sharing the data handler of
+        the backtest, namely the backtest itself, the broker, the
+        quant trading system and its models, along with the dividend
+        model, if present.
+
+        Returns
+        -------
+        `list`
+            The components holding the data handler of the backtest.
+        """
+        pcm = getattr(self.qts, 'portfolio_construction_model', None)
+        components = [
+            self, self.broker, self.qts, pcm,
+            getattr(pcm, 'order_sizer', None),
+            getattr(pcm, 'optimiser', None),
+            getattr(self.qts, 'execution_handler', None),
+            self.dividend_model
+        ]
+        return [
+            component for component in components
+            if component is not None and
+            getattr(component, 'data_handler', None) is self.data_handler
+        ]
+
+    def _run_vectorised(self, stats):
+        """
+        Execute the simulation by only carrying out the full
+        event-driven logic at 'active' events, namely rebalances,
+        order fills and dividend payments of held assets.
 
-            # Record date and event type.  NEW LINES.
-            stats['dates'].append(dt)
-            stats['events'].append(event.event_type)
+        Between active events the holdings and cash are constant, so
+        the equity curve and portfolio snapshots are computed from
+        the bid prices of the held assets via NumPy. The results are
+        identical to the event-driven simulation.
 
-            # Update the simulated broker
-            self.broker.update(dt)
+        The bid and ask prices of all assets at every event are
+        obtained from the data handler upfront. For the duration of
+        the simulation the data handler of the broker and the quant
+        trading system is wrapped in an EventPriceDataHandler, such
+        that the active events are also carried out with these prices.
 
-            # if event.event_type == "market_open":
-            # might extend this in future to trade at current close or average of next open ohlc.
-            # so not filtering for market_open now. 
-            executed_orders = self.broker.get_executed_orders()
-            if executed_orders:
-                stats['executed_orders'].extend(executed_orders)
-                self.broker.clear_executed_orders() #reset after appending to stats
+        Only deterministic strategies are supported, i.e. those
+        without signals requiring a daily update.
 
-            self._record_portfolio_snapshot(dt, stats)
-            
-            # Update any signals on a daily basis
-            if self.signals is not None and event.event_type == "market_close":
-                self.signals.update(dt)
+        Parameters
+        ----------
+        stats : `StatsRecorder`
+            The statistics recorder.
+        """
+        if self.signals is not None:
+            raise ValueError(
+                'Vectorised backtests do not support signals, since these '
+                'require updating at every market close. Run the backtest '
+                'without vectorisation instead.'
+            )
 
-            
+        events = list(self.sim_engine)
+        close_mask = self.sim_engine.event_types == "market_close"
+        open_idx = np.flatnonzero(
+            self.exchange.is_open_at_datetimes(self.sim_engine.event_times)
+        )
+        event_ns = self.sim_engine.event_times.as_unit('ns').asi8
+        rebalance_mask = np.isin(
+            event_ns, np.fromiter(self._rebalance_lookup, dtype=np.int64)
+        )
+        if self.burn_in_dt is not None:
+            rebalance_mask &= event_ns >= self.burn_in_dt.value
+        rebalance_idx = np.flatnonzero(rebalance_mask)
 
-            # If we have hit a rebalance time then carry
-            # out a full run of the quant trading system
-            if self.burn_in_dt is not None:
-                if dt >= self.burn_in_dt:
-                    if self._is_rebalance_event(dt):
-                        if settings.PRINT_EVENTS:
-                            print(
-                                "(%s) - trading logic "
-                                "and rebalance" % event.ts
-                            )
-                        self.qts(dt, event=event, stats=stats)
-            else:
-                if self._is_rebalance_event(dt):
-                    if settings.PRINT_EVENTS:
-                        print(
-                            "(%s) - trading logic "
-                            "and rebalance" % event.ts
-                        )
-                    self.qts(dt, event=event, stats=stats)
+        self._vectorised_bids = {}
+        self._vectorised_asks = {}
+        self._vectorised_dividend_idx = {}
+        self._add_vectorised_columns(self.universe.get_all_assets(), close_mask)
 
-            # Out of market hours we want a daily
-            # performance update, but only if we
-            # are past the 'burn in' period
+        price_handler = EventPriceDataHandler(
+            self.data_handler, self.sim_engine.event_times,
+            self._vectorised_bids, self._vectorised_asks
+        )
+        data_handler_users = self._get_data_handler_users()
+        for user in data_handler_users:
+            user.data_handler = price_handler
+        try:
+            self._run_vectorised_events(
+                events, close_mask, open_idx, rebalance_idx, price_handler, stats
+            )
+        finally:
+            for user in data_handler_users:
+                user.data_handler = price_handler.data_handler
 
-            if self.dividend_model is not None and event.event_type == "market_close":
-                self.dividend_model(dt, event=event, stats=stats)
+    def _run_vectorised_events(
+        self, events, close_mask, open_idx, rebalance_idx, price_handler, stats
+    ):
+        """
+        Carry out the full event-driven logic at each active event of
+        the vectorised simulation, recording the events in between.
 
-            if event.event_type == "market_close":
-                if self.burn_in_dt is not None:
-                    if dt >= self.burn_in_dt:
-                        self._update_equity_curve(dt,stats)
-                else:
-                    self._update_equity_curve(dt,stats)
+        Parameters
+        ----------
+        events : `list[SimulationEvent]`
+            All of the simulation events.
+        close_mask : `np.ndarray`
+            Whether each simulation event is a market close.
+        open_idx : `np.ndarray`
+            The indices of the events during market hours.
+        rebalance_idx : `np.ndarray`
+            The indices of the rebalance events.
+        price_handler : `EventPriceDataHandler`
+            The data handler answering the latest prices at each event.
+        stats : `StatsRecorder`
+            The statistics recorder.
+        """
+        num_events = len(events)
+        idx = 0
+        while idx < num_events:
+            positions = self.broker.portfolios[self.portfolio_id].pos_handler.positions
+            self._add_vectorised_columns(list(positions.keys()), close_mask)
+
+            # Determine the next event requiring the full event logic
+            candidates = [num_events]
+            next_rebalance = np.searchsorted(rebalance_idx, idx)
+            if next_rebalance < len(rebalance_idx):
+                candidates.append(rebalance_idx[next_rebalance])
+            if any(not orders.empty() for orders in self.broker.open_orders.values()):
+                next_open = np.searchsorted(open_idx, idx)
+                if next_open < len(open_idx):
+                    candidates.append(open_idx[next_open])
+            if self.dividend_model is not None:
+                for asset, pos in positions.items():
+                    if pos.net_quantity == 0:
+                        continue
+                    dividend_idx = self._vectorised_dividend_idx[asset]
+                    next_dividend = np.searchsorted(dividend_idx, idx)
+                    if next_dividend < len(dividend_idx):
+                        candidates.append(dividend_idx[next_dividend])
+            active_idx = int(min(candidates))
+
+            if active_idx > idx:
+                self._record_vectorised_events(events, idx, active_idx, stats)
+            if active_idx < num_events:
+                price_handler.set_event(active_idx)
+                self._process_event(events[active_idx], stats)
+            elif num_events > 0:
+                # Bring the broker up to date with the final event
+                price_handler.set_event(num_events - 1)
+                self.broker.update(events[-1].ts)
+            idx = active_idx + 1
+
+    def _expected_num_events(self):
+        """
+        Estimate the number of simulation events, used to
+        preallocate the storage of the statistics recorder.
+
+        Returns
+        -------
+        `int`
+            The expected number of simulation events.
+        """
+        return len(getattr(self.sim_engine, 'event_times', []))
+
+    def run(self, results=False, vectorised=False):
+        """
+        Execute the simulation engine by iterating over all
+        simulation events, rebalancing the quant trading
+        system at the appropriate schedule.
+
+        Parameters
+        ----------
+        results : `Boolean`, optional
+            Whether to output the current portfolio holdings
+        vectorised : `Boolean`, optional
+            Whether to only carry out the event-driven logic at
+            rebalances, order fills and dividend payments, computing
+            the equity curve between these via NumPy. Produces
+            identical results for strategies without signals.
+        """
+        if settings.PRINT_EVENTS:
+            print("Beginning backtest simulation...")
+
+        stats = self.stats_recorder
+        stats.reset(
+            num_events=self._expected_num_events(),
+            num_rebalances=len(self.rebalance_schedule),
+            assets=self.universe.get_all_assets()
+        )
+        self.stats = stats
+
+        try:
+            if vectorised:
+                self._run_vectorised(stats)
+            else:
+                for event in self.sim_engine:
+                    self._process_event(event, stats)
+        finally:
+            stats.close()
 
         self.target_allocations = stats['target_portfolio']
 
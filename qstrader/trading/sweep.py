@@ -0,0 +1,220 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import itertools
+import multiprocessing
+import traceback
+
+import pandas as pd
+
+from qstrader.statistics.batch import BatchStatistics
+
+
+# The state of the currently running sweep, which is inherited
+# by forked worker processes rather than pickled per task
+_SWEEP_STATE = {}
+
+
+def _expand_param_grid(param_grid):
+    """
+    Expand a parameter grid into the list of parameter
+    combinations to backtest.
+
+    Parameters
+    ----------
+    param_grid : `dict{str: list}` or `list[dict]`
+        Either a dictionary mapping each parameter name to its
+        candidate values, of which the Cartesian product is taken,
+        or an explicit list of parameter dictionaries.
+
+    Returns
+    -------
+    `list[dict]`
+        The parameter combinations.
+    """
+    if isinstance(param_grid, dict):
+        names = list(param_grid.keys())
+        return [
+            dict(zip(names, values))
+            for values in itertools.product(*[param_grid[name] for name in names])
+        ]
+    return [dict(params) for params in param_grid]
+
+
+def _run_sweep_task(run_id, params):
+    """
+    Construct and run the backtest of a single parameter
+    combination, isolating any failure.
+
+    Parameters
+    ----------
+    run_id : `int`
+        The index of the parameter combination.
+    params : `dict`
+        The parameter combination.
+
+    Returns
+    -------
+    `tuple(int, pd.Series, str)`
+        The index of the parameter combination, the equity curve
+        (None upon failure) and the traceback of any failure.
+    """
+    try:
+        backtest = _SWEEP_STATE['session_factory'](
+            _SWEEP_STATE['data_handler'], **params
+        )
+        backtest.run(vectorised=_SWEEP_STATE['vectorised'])
+        equity = backtest.get_equity_curve()['Equity']
+        equity.index = pd.to_datetime(equity.index)
+        return run_id, equity, None
+    except Exception:
+        return run_id, None, traceback.format_exc()
+
+
+class ParameterSweep(object):
+    """
+    Runs a BacktestTradingSession for each combination of a parameter
+    grid, sharing a single loaded data handler across all of the
+    backtests, and collects their equity curves and statistics.
+
+    Where the 'fork' start method is available the backtests are
+    carried out within a pool of worker processes. The data handler
+    is inherited by each worker from the parent process, such that
+    the data is loaded only once and its pages are shared
+    copy-on-write, rather than being pickled to each worker. Otherwise
+    the backtests are carried out sequentially in this process.
+
+    A backtest raising an exception does not halt the sweep. Its
+    traceback is reported within the 'error' column of the results
+    and its statistics are left as NaN.
+
+    Parameters
+    ----------
+    session_factory : `callable`
+        Called as session_factory(data_handler, **params) for each
+        parameter combination, returning an un-run
+        BacktestTradingSession utilising the provided data handler.
+        Since only the equity curve of each backtest is retained, the
+        sessions can use StatsRecorder(granularity='off').
+    param_grid : `dict{str: list}` or `list[dict]`
+        Either a dictionary mapping each parameter name to its
+        candidate values, of which the Cartesian product is taken,
+        or an explicit list of parameter dictionaries.
+    data_handler : `BacktestDataHandler`
+        The loaded data handler shared by all of the backtests.
+    workers : `int`, optional
+        The number of worker processes. A single worker carries out
+        the backtests sequentially in this process.
+    vectorised : `Boolean`, optional
+        Whether to run the backtests in vectorised mode.
+    periods : `int`, optional
+        The number of periods to use for Sharpe ratio calculation.
+    """
+
+    def __init__(
+        self,
+        session_factory,
+        param_grid,
+        data_handler,
+        workers=None,
+        vectorised=False,
+        periods=252
+    ):
+        self.session_factory = session_factory
+        self.params = _expand_param_grid(param_grid)
+        self.data_handler = data_handler
+        self.workers = workers if workers is not None else multiprocessing.cpu_count()
+        self.vectorised = vectorised
+        self.periods = periods
+        self.equity_curves = None
+        self.errors = None
+        self.results = None
+
+    def _use_pool(self):
+        """
+        Determine whether the backtests are carried out within
+        a pool of forked worker processes.
+
+        Returns
+        -------
+        `Boolean`
+            Whether to use a process pool.
+        """
+        return (
+            self.workers > 1 and len(self.params) > 1 and
+            'fork' in multiprocessing.get_all_start_methods()
+        )
+
+    def _run_tasks(self):
+        """
+        Carry out the backtest of each parameter combination.
+
+        Returns
+        -------
+        `list[tuple(int, pd.Series, str)]`
+            The index, equity curve and any failure traceback of each
+            parameter combination, in completion order.
+        """
+        if not self._use_pool():
+            return [
+                _run_sweep_task(run_id, params)
+                for run_id, params in enumerate(self.params)
+            ]
+
+        outcomes = []
+        with ProcessPoolExecutor(
+            max_workers=min(self.workers, len(self.params)),
+            mp_context=multiprocessing.get_context('fork')
+        ) as executor:
+            futures = {
+                executor.submit(_run_sweep_task, run_id, params): run_id
+                for run_id, params in enumerate(self.params)
+            }
+            for future in as_completed(futures):
+                try:
+                    outcomes.append(future.result())
+                except Exception:
+                    # The worker process itself failed, e.g. it was
+                    # killed, or the equity curve was unpicklable
+                    outcomes.append((futures[future], None, traceback.format_exc()))
+        return outcomes
+
+    def run(self):
+        """
+        Run the backtests of all parameter combinations.
+
+        Returns
+        -------
+        `pd.DataFrame`
+            The results, with a row per parameter combination holding
+            its parameters, the statistics of its equity curve and
+            the traceback of any failure.
+        """
+        _SWEEP_STATE.update(
+            session_factory=self.session_factory,
+            data_handler=self.data_handler,
+            vectorised=self.vectorised
+        )
+        try:
+            outcomes = sorted(self._run_tasks(), key=lambda outcome: outcome[0])
+        finally:
+            _SWEEP_STATE.clear()
+
+        run_ids = pd.RangeIndex(len(self.params))
+        equities = {
+            run_id: equity for run_id, equity, _ in outcomes if equity is not None
+        }
+        if len(equities) > 0:
+            self.equity_curves = pd.concat(equities, axis=1).sort_index()
+        else:
+            self.equity_curves = pd.DataFrame()
+        self.errors = pd.Series(
+            [error for _, _, error in outcomes], index=run_ids,
+            dtype=object, name='error'
+        )
+
+        results = pd.DataFrame(self.params, index=run_ids)
+        if len(self.equity_curves.columns) > 0:
+            results = results.join(
+                BatchStatistics(self.equity_curves, periods=self.periods).get_results()
+            )
+        self.results = results.assign(error=self.errors)
+        return self.results
@@ -0,0 +1,149 @@
+import time
+import tracemalloc
+
+import click
+import pandas as pd
+import pytz
+
+from qstrader import settings
+from qstrader.broker.portfolio.portfolio_event import PortfolioEvent
+from qstrader.broker.portfolio.position import Position
+from qstrader.broker.transaction.transaction import Transaction
+from qstrader.execution.order import Order
+
+
+def dict_backed(cls):
+    """
+    Creates an equivalent subclass of a slotted domain object class
+    whose instances carry a per-instance __dict__, as prior to the
+    introduction of __slots__.
+
+    Parameters
+    ----------
+    cls : `type`
+        The slotted domain object class.
+
+    Returns
+    -------
+    `type`
+        The dict-backed subclass.
+    """
+    return type('Dict%s' % cls.__name__, (cls,), {})
+
+
+def object_factories(dt):
+    """
+    Creates a factory for each domain object. The arguments are
+    shared between instances, such that only the footprint of the
+    instances themselves is measured.
+
+    Parameters
+    ----------
+    dt : `pd.Timestamp`
+        The timestamp used for all instances.
+
+    Returns
+    -------
+    `dict{str: tuple(type, callable)}`
+        The class and factory of each domain object.
+    """
+    return {
+        'Order': (
+            Order, lambda cls: cls(dt, 'EQ:ABC', 100, order_id='1')
+        ),
+        'Transaction': (
+            Transaction, lambda cls: cls('EQ:ABC', 100, dt, 100.0, '1', 1.0)
+        ),
+        'Position': (
+            Position, lambda cls: cls('EQ:ABC', 100.0, dt, 100, 0, 100.0, 0.0, 1.0, 0.0)
+        ),
+        'PortfolioEvent': (
+            PortfolioEvent, lambda cls: cls(dt, 'asset_transaction', 'LONG', 100.0, 0.0, 1e6)
+        )
+    }
+
+
+def measure(factory, cls, num_objects):
+    """
+    Measures the construction time and retained memory of
+    a number of instances of a domain object class.
+
+    Parameters
+    ----------
+    factory : `callable`
+        The factory constructing an instance of the class.
+    cls : `type`
+        The domain object class to instantiate.
+    num_objects : `int`
+        The number of instances to construct.
+
+    Returns
+    -------
+    `tuple(float, float)`
+        The elapsed seconds and the retained bytes per instance.
+    """
+    start = time.perf_counter()
+    objects = [factory(cls) for _ in range(num_objects)]
+    elapsed = time.perf_counter() - start
+    del objects
+
+    tracemalloc.start()
+    objects = [factory(cls) for _ in range(num_objects)]
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return elapsed, retained / float(num_objects)
+
+
+def measure_order_ids(order_ids, num_objects):
+    """
+    Measures the construction time of Orders whose order
+    IDs are generated as per settings.ORDER_IDS.
+
+    Parameters
+    ----------
+    order_ids : `str`
+        The order ID generation, 'uuid' or 'sequential'.
+    num_objects : `int`
+        The number of Orders to construct.
+
+    Returns
+    -------
+    `float`
+        The elapsed seconds.
+    """
+    dt = pd.Timestamp('2020-01-02 14:30:00', tz=pytz.UTC)
+    previous = settings.ORDER_IDS
+    settings.set_order_ids(order_ids)
+    try:
+        start = time.perf_counter()
+        for i in range(num_objects):
+            Order(dt, 'EQ:ABC', i + 1)
+        return time.perf_counter() - start
+    finally:
+        settings.set_order_ids(previous)
+
+
+@click.command()
+@click.option('--num-objects', 'num_objects', default=200000, help='Number of instances of each object')
+def cli(num_objects):
+    dt = pd.Timestamp('2020-01-02 14:30:00', tz=pytz.UTC)
+
+    print('%-16s %12s %12s %12s %12s' % (
+        'Object', 'dict (s)', 'slots (s)', 'dict (B)', 'slots (B)'
+    ))
+    for name, (cls, factory) in object_factories(dt).items():
+        dict_elapsed, dict_bytes = measure(factory, dict_backed(cls), num_objects)
+        slots_elapsed, slots_bytes = measure(factory, cls, num_objects)
+        print('%-16s %12.3f %12.3f %12.1f %12.1f' % (
+            name, dict_elapsed, slots_elapsed, dict_bytes, slots_bytes
+        ))
+
+    print()
+    print('Order ID generation for %s orders:' % num_objects)
+    for order_ids in ('uuid', 'sequential'):
+        print('%-16s %12.3f s' % (order_ids, measure_order_ids(order_ids, num_objects)))
+
+
+if __name__ == "__main__":
+    cli()
@@ -1,8 +1,53 @@
 import os
 
+import pandas as pd
 import pytest
 
+from qstrader.alpha_model.fixed_signals import FixedSignalsAlphaModel
+from qstrader.asset.equity import Equity
+from qstrader.asset.universe.static import StaticUniverse
+from qstrader.data.backtest_data_handler import BacktestDataHandler
+from qstrader.data.daily_bar_csv import CSVDailyBarDataSource
+from qstrader.trading.backtest import BacktestTradingSession
+
 
 @pytest.fixture
 def etf_filepath():
     return os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+@pytest.fixture
+def create_data_handler(etf_filepath):
+    """
+    Factory of data handlers for the ABC and DEF fixture assets.
+    """
+    def _create_data_handler():
+        data_source = CSVDailyBarDataSource(
+            etf_filepath, Equity, csv_symbols=['ABC', 'DEF']
+        )
+        return BacktestDataHandler(
+            StaticUniverse(['EQ:ABC', 'EQ:DEF']), data_sources=[data_source]
+        )
+    return _create_data_handler
+
+
+@pytest.fixture
+def create_backtest(create_data_handler):
+    """
+    Factory of January 2019 backtests of the ABC and DEF fixture
+    assets with fixed signal weights. A new data handler is created
+    for each backtest unless one is provided, while any further
+    keyword arguments are passed to the BacktestTradingSession.
+    """
+    def _create_backtest(signal_weights, data_handler=None, **kwargs):
+        if data_handler is None:
+            data_handler = create_data_handler()
+        return BacktestTradingSession(
+            pd.Timestamp('2019-01-01 00:00:00', tz='America/New_York'),
+            pd.Timestamp('2019-01-31 23:59:00', tz='America/New_York'),
+            data_handler.universe,
+            FixedSignalsAlphaModel(signal_weights),
+            data_handler=data_handler,
+            **kwargs
+        )
+    return _create_backtest
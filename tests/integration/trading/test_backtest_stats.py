@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from qstrader import settings
+from qstrader.statistics.recorder import StatsRecorder
+from qstrader.statistics.sink import JSONLinesStatsSink
+
+
+def _run_backtest(create_backtest, granularity, vectorised=False, sink=None):
+    backtest = create_backtest(
+        {'EQ:ABC': 0.6, 'EQ:DEF': 0.4},
+        rebalance='weekly',
+        rebalance_weekday='WED',
+        long_only=True,
+        cash_buffer_percentage=0.05,
+        stats_recorder=StatsRecorder(granularity=granularity, sink=sink)
+    )
+    backtest.run(vectorised=vectorised)
+    return backtest
+
+
+@pytest.mark.parametrize('vectorised', [False, True])
+@pytest.mark.parametrize('granularity', ['rebalance', 'off'])
+def test_stats_granularity(monkeypatch, create_backtest, granularity, vectorised):
+    """
+    Checks that coarser statistics granularities record a subset of
+    the statistics without altering the backtest itself.
+    """
+    monkeypatch.setattr(settings, 'PRINT_EVENTS', False)
+    event_bt = _run_backtest(create_backtest, 'event')
+    coarse_bt = _run_backtest(create_backtest, granularity, vectorised=vectorised)
+
+    pd.testing.assert_frame_equal(
+        coarse_bt.get_equity_curve(), event_bt.get_equity_curve()
+    )
+    assert coarse_bt.stats['equity_curve'] == event_bt.stats['equity_curve']
+
+    if granularity == 'rebalance':
+        rebalance_dates = [entry['date'] for entry in event_bt.stats['alpha_weights']]
+        assert coarse_bt.stats['dates'] == rebalance_dates
+        assert coarse_bt.stats['portfolio_snapshots'] == [
+            snapshot for snapshot in event_bt.stats['portfolio_snapshots']
+            if snapshot['date'] in rebalance_dates
+        ]
+        for key in ['alpha_weights', 'target_portfolio', 'rebalance_orders', 'executed_orders']:
+            assert len(coarse_bt.stats[key]) == len(event_bt.stats[key])
+    else:
+        for key in ['dates', 'portfolio_snapshots', 'alpha_weights', 'executed_orders']:
+            assert coarse_bt.stats[key] == []
+
+
+@pytest.mark.parametrize('vectorised', [False, True])
+def test_stats_sink(monkeypatch, tmp_path, create_backtest, vectorised):
+    """
+    Checks that statistics streamed to a sink match those
+    recorded in memory.
+    """
+    monkeypatch.setattr(settings, 'PRINT_EVENTS', False)
+    event_bt = _run_backtest(create_backtest, 'event')
+    sink = JSONLinesStatsSink(str(tmp_path), batch_size=7)
+    sink_bt = _run_backtest(create_backtest, 'event', vectorised=vectorised, sink=sink)
+
+    event_dfs = event_bt.get_stats_dataframe()
+    pd.testing.assert_frame_equal(
+        sink_bt.get_equity_curve(), event_bt.get_equity_curve()
+    )
+    assert set(sink_bt.get_stats_dataframe().keys()).isdisjoint(
+        ['portfolio_snapshots', 'rebalance_orders', 'executed_orders', 'dividends']
+    )
+    assert [record['equity'] for record in sink.read('equity_curve')] == (
+        event_dfs['equity_curve']['Equity'].tolist()
+    )
+
+    snapshots = pd.DataFrame(sink.read('portfolio_snapshots'))
+    assert snapshots['asset'].tolist() == (
+        event_dfs['portfolio_snapshots'].index.get_level_values('Asset').tolist()
+    )
+    np.testing.assert_array_equal(
+        snapshots['market_value'].to_numpy(dtype=float),
+        event_dfs['portfolio_snapshots']['MarketValue'].to_numpy()
+    )
+    for key in ['rebalance_orders', 'executed_orders']:
+        records = pd.DataFrame(sink.read(key))
+        assert records['asset'].tolist() == (
+            event_dfs[key].index.get_level_values('Asset').tolist()
+        )
+        assert records['quantity'].tolist() == event_dfs[key]['Quantity'].tolist()
@@ -0,0 +1,195 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from qstrader import settings
+from qstrader.broker.fee_model.percent_fee_model import PercentFeeModel
+from qstrader.data.backtest_data_handler import BacktestDataHandler
+from qstrader.signals.momentum import MomentumSignal
+from qstrader.signals.signals_collection import SignalsCollection
+
+
+def _run_backtest(create_backtest, vectorised, **kwargs):
+    backtest = create_backtest(kwargs.pop('signal_weights'), **kwargs)
+    backtest.run(vectorised=vectorised)
+    return backtest
+
+
+@pytest.mark.parametrize(
+    'kwargs',
+    [
+        {
+            'signal_weights': {'EQ:ABC': 0.6, 'EQ:DEF': 0.4},
+            'rebalance': 'weekly',
+            'rebalance_weekday': 'WED',
+            'long_only': True,
+            'cash_buffer_percentage': 0.05,
+            'fee_model': PercentFeeModel(commission_pct=0.001)
+        },
+        {
+            'signal_weights': {'EQ:ABC': 1.0, 'EQ:DEF': -0.7},
+            'rebalance': 'daily',
+            'long_only': False,
+            'gross_leverage': 2.0
+        },
+        {
+            'signal_weights': {'EQ:ABC': 0.5, 'EQ:DEF': 0.5},
+            'rebalance': 'weekly',
+            'rebalance_weekday': 'FRI',
+            'long_only': True,
+            'cash_buffer_percentage': 0.01,
+            'burn_in_dt': pd.Timestamp('2019-01-14 00:00:00', tz='America/New_York')
+        },
+        {
+            'signal_weights': {'EQ:ABC': 0.7, 'EQ:DEF': 0.3},
+            'rebalance': [
+                pd.Timestamp('2019-01-03 16:00:00', tz='America/New_York'),
+                pd.Timestamp('2019-01-17 21:00:00', tz='UTC')
+            ],
+            'long_only': True,
+            'cash_buffer_percentage': 0.05
+        }
+    ]
+)
+def test_vectorised_matches_event_driven(monkeypatch, create_backtest, kwargs):
+    """
+    Checks that a vectorised backtest produces identical holdings,
+    equity curve and statistics to the event-driven backtest.
+    """
+    monkeypatch.setattr(settings, 'PRINT_EVENTS', False)
+    event_bt = _run_backtest(create_backtest, False, **dict(kwargs))
+    vector_bt = _run_backtest(create_backtest, True, **dict(kwargs))
+
+    event_portfolio = event_bt.broker.portfolios['000001']
+    vector_portfolio = vector_bt.broker.portfolios['000001']
+    assert vector_portfolio.portfolio_to_dict() == event_portfolio.portfolio_to_dict()
+    assert vector_portfolio.cash == event_portfolio.cash
+    pd.testing.assert_frame_equal(
+        vector_portfolio.history_to_df(), event_portfolio.history_to_df()
+    )
+    pd.testing.assert_frame_equal(
+        vector_bt.get_equity_curve(), event_bt.get_equity_curve()
+    )
+
+    assert vector_bt.stats['dates'] == event_bt.stats['dates']
+    event_stats = event_bt.get_stats_dataframe()
+    vector_stats = vector_bt.get_stats_dataframe()
+    assert set(vector_stats.keys()) == set(event_stats.keys())
+    for key in event_stats.keys():
+        pd.testing.assert_frame_equal(
+            vector_stats[key].drop(columns=['OrderID'], errors='ignore'),
+            event_stats[key].drop(columns=['OrderID'], errors='ignore')
+        )
+
+
+def test_vectorised_signals_raises(monkeypatch, create_data_handler, create_backtest):
+    """
+    Checks that a vectorised backtest utilising signals raises
+    a ValueError.
+    """
+    monkeypatch.setattr(settings, 'PRINT_EVENTS', False)
+    data_handler = create_data_handler()
+    signals = SignalsCollection(
+        {'momentum': MomentumSignal(
+            pd.Timestamp('2019-01-01', tz='America/New_York'),
+            data_handler.universe, lookbacks=[5]
+        )},
+        data_handler
+    )
+    backtest = create_backtest(
+        {'EQ:ABC': 1.0}, data_handler=data_handler, signals=signals,
+        rebalance='daily', long_only=True, cash_buffer_percentage=0.05
+    )
+    with pytest.raises(ValueError):
+        backtest.run(vectorised=True)
+
+
+def test_rebalance_schedule_lookup(monkeypatch, create_backtest):
+    """
+    Checks that rebalance events are matched by instant irrespective
+    of timezone, that timezone-naive timestamps never match and that
+    reassigning the schedule updates the lookup.
+    """
+    monkeypatch.setattr(settings, 'PRINT_EVENTS', False)
+    backtest = _run_backtest(
+        create_backtest, False, signal_weights={'EQ:ABC': 1.0},
+        rebalance=[
+            pd.Timestamp('2019-01-03 21:00:00', tz='UTC'),
+            pd.Timestamp('2019-01-04 16:00:00')
+        ],
+        long_only=True, cash_buffer_percentage=0.05
+    )
+    assert backtest._is_rebalance_event(
+        pd.Timestamp('2019-01-03 16:00:00', tz='America/New_York')
+    )
+    assert not backtest._is_rebalance_event(
+        pd.Timestamp('2019-01-04 16:00:00', tz='America/New_York')
+    )
+    assert not backtest._is_rebalance_event(
+        pd.Timestamp('2019-01-04 16:00:00', tz='UTC')
+    )
+
+    backtest.rebalance_schedule = [
+        pd.Timestamp('2019-01-04 16:00:00', tz='America/New_York')
+    ]
+    assert backtest._is_rebalance_event(
+        pd.Timestamp('2019-01-04 16:00:00', tz='America/New_York')
+    )
+    assert not backtest._is_rebalance_event(
+        pd.Timestamp('2019-01-03 16:00:00', tz='America/New_York')
+    )
+
+
+@pytest.mark.parametrize('vectorised', [False, True])
+def test_array_positions_matches_position_handler(monkeypatch, create_backtest, vectorised):
+    """
+    Checks that a backtest storing its positions within the
+    ArrayPositionHandler produces identical holdings, history and
+    equity curve to the default PositionHandler.
+    """
+    monkeypatch.setattr(settings, 'PRINT_EVENTS', False)
+    kwargs = {
+        'signal_weights': {'EQ:ABC': 1.0, 'EQ:DEF': -0.7},
+        'rebalance': 'daily',
+        'long_only': False,
+        'gross_leverage': 2.0
+    }
+    default_bt = _run_backtest(create_backtest, vectorised, **dict(kwargs))
+    array_bt = _run_backtest(
+        create_backtest, vectorised, array_positions=True, **dict(kwargs)
+    )
+
+    default_portfolio = default_bt.broker.portfolios['000001']
+    array_portfolio = array_bt.broker.portfolios['000001']
+    assert array_portfolio.portfolio_to_dict() == default_portfolio.portfolio_to_dict()
+    pd.testing.assert_frame_equal(
+        array_portfolio.history_to_df(), default_portfolio.history_to_df()
+    )
+    pd.testing.assert_frame_equal(
+        array_bt.get_equity_curve(), default_bt.get_equity_curve()
+    )
+
+
+def test_vectorised_fixed_weights_use_array_prices(monkeypatch, create_backtest):
+    """
+    Checks that a vectorised fixed weight backtest sizes, executes
+    and marks its orders with the prices obtained upfront, without
+    querying the data handler for the latest prices.
+    """
+    monkeypatch.setattr(settings, 'PRINT_EVENTS', False)
+    latest_queries = []
+
+    def _get_assets_latest_prices(self, dt, asset_symbols, *args):
+        latest_queries.append((dt, asset_symbols))
+        return np.full(len(asset_symbols), np.nan)
+
+    monkeypatch.setattr(
+        BacktestDataHandler, '_get_assets_latest_prices', _get_assets_latest_prices
+    )
+    backtest = _run_backtest(
+        create_backtest, True, signal_weights={'EQ:ABC': 0.6, 'EQ:DEF': 0.4},
+        rebalance='weekly', rebalance_weekday='WED', long_only=True,
+        cash_buffer_percentage=0.05, fee_model=PercentFeeModel(commission_pct=0.001)
+    )
+    assert latest_queries == []
+    assert len(backtest.broker.portfolios['000001'].pos_handler.positions) == 2
@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from qstrader import settings
+from qstrader.statistics.recorder import StatsRecorder
+from qstrader.trading.sweep import ParameterSweep, _expand_param_grid
+
+
+def test_expand_param_grid():
+    """
+    Checks that a parameter grid dictionary is expanded into the
+    Cartesian product of its values and that lists pass through.
+    """
+    assert _expand_param_grid({'a': [1, 2], 'b': ['x', 'y']}) == [
+        {'a': 1, 'b': 'x'}, {'a': 1, 'b': 'y'},
+        {'a': 2, 'b': 'x'}, {'a': 2, 'b': 'y'}
+    ]
+    assert _expand_param_grid([{'a': 1}, {'a': 3}]) == [{'a': 1}, {'a': 3}]
+
+
+def _create_session_factory(create_backtest):
+    def _session_factory(data_handler, abc_weight, rebalance='weekly'):
+        return create_backtest(
+            {'EQ:ABC': abc_weight, 'EQ:DEF': 1.0 - abc_weight},
+            data_handler=data_handler,
+            rebalance=rebalance,
+            rebalance_weekday='WED',
+            long_only=True,
+            cash_buffer_percentage=0.05,
+            stats_recorder=StatsRecorder(granularity='off')
+        )
+    return _session_factory
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_parameter_sweep(monkeypatch, create_data_handler, create_backtest, workers):
+    """
+    Checks that each backtest of the sweep matches the corresponding
+    standalone backtest and that a failing parameter combination is
+    isolated from the remainder of the sweep.
+    """
+    monkeypatch.setattr(settings, 'PRINT_EVENTS', False)
+    session_factory = _create_session_factory(create_backtest)
+    param_grid = [
+        {'abc_weight': 0.2},
+        {'abc_weight': 0.6},
+        {'abc_weight': 0.6, 'rebalance': 'fortnightly'},
+        {'abc_weight': 0.9}
+    ]
+    sweep = ParameterSweep(
+        session_factory, param_grid, create_data_handler(),
+        workers=workers
+    )
+    results = sweep.run()
+
+    assert list(results.index) == [0, 1, 2, 3]
+    assert list(results['abc_weight']) == [0.2, 0.6, 0.6, 0.9]
+    assert 'Unknown rebalance frequency' in results.loc[2, 'error']
+    assert np.isnan(results.loc[2, 'sharpe'])
+    assert results.loc[[0, 1, 3], 'error'].isnull().all()
+    assert list(sweep.equity_curves.columns) == [0, 1, 3]
+
+    for run_id in [0, 1, 3]:
+        backtest = session_factory(
+            create_data_handler(), param_grid[run_id]['abc_weight']
+        )
+        backtest.run()
+        expected = backtest.get_equity_curve()['Equity'].to_numpy()
+        np.testing.assert_allclose(
+            sweep.equity_curves[run_id].to_numpy(), expected
+        )
+        assert results.loc[run_id, 'total_return'] == pytest.approx(
+            expected[-1] / expected[0] - 1.0
+        )
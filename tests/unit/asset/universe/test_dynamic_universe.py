@@ -53,3 +53,17 @@ def test_dynamic_universe(asset_dates, dt, expected):
     """
     universe = DynamicUniverse(asset_dates)
     assert set(universe.get_assets(dt)) == set(expected)
+
+
+def test_dynamic_universe_get_all_assets():
+    """
+    Checks that the DynamicUniverse returns all of its assets,
+    including those not yet added or without an entry date.
+    """
+    asset_dates = {
+        'EQ:SPY': pd.Timestamp('1993-01-01 14:30:00', tz=pytz.utc),
+        'EQ:AGG': pd.Timestamp('2003-01-01 14:30:00', tz=pytz.utc),
+        'EQ:TLT': None
+    }
+    universe = DynamicUniverse(asset_dates)
+    assert set(universe.get_all_assets()) == set(asset_dates.keys())
@@ -27,3 +27,13 @@ def test_static_universe(assets, dt, expected):
     """
     universe = StaticUniverse(assets)
     assert universe.get_assets(dt) == expected
+
+
+def test_static_universe_get_all_assets():
+    """
+    Checks that the StaticUniverse returns all of its assets
+    independently of time.
+    """
+    assets = ['EQ:SPY', 'EQ:AGG']
+    universe = StaticUniverse(assets)
+    assert universe.get_all_assets() == assets
@@ -0,0 +1,115 @@
+import pandas as pd
+import pytest
+import pytz
+
+from qstrader.broker.portfolio.array_position_handler import ArrayPositionHandler
+from qstrader.broker.portfolio.position_handler import PositionHandler
+from qstrader.broker.transaction.transaction import Transaction
+
+
+def _dt(hour):
+    return pd.Timestamp('2015-05-06 %02d:00:00' % hour, tz=pytz.UTC)
+
+
+# Each step is either a transaction, as (asset, quantity, hour, price,
+# commission), or a price update, as ({asset: price}, hour)
+STEPS = [
+    ('EQ:AMZN', 100, 9, 960.0, 26.83),
+    ('EQ:MSFT', -200, 9, 50.0, 5.0),
+    ({'EQ:AMZN': 965.0, 'EQ:MSFT': 49.5}, 10),
+    ('EQ:AMZN', -40, 11, 970.0, 10.0),
+    ('EQ:MSFT', 50, 11, 48.0, 2.5),
+    ('EQ:AAPL', 30, 11, 120.0, 1.0),
+    ({'EQ:AMZN': 958.0, 'EQ:MSFT': 51.0, 'EQ:AAPL': 121.0}, 12),
+    ('EQ:AMZN', -60, 13, 962.0, 12.0),
+    ('EQ:MSFT', -100, 13, 52.0, 4.0),
+    ({'EQ:MSFT': 53.0, 'EQ:AAPL': 118.0}, 14),
+    ('EQ:AMZN', 25, 15, 955.0, 7.0),
+    ({'EQ:AMZN': 957.0, 'EQ:MSFT': 52.5, 'EQ:AAPL': 119.0}, 16)
+]
+
+
+def _apply_step(handler, step):
+    if isinstance(step[0], dict):
+        prices, hour = step
+        assets = list(prices.keys())
+        handler.update_current_prices(
+            assets, [prices[asset] for asset in assets], _dt(hour)
+        )
+    else:
+        asset, quantity, hour, price, commission = step
+        handler.transact_position(
+            Transaction(
+                asset, quantity=quantity, dt=_dt(hour), price=price,
+                order_id=1, commission=commission
+            )
+        )
+
+
+@pytest.mark.parametrize('capacity', [1, 16])
+def test_array_position_handler_matches_position_handler(capacity):
+    """
+    Checks that a sequence of opening, closing and reopening
+    transactions and price updates produces the same positions
+    and totals as the PositionHandler, including when the arrays
+    are grown.
+    """
+    ph = PositionHandler()
+    aph = ArrayPositionHandler(capacity=capacity)
+
+    for step in STEPS:
+        _apply_step(ph, step)
+        _apply_step(aph, step)
+
+        assert list(aph.positions.keys()) == list(ph.positions.keys())
+        for asset, pos in ph.positions.items():
+            array_pos = aph.positions[asset]
+            assert array_pos.net_quantity == pos.net_quantity
+            assert array_pos.avg_price == pytest.approx(pos.avg_price)
+            assert array_pos.realised_pnl == pytest.approx(pos.realised_pnl)
+            assert array_pos.current_dt == pos.current_dt
+
+        assert aph.total_market_value() == pytest.approx(ph.total_market_value())
+        assert aph.total_unrealised_pnl() == pytest.approx(ph.total_unrealised_pnl())
+        assert aph.total_realised_pnl() == pytest.approx(ph.total_realised_pnl())
+        assert aph.total_pnl() == pytest.approx(ph.total_pnl())
+
+
+def test_update_current_prices_validation():
+    """
+    Checks that price updates with a non-positive price or an
+    earlier timestamp raise a ValueError.
+    """
+    aph = ArrayPositionHandler()
+    _apply_step(aph, STEPS[0])
+
+    with pytest.raises(ValueError):
+        aph.update_current_prices(['EQ:AMZN'], [0.0], _dt(10))
+    with pytest.raises(ValueError):
+        aph.update_current_prices(['EQ:AMZN'], [965.0], _dt(8))
+
+
+def test_single_position_price_updates_adjust_totals():
+    """
+    Checks that updating the current price of a single position,
+    as per Portfolio.update_market_value_of_asset, is applied to the
+    totals, and that the totals are reset once all positions close.
+    """
+    ph = PositionHandler()
+    aph = ArrayPositionHandler()
+    for step in STEPS[:2]:
+        _apply_step(ph, step)
+        _apply_step(aph, step)
+
+    for handler in (ph, aph):
+        handler.positions['EQ:AMZN'].update_current_price(970.0, _dt(10))
+    assert aph.total_market_value() == pytest.approx(ph.total_market_value())
+    assert aph.total_unrealised_pnl() == pytest.approx(ph.total_unrealised_pnl())
+    assert aph.total_pnl() == pytest.approx(ph.total_pnl())
+
+    _apply_step(aph, ('EQ:AMZN', -100, 11, 975.0, 10.0))
+    _apply_step(aph, ('EQ:MSFT', 200, 11, 49.0, 5.0))
+    assert aph.positions == {}
+    assert aph.total_market_value() == 0.0
+    assert aph.total_realised_pnl() == 0.0
+    assert aph.total_pnl() == 0.0
@@ -394,3 +394,58 @@ def test_history_to_df_empty():
     assert sorted(test_df.columns) == sorted(hist_df.columns)
     assert len(test_df) == len(hist_df)
     assert len(hist_df) == 0
+
+
+@pytest.mark.parametrize(
+    'prices,dt_offset,raises',
+    [
+        ([54.0, 12.0, -1.0], 1, False),
+        ([54.0, -12.0, 1.0], 1, True),
+        ([54.0, 0.0, 1.0], 1, True),
+        ([54.0, 12.0, 1.0], -2, True)
+    ]
+)
+def test_update_market_values_of_assets(prices, dt_offset, raises):
+    """
+    Test update_market_values_of_assets matches updating each
+    held asset individually, ignoring assets not held and
+    raising prior to updating any position for invalid
+    prices or dates.
+    """
+    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
+    later_dt = pd.Timestamp('2017-10-06 08:00:00', tz=pytz.UTC)
+    port = Portfolio(start_dt)
+    port.subscribe_funds(later_dt, 100000.0)
+    for asset in ['EQ:AAA', 'EQ:BBB']:
+        port.transact_asset(
+            Transaction(asset, 100, later_dt, 50.0, 1, commission=0.0)
+        )
+    update_dt = later_dt + pd.Timedelta(days=dt_offset)
+    assets = ['EQ:AAA', 'EQ:BBB', 'EQ:CCC']
+
+    if raises:
+        with pytest.raises(ValueError):
+            port.update_market_values_of_assets(assets, prices, update_dt)
+        assert port.pos_handler.positions['EQ:AAA'].current_price == 50.0
+    else:
+        port.update_market_values_of_assets(assets, prices, update_dt)
+        for asset, price in zip(assets[:2], prices[:2]):
+            assert port.pos_handler.positions[asset].current_price == price
+            assert port.pos_handler.positions[asset].current_dt == update_dt
+        assert 'EQ:CCC' not in port.pos_handler.positions
+
+
+def test_history_retention():
+    """
+    Checks that a portfolio with a bounded history retains only
+    its most recent events.
+    """
+    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
+    port = Portfolio(start_dt, starting_cash=1000.0, max_history=2)
+    for days in range(1, 4):
+        port.subscribe_funds(start_dt + pd.Timedelta(days=days), 100.0)
+
+    assert len(port.history) == 2
+    assert port.history.num_dropped == 2
+    assert list(port.history.to_df()['balance']) == [1200.0, 1300.0]
+    assert len(port.history_to_df()) == 2
@@ -0,0 +1,103 @@
+import numpy as np
+import pandas as pd
+import pytest
+import pytz
+
+from qstrader.broker.portfolio.portfolio_event import PortfolioEvent
+from qstrader.broker.portfolio.portfolio_history import PortfolioHistory
+
+
+def _events(num_events):
+    start_dt = pd.Timestamp('2020-01-01 16:00:00', tz='America/New_York')
+    return [
+        PortfolioEvent(
+            dt=start_dt + pd.Timedelta(days=idx), type='asset_transaction',
+            description='LONG %s EQ:ABC 100.00 01/01/2020' % (idx + 1),
+            debit=100.0 * (idx + 1), credit=0.0, balance=1e6 - 100.0 * (idx + 1)
+        )
+        for idx in range(num_events)
+    ]
+
+
+@pytest.mark.parametrize(
+    'num_events,chunk_size,max_events',
+    [
+        (0, 4, None),
+        (3, 4, None),
+        (11, 4, None),
+        (11, 4, 5),
+        (11, 2, 1)
+    ]
+)
+def test_portfolio_history_matches_events(num_events, chunk_size, max_events):
+    """
+    Checks that the log behaves as the list of its retained events
+    across chunked growth and retention, and that the exported
+    DataFrame holds the retained events indexed by date.
+    """
+    events = _events(num_events)
+    history = PortfolioHistory(chunk_size=chunk_size, max_events=max_events)
+    for event in events:
+        history.append(event)
+
+    retained = events if max_events is None else events[-max_events:]
+    assert len(history) == len(retained)
+    assert history.num_dropped == len(events) - len(retained)
+    assert history == retained
+    assert history[1:3] == retained[1:3]
+    if len(retained) > 0:
+        assert history[-1] == retained[-1]
+
+    history_df = history.to_df()
+    assert list(history_df.columns) == [
+        'type', 'description', 'debit', 'credit', 'balance'
+    ]
+    assert list(history_df.index) == [event.dt for event in retained]
+    assert list(history_df['balance']) == [event.balance for event in retained]
+
+
+def test_to_df_shares_memory():
+    """
+    Checks that the exported DataFrame shares the memory of the
+    log, is read-only and is unaffected by subsequent events.
+    """
+    events = _events(10)
+    history = PortfolioHistory(chunk_size=4)
+    for event in events[:6]:
+        history.append(event)
+
+    history_df = history.to_df()
+    assert np.shares_memory(history_df['balance'].to_numpy(), history._balance)
+    with pytest.raises(ValueError):
+        history_df['balance'].to_numpy()[0] = 0.0
+
+    for event in events[6:]:
+        history.append(event)
+    assert list(history_df['balance']) == [event.balance for event in events[:6]]
+    assert len(history.to_df()) == 10
+
+
+def test_mixed_timezones_reported_in_utc():
+    """
+    Checks that events across differing timezones are
+    exported in UTC.
+    """
+    history = PortfolioHistory()
+    history.append(_events(1)[0])
+    history.append(
+        PortfolioEvent.create_subscription(
+            pd.Timestamp('2020-01-03 14:30:00', tz=pytz.UTC), 100.0, 100.0
+        )
+    )
+    assert str(history.to_df().index.tz) == 'UTC'
+    assert history[0].dt == pd.Timestamp('2020-01-01 21:00:00', tz=pytz.UTC)
+
+
+@pytest.mark.parametrize('chunk_size,max_events', [(0, None), (4, 0)])
+def test_invalid_sizes_raise_value_error(chunk_size, max_events):
+    """
+    Checks that a non-positive chunk size or retention
+    raises a ValueError.
+    """
+    with pytest.raises(ValueError):
+        PortfolioHistory(chunk_size=chunk_size, max_events=max_events)
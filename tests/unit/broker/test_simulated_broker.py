@@ -7,6 +7,7 @@ import pytz
 
 from qstrader.broker.portfolio.portfolio import Portfolio
 from qstrader.broker.simulated_broker import SimulatedBroker
+from qstrader.broker.transaction.transaction import Transaction
 from qstrader.broker.fee_model.zero_fee_model import ZeroFeeModel
 from qstrader import settings
 
@@ -655,3 +656,89 @@ def test_update_sets_correct_time():
     sb = SimulatedBroker(start_dt, exchange, data_handler)
     sb.update(new_dt)
     assert sb.current_dt == new_dt
+
+
+class DataHandlerMockBatched(object):
+    def __init__(self, prices):
+        self.prices = prices
+        self.requests = []
+
+    def get_assets_latest_mid_prices(self, dt, assets):
+        self.requests.append(list(assets))
+        return np.array([self.prices[asset] for asset in assets])
+
+    def get_assets_latest_bid_ask_prices(self, dt, assets):
+        self.requests.append(list(assets))
+        prices = np.array([self.prices[asset] for asset in assets])
+        return (prices, prices)
+
+
+def test_update_revalues_positions_in_single_request():
+    """
+    Tests that the update method obtains the prices of all held
+    assets across the portfolios in a single batched request and
+    revalues each held position.
+    """
+    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
+    new_dt = pd.Timestamp('2017-10-06 16:00:00', tz=pytz.UTC)
+    data_handler = DataHandlerMockBatched(
+        {'EQ:ABC': 11.0, 'EQ:DEF': 22.0, 'EQ:GHI': 33.0}
+    )
+    sb = SimulatedBroker(start_dt, ExchangeMock(), data_handler)
+    sb.subscribe_funds_to_account(200000.0)
+    holdings = {'1': ['EQ:ABC', 'EQ:DEF'], '2': ['EQ:DEF', 'EQ:GHI']}
+    for portfolio_id, assets in holdings.items():
+        sb.create_portfolio(portfolio_id=portfolio_id)
+        sb.subscribe_funds_to_portfolio(portfolio_id, 100000.0)
+        for asset in assets:
+            sb.portfolios[portfolio_id].transact_asset(
+                Transaction(asset, 100, start_dt, 10.0, 1, commission=0.0)
+            )
+
+    sb.update(new_dt)
+
+    assert data_handler.requests == [['EQ:ABC', 'EQ:DEF', 'EQ:GHI']]
+    for portfolio_id, assets in holdings.items():
+        positions = sb.portfolios[portfolio_id].pos_handler.positions
+        assert list(positions.keys()) == assets
+        for asset in assets:
+            assert positions[asset].current_price == data_handler.prices[asset]
+            assert positions[asset].current_dt == new_dt
+
+
+def test_submit_orders_executes_batch_in_single_pass():
+    """
+    Tests that a batch of submitted orders is marked to market and
+    priced with a single request each, and is executed in a single
+    pass selling prior to buying.
+    """
+    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
+    new_dt = pd.Timestamp('2017-10-06 16:00:00', tz=pytz.UTC)
+    data_handler = DataHandlerMockBatched(
+        {'EQ:ABC': 11.0, 'EQ:DEF': 22.0, 'EQ:GHI': 33.0}
+    )
+    sb = SimulatedBroker(start_dt, ExchangeMock(), data_handler)
+    sb.subscribe_funds_to_account(100000.0)
+    sb.create_portfolio(portfolio_id='1')
+    sb.subscribe_funds_to_portfolio('1', 100000.0)
+    sb.portfolios['1'].transact_asset(
+        Transaction('EQ:ABC', 100, start_dt, 10.0, 1, commission=0.0)
+    )
+
+    orders = [
+        OrderMock('EQ:DEF', 50, order_id=1),
+        OrderMock('EQ:ABC', -60, order_id=2),
+        OrderMock('EQ:GHI', 20, order_id=3)
+    ]
+    sb.submit_orders('1', orders, new_dt)
+
+    assert data_handler.requests == [
+        ['EQ:ABC'], ['EQ:ABC', 'EQ:DEF', 'EQ:GHI']
+    ]
+    assert [order['order_id'] for order in sb.get_executed_orders()] == [2, 1, 3]
+    assert sb.open_orders['1'].empty()
+    positions = sb.portfolios['1'].pos_handler.positions
+    assert {asset: pos.net_quantity for asset, pos in positions.items()} == {
+        'EQ:ABC': 40, 'EQ:DEF': 50, 'EQ:GHI': 20
+    }
+    assert sb.portfolios['1'].cash == 100000.0 - 1000.0 + 660.0 - 1100.0 - 660.0
@@ -0,0 +1,165 @@
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from qstrader.data.backtest_data_handler import BacktestDataHandler
+
+
+class SingleAssetDataSourceMock(object):
+    """
+    Data source mock providing only the single asset price methods.
+    """
+
+    def __init__(self, prices):
+        self.prices = prices
+        self.asset_bar_frames = {}
+
+    def get_bid(self, dt, asset):
+        return self.prices[asset]
+
+    def get_ask(self, dt, asset):
+        return self.prices[asset] + 0.5
+
+
+class BatchedDataSourceMock(SingleAssetDataSourceMock):
+    """
+    Data source mock additionally providing the batched price methods.
+    """
+
+    def get_bids(self, dt, assets):
+        return np.array([self.prices.get(asset, np.nan) for asset in assets])
+
+    def get_asks(self, dt, assets):
+        return self.get_bids(dt, assets) + 0.5
+
+    def get_bids_at(self, dts, assets):
+        return np.tile(self.get_bids(dts[0], assets), (len(dts), 1))
+
+
+@pytest.mark.parametrize(
+    'assets,expected_bids,expected_asks',
+    [
+        (['EQ:ABC', 'EQ:DEF'], [10.0, 20.0], [10.5, 20.5]),
+        (['EQ:GHI', 'EQ:ABC'], [30.0, 10.0], [30.5, 10.5]),
+        (['EQ:JKL', 'EQ:DEF'], [np.nan, 20.0], [np.nan, 20.5]),
+        ([], [], [])
+    ]
+)
+def test_get_assets_latest_prices(assets, expected_bids, expected_asks):
+    """
+    Checks that batched price requests take the first non-NaN
+    price for each asset across both batched and single asset
+    data sources, preserving the order of the provided assets.
+    """
+    dt = pd.Timestamp('2020-01-02 16:00:00', tz='America/New_York')
+    data_sources = [
+        BatchedDataSourceMock({'EQ:ABC': 10.0, 'EQ:DEF': 20.0}),
+        SingleAssetDataSourceMock({'EQ:ABC': 99.0, 'EQ:GHI': 30.0})
+    ]
+    data_handler = BacktestDataHandler(Mock(), data_sources=data_sources)
+
+    np.testing.assert_equal(
+        data_handler.get_assets_latest_bid_prices(dt, assets), expected_bids
+    )
+    np.testing.assert_equal(
+        data_handler.get_assets_latest_ask_prices(dt, assets), expected_asks
+    )
+    np.testing.assert_equal(
+        data_handler.get_assets_latest_mid_prices(dt, assets), expected_bids
+    )
+    for asset, expected_bid in zip(assets, expected_bids):
+        np.testing.assert_equal(
+            data_handler.get_asset_latest_mid_price(dt, asset), expected_bid
+        )
+
+
+class RaisingDataSourceMock(BatchedDataSourceMock):
+    """
+    Batched data source mock raising on any symbol it does not hold,
+    as a data source raising on an unknown symbol would.
+    """
+
+    def get_bid(self, dt, asset):
+        return self.prices[asset]
+
+    def get_bids(self, dt, assets):
+        return np.array([self.prices[asset] for asset in assets])
+
+
+def test_get_assets_prices_falls_through_raising_data_source():
+    """
+    Checks that a batched data source raising on an unknown symbol
+    does not abort the lookup, with its known assets priced and the
+    remainder priced by the next data source.
+    """
+    dt = pd.Timestamp('2020-01-02 16:00:00', tz='America/New_York')
+    data_sources = [
+        RaisingDataSourceMock({'EQ:ABC': 10.0}),
+        BatchedDataSourceMock({'EQ:ABC': 99.0, 'EQ:DEF': 20.0})
+    ]
+    data_handler = BacktestDataHandler(Mock(), data_sources=data_sources)
+    assets = ['EQ:ABC', 'EQ:DEF', 'EQ:GHI']
+
+    np.testing.assert_equal(
+        data_handler.get_assets_latest_bid_prices(dt, assets),
+        [10.0, 20.0, np.nan]
+    )
+    np.testing.assert_equal(
+        data_handler.get_assets_bid_prices_at(pd.DatetimeIndex([dt, dt]), assets),
+        [[10.0, 20.0, np.nan], [10.0, 20.0, np.nan]]
+    )
+
+
+class BarFramesDataSourceMock(object):
+    """
+    Data source mock providing only the asset bar frames.
+    """
+
+    def __init__(self, asset_dates):
+        self.asset_bar_frames = {
+            asset: pd.DataFrame(
+                {'Close': 1.0},
+                index=pd.DatetimeIndex(dates, tz='America/New_York', name='Date')
+            )
+            for asset, dates in asset_dates.items()
+        }
+
+
+@pytest.mark.parametrize(
+    'calendar,expected_days',
+    [
+        ('union', ['2020-01-02', '2020-01-03', '2020-01-06', '2020-01-07']),
+        ('intersection', ['2020-01-03', '2020-01-06']),
+        ('longest', ['2020-01-02', '2020-01-03', '2020-01-06'])
+    ]
+)
+def test_get_trading_days(calendar, expected_days):
+    """
+    Checks that the master trading calendar is derived from the
+    dates of the assets across all data sources and is cached.
+    """
+    data_sources = [
+        BarFramesDataSourceMock({
+            'EQ:ABC': ['2020-01-02', '2020-01-03', '2020-01-06'],
+            'EQ:DEF': ['2020-01-03', '2020-01-06']
+        }),
+        BarFramesDataSourceMock({'EQ:GHI': ['2020-01-03', '2020-01-06', '2020-01-07']})
+    ]
+    data_handler = BacktestDataHandler(Mock(), data_sources=data_sources, calendar=calendar)
+
+    trading_days = data_handler.get_trading_days()
+    pd.testing.assert_index_equal(
+        trading_days, pd.DatetimeIndex(expected_days, tz='America/New_York')
+    )
+    assert data_handler.get_trading_days() is trading_days
+    assert data_handler.get_longest_asset() == 'EQ:ABC'
+
+
+def test_unknown_calendar_raises_value_error():
+    """
+    Checks that an unknown trading calendar raises a ValueError.
+    """
+    with pytest.raises(ValueError):
+        BacktestDataHandler(Mock(), data_sources=[], calendar='weekdays')
@@ -0,0 +1,89 @@
+import os
+
+import pandas as pd
+import pytest
+
+from qstrader import settings
+from qstrader.data.bar_cache import BarFrameCache
+from qstrader.data.daily_bar_csv import CSVDailyBarDataSource
+
+
+CSV_CONTENTS = (
+    "Date,Open,High,Low,Close,Adj Close,Volume,Dividends\n"
+    "2020-01-02,100.0,102.0,99.0,101.0,50.5,1000,0.0\n"
+    "2020-01-03,101.5,103.0,100.0,102.5,51.25,1200,0.25\n"
+    "2020-01-06,102.0,104.0,101.0,103.0,51.5,900,0.0\n"
+)
+
+
+@pytest.fixture
+def csv_dir(tmp_path):
+    data_dir = tmp_path / 'data'
+    data_dir.mkdir()
+    (data_dir / 'ABC.csv').write_text(CSV_CONTENTS)
+    return str(data_dir)
+
+
+@pytest.mark.parametrize('adjust_prices', [False, True])
+def test_data_source_cache_round_trip(monkeypatch, tmp_path, csv_dir, adjust_prices):
+    """
+    Checks that a data source loading from the cache produces
+    DataFrames identical to those parsed directly from the CSV files.
+    """
+    monkeypatch.setattr(settings, 'PRINT_EVENTS', False)
+    cache_dir = str(tmp_path / 'cache')
+
+    uncached_ds = CSVDailyBarDataSource(csv_dir, None, adjust_prices=adjust_prices)
+    first_ds = CSVDailyBarDataSource(
+        csv_dir, None, adjust_prices=adjust_prices, cache_dir=cache_dir
+    )
+    assert len(os.listdir(cache_dir)) == 1
+    cached_ds = CSVDailyBarDataSource(
+        csv_dir, None, adjust_prices=adjust_prices, cache_dir=cache_dir
+    )
+
+    for ds in (first_ds, cached_ds):
+        pd.testing.assert_frame_equal(
+            ds.asset_bar_frames['EQ:ABC'], uncached_ds.asset_bar_frames['EQ:ABC']
+        )
+        pd.testing.assert_frame_equal(
+            ds.asset_bid_ask_frames['EQ:ABC'], uncached_ds.asset_bid_ask_frames['EQ:ABC']
+        )
+        pd.testing.assert_frame_equal(
+            ds.dividend_frames['EQ:ABC'], uncached_ds.dividend_frames['EQ:ABC']
+        )
+
+
+def test_cache_invalidated_on_modification(monkeypatch, tmp_path, csv_dir):
+    """
+    Checks that modifying a CSV file or the price adjustment setting
+    results in a cache miss.
+    """
+    csv_path = os.path.join(csv_dir, 'ABC.csv')
+    cache = BarFrameCache(str(tmp_path / 'cache'))
+    monkeypatch.setattr(settings, 'PRINT_EVENTS', False)
+    ds = CSVDailyBarDataSource(csv_dir, None)
+
+    assert cache.load(csv_path, False) is None
+    assert cache.save(
+        csv_path, False, ds.asset_bar_frames['EQ:ABC'], ds.asset_bid_ask_frames['EQ:ABC']
+    )
+    assert cache.load(csv_path, False) is not None
+    assert cache.load(csv_path, True) is None
+
+    with open(csv_path, 'a') as csv_file:
+        csv_file.write("2020-01-07,103.0,105.0,102.0,104.0,52.0,800,0.0\n")
+    assert cache.load(csv_path, False) is None
+
+
+def test_cache_skips_non_numeric_frames(tmp_path, csv_dir):
+    """
+    Checks that DataFrames with non-numeric columns are not cached.
+    """
+    csv_path = os.path.join(csv_dir, 'ABC.csv')
+    cache = BarFrameCache(str(tmp_path / 'cache'))
+    index = pd.DatetimeIndex(['2020-01-02']).tz_localize('America/New_York')
+    bar_df = pd.DataFrame({'Close': [1.0], 'Exchange': ['NYSE']}, index=index)
+
+    assert not cache.save(csv_path, False, bar_df, bar_df[['Close']])
+    assert cache.load(csv_path, False) is None
@@ -0,0 +1,195 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from qstrader import settings
+from qstrader.asset.universe.static import StaticUniverse
+from qstrader.data.backtest_data_handler import BacktestDataHandler
+from qstrader.data.daily_bar_csv import CSVDailyBarDataSource
+
+
+CSV_CONTENTS = {
+    'ABC': (
+        "Date,Open,High,Low,Close,Adj Close,Volume\n"
+        "2020-01-02,100.0,102.0,99.0,101.0,101.0,1000\n"
+        "2020-01-03,101.5,103.0,100.0,102.5,102.5,1200\n"
+    ),
+    'DEF': (
+        "Date,Open,High,Low,Close,Adj Close,Volume\n"
+        "2020-01-02,50.0,51.0,49.0,50.5,50.5,500\n"
+        "2020-01-03,50.5,52.0,50.0,51.5,51.5,600\n"
+    )
+}
+
+
+@pytest.fixture
+def csv_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, 'PRINT_EVENTS', False)
+    for symbol, contents in CSV_CONTENTS.items():
+        (tmp_path / ('%s.csv' % symbol)).write_text(contents)
+    return str(tmp_path)
+
+
+@pytest.mark.parametrize('array_store', [False, True])
+def test_lazy_loading_on_access(csv_dir, array_store):
+    """
+    Checks that a lazily-loading data source parses no CSV files
+    until an asset is queried, and then only loads that asset, while
+    producing identical prices to an eagerly-loading data source.
+    """
+    eager_ds = CSVDailyBarDataSource(csv_dir, None, array_store=array_store)
+    lazy_ds = CSVDailyBarDataSource(csv_dir, None, array_store=array_store, lazy=True)
+
+    assert lazy_ds.asset_bar_frames.frames == {}
+    assert set(lazy_ds.asset_bar_frames) == {'EQ:ABC', 'EQ:DEF'}
+    assert 'EQ:ABC' in lazy_ds.asset_bid_ask_frames
+
+    dt = pd.Timestamp('2020-01-03 16:00:00', tz='America/New_York')
+    assert lazy_ds.get_bid(dt, 'EQ:ABC') == eager_ds.get_bid(dt, 'EQ:ABC')
+    assert list(lazy_ds.asset_bar_frames.frames.keys()) == ['EQ:ABC']
+
+    np.testing.assert_array_equal(
+        lazy_ds.get_asks(dt, ['EQ:DEF', 'EQ:ABC']),
+        eager_ds.get_asks(dt, ['EQ:DEF', 'EQ:ABC'])
+    )
+    pd.testing.assert_frame_equal(
+        lazy_ds.dividend_frames['EQ:DEF'], eager_ds.dividend_frames['EQ:DEF']
+    )
+
+
+def test_lazy_array_store_extended_per_asset(csv_dir):
+    """
+    Checks that loading the assets of a lazily-loading data source one
+    at a time extends its array-backed price store in place, matching
+    the price store of an eagerly-loading data source.
+    """
+    eager_ds = CSVDailyBarDataSource(csv_dir, None, array_store=True)
+    lazy_ds = CSVDailyBarDataSource(csv_dir, None, array_store=True, lazy=True)
+    price_store = lazy_ds.price_store
+
+    for asset in ['EQ:DEF', 'EQ:ABC']:
+        lazy_ds.prefetch([asset])
+        assert lazy_ds.price_store is price_store
+        assert price_store.assets[-1] == asset
+
+    for asset in ['EQ:ABC', 'EQ:DEF']:
+        col = price_store.asset_index[asset]
+        eager_col = eager_ds.price_store.asset_index[asset]
+        np.testing.assert_array_equal(
+            price_store.bids[:, col], eager_ds.price_store.bids[:, eager_col]
+        )
+    np.testing.assert_array_equal(
+        price_store.timestamps, eager_ds.price_store.timestamps
+    )
+
+
+def test_lazy_loading_unknown_asset(csv_dir):
+    """
+    Checks that querying an asset without a CSV file from a lazily-
+    loading data source raises a KeyError for a single asset and
+    returns NaN for a batch of assets.
+    """
+    lazy_ds = CSVDailyBarDataSource(csv_dir, None, lazy=True)
+    dt = pd.Timestamp('2020-01-03 16:00:00', tz='America/New_York')
+    with pytest.raises(KeyError):
+        lazy_ds.asset_bar_frames['EQ:XYZ']
+    assert np.isnan(lazy_ds.get_bids(dt, ['EQ:XYZ'])[0])
+
+
+def test_backtest_data_handler_prefetches_universe(csv_dir):
+    """
+    Checks that the BacktestDataHandler only loads the Universe
+    assets from a lazily-loading data source.
+    """
+    lazy_ds = CSVDailyBarDataSource(csv_dir, None, lazy=True)
+    data_handler = BacktestDataHandler(
+        StaticUniverse(['EQ:DEF', 'EQ:XYZ']), data_sources=[lazy_ds]
+    )
+    assert list(lazy_ds.asset_bar_frames.frames.keys()) == ['EQ:DEF']
+    assert list(data_handler.data_source_stats.keys()) == ['EQ:DEF']
+    assert data_handler.data_source_stats['EQ:DEF']['length'] == 2
+
+
+@pytest.mark.parametrize('adjust_prices', [False, True])
+def test_workers_match_sequential_loading(csv_dir, adjust_prices):
+    """
+    Checks that concurrently loading the CSV files with a pool of
+    workers produces identical, identically-ordered DataFrames to
+    sequential loading.
+    """
+    seq_ds = CSVDailyBarDataSource(csv_dir, None, adjust_prices=adjust_prices)
+    par_ds = CSVDailyBarDataSource(
+        csv_dir, None, adjust_prices=adjust_prices, workers=2
+    )
+    assert list(par_ds.asset_bar_frames.keys()) == list(seq_ds.asset_bar_frames.keys())
+    assert list(par_ds.asset_bid_ask_frames.keys()) == list(seq_ds.asset_bid_ask_frames.keys())
+    for asset in seq_ds.asset_bar_frames.keys():
+        pd.testing.assert_frame_equal(
+            par_ds.asset_bar_frames[asset], seq_ds.asset_bar_frames[asset]
+        )
+        pd.testing.assert_frame_equal(
+            par_ds.asset_bid_ask_frames[asset], seq_ds.asset_bid_ask_frames[asset]
+        )
+
+
+@pytest.mark.parametrize('array_store', [False, True])
+def test_get_bids_asks_at(csv_dir, array_store):
+    """
+    Checks that the prices of many assets at many timestamps match
+    the corresponding single timestamp lookups, both directly and
+    via the data handler.
+    """
+    ds = CSVDailyBarDataSource(csv_dir, None, array_store=array_store)
+    dts = pd.DatetimeIndex(
+        ['2020-01-02 09:30', '2020-01-02 16:00', '2020-01-03 09:30', '2020-01-03 16:00'],
+        tz='America/New_York'
+    )
+    assets = ['EQ:DEF', 'EQ:XYZ', 'EQ:ABC']
+    expected_bids = np.array([ds.get_bids(dt, assets) for dt in dts])
+    expected_asks = np.array([ds.get_asks(dt, assets) for dt in dts])
+
+    np.testing.assert_equal(ds.get_bids_at(dts, assets), expected_bids)
+    np.testing.assert_equal(ds.get_asks_at(dts, assets), expected_asks)
+
+    data_handler = BacktestDataHandler(
+        StaticUniverse(['EQ:ABC', 'EQ:DEF']), data_sources=[ds]
+    )
+    np.testing.assert_equal(
+        data_handler.get_assets_bid_prices_at(dts, assets), expected_bids
+    )
+    np.testing.assert_equal(
+        data_handler.get_assets_ask_prices_at(dts, assets), expected_asks
+    )
+
+
+@pytest.mark.parametrize(
+    'array_store,off_axis_bid,pre_listing_bid',
+    [(False, 103.0, 20.5), (True, 102.5, np.nan)]
+)
+def test_prices_absent_from_asset_bars(
+    tmp_path, monkeypatch, array_store, off_axis_bid, pre_listing_bid
+):
+    """
+    Checks the prices at timestamps absent from the bars of an asset,
+    which are the final price of the asset for the DataFrame lookups,
+    while the array store forward-fills the latest price and is NaN
+    prior to the first bar of the asset.
+    """
+    monkeypatch.setattr(settings, 'PRINT_EVENTS', False)
+    (tmp_path / 'ABC.csv').write_text(
+        CSV_CONTENTS['ABC'] + "2020-01-06,102.0,104.0,101.0,103.0,103.0,900\n"
+    )
+    (tmp_path / 'GHI.csv').write_text(
+        "Date,Open,High,Low,Close,Adj Close,Volume\n"
+        "2020-01-06,20.0,21.0,19.0,20.5,20.5,300\n"
+    )
+    ds = CSVDailyBarDataSource(str(tmp_path), None, array_store=array_store)
+    off_axis_dt = pd.Timestamp('2020-01-03 18:00:00', tz='America/New_York')
+    pre_listing_dt = pd.Timestamp('2020-01-03 16:00:00', tz='America/New_York')
+
+    np.testing.assert_equal(ds.get_bid(off_axis_dt, 'EQ:ABC'), off_axis_bid)
+    np.testing.assert_equal(ds.get_bid(pre_listing_dt, 'EQ:GHI'), pre_listing_bid)
+    np.testing.assert_equal(
+        ds.get_bids(pre_listing_dt, ['EQ:ABC', 'EQ:GHI']),
+        np.array([102.5, pre_listing_bid])
+    )
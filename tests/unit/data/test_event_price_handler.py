@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from qstrader import settings
+from qstrader.asset.universe.static import StaticUniverse
+from qstrader.data.backtest_data_handler import BacktestDataHandler
+from qstrader.data.daily_bar_csv import CSVDailyBarDataSource
+from qstrader.data.event_price_handler import EventPriceDataHandler
+
+
+CSV_CONTENTS = {
+    'ABC': (
+        "Date,Open,High,Low,Close,Adj Close,Volume,Dividends\n"
+        "2020-01-02,100.0,102.0,99.0,101.0,101.0,1000,0.0\n"
+        "2020-01-03,101.5,103.0,100.0,102.5,102.5,1200,0.25\n"
+        "2020-01-06,102.0,104.0,101.0,103.0,103.0,900,0.0\n"
+    ),
+    'DEF': (
+        "Date,Open,High,Low,Close,Adj Close,Volume,Dividends\n"
+        "2020-01-03,50.5,52.0,50.0,51.5,51.5,600,0.0\n"
+        "2020-01-06,51.5,53.0,51.0,52.5,52.5,700,0.1\n"
+    )
+}
+
+EVENT_TIMES = pd.DatetimeIndex([
+    '%s %s' % (day, hour)
+    for day in ['2020-01-02', '2020-01-03', '2020-01-06']
+    for hour in ['09:30:00', '16:00:00']
+], tz='America/New_York')
+
+
+@pytest.fixture
+def data_handler(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, 'PRINT_EVENTS', False)
+    for symbol, contents in CSV_CONTENTS.items():
+        (tmp_path / ('%s.csv' % symbol)).write_text(contents)
+    universe = StaticUniverse(['EQ:ABC', 'EQ:DEF'])
+    ds = CSVDailyBarDataSource(str(tmp_path), None)
+    return BacktestDataHandler(universe, data_sources=[ds])
+
+
+@pytest.fixture
+def price_handler(data_handler):
+    bids = data_handler.get_assets_bid_prices_at(EVENT_TIMES, ['EQ:ABC'])
+    asks = data_handler.get_assets_ask_prices_at(EVENT_TIMES, ['EQ:ABC'])
+    return EventPriceDataHandler(
+        data_handler, EVENT_TIMES, {'EQ:ABC': bids[:, 0]}, {'EQ:ABC': asks[:, 0]}
+    )
+
+
+def test_current_event_prices_match_data_handler(data_handler, price_handler):
+    """
+    Checks that the latest prices at each event match those of the
+    wrapped data handler, including assets without precomputed prices.
+    """
+    assets = ['EQ:ABC', 'EQ:DEF']
+    for event_idx, dt in enumerate(EVENT_TIMES):
+        price_handler.set_event(event_idx)
+        for method in [
+            'get_assets_latest_bid_prices', 'get_assets_latest_ask_prices',
+            'get_assets_latest_mid_prices'
+        ]:
+            np.testing.assert_array_equal(
+                getattr(price_handler, method)(dt, assets),
+                getattr(data_handler, method)(dt, assets)
+            )
+        for asset in assets:
+            for method in [
+                'get_asset_latest_bid_price', 'get_asset_latest_ask_price',
+                'get_asset_latest_bid_ask_price', 'get_asset_latest_mid_price'
+            ]:
+                np.testing.assert_array_equal(
+                    getattr(price_handler, method)(dt, asset),
+                    getattr(data_handler, method)(dt, asset)
+                )
+
+
+def test_other_times_are_passed_through(price_handler):
+    """
+    Checks that queries away from the current event, along with
+    all other attributes, are passed to the wrapped data handler.
+    """
+    price_handler.set_event(0)
+    dt = EVENT_TIMES[3]
+    assert price_handler.get_asset_latest_bid_price(dt, 'EQ:ABC') == 102.5
+    assert price_handler.get_asset_dividend(EVENT_TIMES[3], 'EQ:ABC') == 0.25
+    assert price_handler.universe is price_handler.data_handler.universe
@@ -0,0 +1,145 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from qstrader.data.price_store import ArrayPriceStore
+
+
+def _bid_ask_df(dates, prices):
+    index = pd.DatetimeIndex(dates).tz_localize('America/New_York')
+    return pd.DataFrame({'Bid': prices, 'Ask': prices}, index=index)
+
+
+@pytest.fixture
+def price_store():
+    bid_ask_frames = {
+        'EQ:ABC': _bid_ask_df(
+            ['2020-01-02 09:30', '2020-01-02 16:00', '2020-01-03 09:30', '2020-01-03 16:00'],
+            [100.0, 101.0, 102.0, 103.0]
+        ),
+        'EQ:DEF': _bid_ask_df(
+            ['2020-01-03 09:30', '2020-01-03 16:00', '2020-01-06 09:30'],
+            [50.0, 51.0, 52.0]
+        )
+    }
+    return ArrayPriceStore.from_bid_ask_frames(bid_ask_frames)
+
+
+def test_shared_timestamp_axis(price_store):
+    """
+    Checks that the asset prices are packed onto the union of
+    all of the asset timestamps.
+    """
+    assert price_store.assets == ['EQ:ABC', 'EQ:DEF']
+    assert price_store.timestamps.dtype == np.int64
+    assert price_store.bids.shape == (5, 2)
+    assert len(price_store.row_index) == 5
+
+
+@pytest.mark.parametrize(
+    'dt,asset,expected',
+    [
+        ('2020-01-02 16:00', 'EQ:ABC', 101.0),
+        ('2020-01-03 09:30', 'EQ:DEF', 50.0),
+        ('2020-01-02 16:00', 'EQ:DEF', np.nan),
+        ('2020-01-06 09:30', 'EQ:ABC', 103.0),
+        ('2020-01-03 12:00', 'EQ:ABC', 102.0),
+        ('2020-01-01 16:00', 'EQ:ABC', np.nan),
+        ('2020-01-10 16:00', 'EQ:DEF', 52.0)
+    ]
+)
+def test_get_bid_ask(price_store, dt, asset, expected):
+    """
+    Checks that exact and as-of timestamp lookups return the latest
+    available price, with NaN prior to the first available price.
+    """
+    ts = pd.Timestamp(dt, tz='America/New_York')
+    np.testing.assert_equal(price_store.get_bid(ts, asset), expected)
+    np.testing.assert_equal(price_store.get_ask(ts, asset), expected)
+
+
+def test_unknown_asset_raises(price_store):
+    """
+    Checks that querying an asset not within the store raises a KeyError.
+    """
+    with pytest.raises(KeyError):
+        price_store.get_bid(pd.Timestamp('2020-01-02 16:00', tz='America/New_York'), 'EQ:XYZ')
+
+
+def test_get_bids_asks(price_store):
+    """
+    Checks that batched lookups gather the prices of many assets in
+    the order provided, with NaN for unknown assets.
+    """
+    ts = pd.Timestamp('2020-01-03 16:00', tz='America/New_York')
+    assets = ['EQ:DEF', 'EQ:XYZ', 'EQ:ABC']
+    np.testing.assert_equal(price_store.get_bids(ts, assets), [51.0, np.nan, 103.0])
+    np.testing.assert_equal(price_store.get_asks(ts, assets), [51.0, np.nan, 103.0])
+
+    early_ts = pd.Timestamp('2019-12-31 16:00', tz='America/New_York')
+    np.testing.assert_equal(price_store.get_bids(early_ts, assets), [np.nan] * 3)
+
+
+def test_save_load_memory_mapped(price_store, tmp_path):
+    """
+    Checks that a saved price store can be loaded with its price
+    arrays memory-mapped read-only and identical prices.
+    """
+    price_store.save(str(tmp_path))
+    loaded_store = ArrayPriceStore.load(str(tmp_path), mmap_mode='r')
+    assert loaded_store.assets == price_store.assets
+    assert isinstance(loaded_store.bids, np.memmap)
+    assert not loaded_store.bids.flags.writeable
+    np.testing.assert_array_equal(loaded_store.timestamps, price_store.timestamps)
+    np.testing.assert_array_equal(loaded_store.bids, price_store.bids)
+    np.testing.assert_array_equal(loaded_store.asks, price_store.asks)
+
+
+def test_get_bids_asks_at(price_store):
+    """
+    Checks that the prices of many assets at many timestamps match
+    the corresponding single timestamp lookups.
+    """
+    dts = pd.DatetimeIndex(
+        ['2020-01-01 16:00', '2020-01-02 16:00', '2020-01-03 12:00', '2020-01-10 16:00'],
+        tz='America/New_York'
+    )
+    assets = ['EQ:DEF', 'EQ:XYZ', 'EQ:ABC']
+    expected = np.array([
+        price_store.get_bids(dt, assets) for dt in dts
+    ])
+    np.testing.assert_equal(price_store.get_bids_at(dts, assets), expected)
+    np.testing.assert_equal(price_store.get_asks_at(dts, assets), expected)
+
+
+def test_add_assets_one_at_a_time():
+    """
+    Checks that adding assets one at a time, including assets priced
+    at timestamps not already on the axis, matches constructing the
+    store from all of the assets at once.
+    """
+    bid_ask_frames = {
+        'EQ:ABC': _bid_ask_df(
+            ['2020-01-02 16:00', '2020-01-03 16:00', '2020-01-07 16:00'],
+            [100.0, np.nan, 103.0]
+        ),
+        'EQ:DEF': _bid_ask_df(['2020-01-03 16:00', '2020-01-06 16:00'], [50.0, 51.0]),
+        'EQ:GHI': _bid_ask_df(['2020-01-01 16:00', '2020-01-07 16:00'], [10.0, 11.0]),
+        'EQ:JKL': _bid_ask_df(['2020-01-06 16:00'], [70.0])
+    }
+    expected = ArrayPriceStore.from_bid_ask_frames(bid_ask_frames)
+
+    price_store = ArrayPriceStore.from_bid_ask_frames({})
+    for asset, bid_ask_df in bid_ask_frames.items():
+        price_store.add_assets({asset: bid_ask_df})
+        price_store.add_assets({asset: bid_ask_df})
+
+    assert price_store.assets == expected.assets
+    np.testing.assert_array_equal(price_store.timestamps, expected.timestamps)
+    np.testing.assert_array_equal(price_store.bids, expected.bids)
+    np.testing.assert_array_equal(price_store.asks, expected.asks)
+    dt = pd.Timestamp('2020-01-06 16:00', tz='America/New_York')
+    assert price_store.get_bid(dt, 'EQ:JKL') == 70.0
+    np.testing.assert_array_equal(
+        price_store.get_bids(dt, ['EQ:JKL', 'EQ:ABC', 'EQ:XYZ']), [70.0, 100.0, np.nan]
+    )
@@ -0,0 +1,123 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from qstrader import settings
+from qstrader.asset.universe.static import StaticUniverse
+from qstrader.data.backtest_data_handler import BacktestDataHandler
+from qstrader.data.daily_bar_csv import CSVDailyBarDataSource
+from qstrader.data.shared_panel import SharedPanelDataSource
+
+
+CSV_CONTENTS = {
+    'ABC': (
+        "Date,Open,High,Low,Close,Adj Close,Volume,Dividends\n"
+        "2020-01-02,100.0,102.0,99.0,101.0,101.0,1000,0.0\n"
+        "2020-01-03,101.5,103.0,100.0,102.5,102.5,1200,0.25\n"
+        "2020-01-06,102.0,104.0,101.0,103.0,103.0,900,0.0\n"
+    ),
+    'DEF': (
+        "Date,Open,High,Low,Close,Adj Close,Volume,Dividends\n"
+        "2020-01-03,50.5,52.0,50.0,51.5,51.5,600,0.0\n"
+        "2020-01-06,51.5,53.0,51.0,52.5,52.5,700,0.1\n"
+    )
+}
+
+
+@pytest.fixture
+def csv_ds(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, 'PRINT_EVENTS', False)
+    csv_dir = tmp_path / 'data'
+    csv_dir.mkdir()
+    for symbol, contents in CSV_CONTENTS.items():
+        (csv_dir / ('%s.csv' % symbol)).write_text(contents)
+    return CSVDailyBarDataSource(str(csv_dir), None, array_store=True)
+
+
+@pytest.fixture
+def panel_ds(tmp_path, csv_ds):
+    panel_dir = str(tmp_path / 'panel')
+    SharedPanelDataSource.build_panel(panel_dir, csv_ds)
+    return SharedPanelDataSource(panel_dir)
+
+
+def test_panel_is_memory_mapped(panel_ds):
+    """
+    Checks that the panel price arrays are memory-mapped read-only.
+    """
+    for prices in (panel_ds.price_store.bids, panel_ds.price_store.asks, panel_ds.closes):
+        assert isinstance(prices, np.memmap)
+        assert not prices.flags.writeable
+
+
+def test_panel_prices_match_csv(panel_ds, csv_ds):
+    """
+    Checks that the panel bid/ask prices and dividends match
+    those of the data source it was built from.
+    """
+    for day in ['2020-01-02', '2020-01-03', '2020-01-06']:
+        for hour in ['09:30:00', '16:00:00']:
+            dt = pd.Timestamp('%s %s' % (day, hour), tz='America/New_York')
+            np.testing.assert_array_equal(
+                panel_ds.get_bids(dt, ['EQ:ABC', 'EQ:DEF', 'EQ:XYZ']),
+                csv_ds.get_bids(dt, ['EQ:ABC', 'EQ:DEF', 'EQ:XYZ'])
+            )
+    for asset in ['EQ:ABC', 'EQ:DEF']:
+        for dt in csv_ds.dividend_frames[asset].index:
+            assert panel_ds.get_dividend(dt, asset) == csv_ds.get_dividend(dt, asset)
+    assert panel_ds.get_dividend(
+        pd.Timestamp('2020-01-03 16:00:00', tz='America/New_York'), 'EQ:ABC'
+    ) == 0.25
+
+
+def test_panel_bar_frames_and_closes(panel_ds, csv_ds):
+    """
+    Checks that the panel produces the same asset date indices and
+    historical closing prices as the data source it was built from.
+    """
+    assert panel_ds.asset_bar_frames.frames == {}
+    for asset in ['EQ:ABC', 'EQ:DEF']:
+        pd.testing.assert_index_equal(
+            panel_ds.asset_bar_frames[asset].index,
+            csv_ds.asset_bar_frames[asset].index
+        )
+
+    start_dt = pd.Timestamp('2020-01-02', tz='America/New_York')
+    end_dt = pd.Timestamp('2020-01-06', tz='America/New_York')
+    pd.testing.assert_frame_equal(
+        panel_ds.get_assets_historical_closes(start_dt, end_dt, ['EQ:DEF', 'EQ:ABC']),
+        csv_ds.get_assets_historical_closes(start_dt, end_dt, ['EQ:DEF', 'EQ:ABC']),
+        check_freq=False
+    )
+
+
+def test_build_panel_existing_dir_raises(tmp_path, csv_ds):
+    """
+    Checks that building a panel into an existing directory
+    raises a ValueError.
+    """
+    with pytest.raises(ValueError):
+        SharedPanelDataSource.build_panel(str(tmp_path), csv_ds)
+
+
+def test_dividends_at_match_dividend(panel_ds, csv_ds):
+    """
+    Checks that the batched dividends of the CSV and panel data sources,
+    along with those of a data handler, match the per-timestamp dividends.
+    """
+    dts = pd.DatetimeIndex([
+        pd.Timestamp('%s %s' % (day, hour), tz='America/New_York')
+        for day in ['2020-01-02', '2020-01-03', '2020-01-06', '2020-01-07']
+        for hour in ['09:30:00', '16:00:00']
+    ])
+    assets = ['EQ:ABC', 'EQ:DEF', 'EQ:XYZ']
+    universe = StaticUniverse(assets)
+    for ds in (csv_ds, panel_ds):
+        expected = np.array([[ds.get_dividend(dt, asset) for asset in assets] for dt in dts])
+        np.testing.assert_array_equal(ds.get_dividends_at(dts, assets), expected)
+        np.testing.assert_array_equal(
+            BacktestDataHandler(universe, data_sources=[ds]).get_assets_dividends_at(
+                dts, assets
+            ),
+            expected
+        )
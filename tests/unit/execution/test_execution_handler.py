@@ -0,0 +1,64 @@
+import pandas as pd
+import pytest
+
+from qstrader.execution.execution_algo.market_order import (
+    MarketOrderExecutionAlgorithm
+)
+from qstrader.execution.execution_handler import ExecutionHandler
+from qstrader.execution.order import Order
+
+
+class BrokerMock(object):
+    def __init__(self):
+        self.calls = []
+
+    def submit_order(self, portfolio_id, order):
+        self.calls.append(('submit_order', portfolio_id, order.asset))
+
+    def update(self, dt):
+        self.calls.append(('update', dt))
+
+
+class BrokerMockBatched(BrokerMock):
+    def submit_orders(self, portfolio_id, orders, dt):
+        self.calls.append(
+            ('submit_orders', portfolio_id, [order.asset for order in orders], dt)
+        )
+
+
+@pytest.mark.parametrize(
+    'broker,expected_calls',
+    [
+        (
+            BrokerMockBatched(),
+            [('submit_orders', '000001', ['EQ:ABC', 'EQ:DEF'], 'dt')]
+        ),
+        (
+            BrokerMock(),
+            [
+                ('submit_order', '000001', 'EQ:ABC'), ('update', 'dt'),
+                ('submit_order', '000001', 'EQ:DEF'), ('update', 'dt')
+            ]
+        )
+    ]
+)
+def test_execution_handler_submits_orders(broker, expected_calls):
+    """
+    Checks that the orders are submitted to the broker as a single
+    batch where supported, otherwise individually, and that an empty
+    list of orders is not submitted.
+    """
+    dt = pd.Timestamp('2020-01-02 14:30:00', tz='UTC')
+    orders = [Order(dt, 'EQ:ABC', 100), Order(dt, 'EQ:DEF', -50)]
+    execution_handler = ExecutionHandler(
+        broker, '000001', None, submit_orders=True,
+        execution_algo=MarketOrderExecutionAlgorithm()
+    )
+
+    execution_handler(dt, [])
+    assert broker.calls == []
+
+    execution_handler(dt, orders)
+    assert broker.calls == [
+        tuple(dt if arg == 'dt' else arg for arg in call) for call in expected_calls
+    ]
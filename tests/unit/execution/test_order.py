@@ -0,0 +1,37 @@
+import pandas as pd
+import pytest
+
+from qstrader import settings
+from qstrader.execution.order import Order
+
+
+def test_order_ids_sequential(monkeypatch):
+    """
+    Checks that sequential order IDs are increasing integer strings,
+    that provided order IDs are retained and that UUID order IDs
+    remain the default.
+    """
+    dt = pd.Timestamp('2020-01-02 14:30:00', tz='UTC')
+    assert len(Order(dt, 'EQ:ABC', 100).order_id) == 32
+
+    monkeypatch.setattr(settings, 'ORDER_IDS', 'sequential')
+    order_ids = [int(Order(dt, 'EQ:ABC', 100).order_id) for _ in range(3)]
+    assert order_ids == [order_ids[0], order_ids[0] + 1, order_ids[0] + 2]
+    assert Order(dt, 'EQ:ABC', 100, order_id='abc').order_id == 'abc'
+
+
+def test_set_order_ids_raises_value_error():
+    """
+    Checks that an unknown order ID generation raises a ValueError.
+    """
+    with pytest.raises(ValueError):
+        settings.set_order_ids('random')
+
+
+def test_order_is_slotted():
+    """
+    Checks that Orders do not carry a per-instance dictionary.
+    """
+    order = Order(pd.Timestamp('2020-01-02 14:30:00', tz='UTC'), 'EQ:ABC', 100)
+    with pytest.raises(AttributeError):
+        order.notes = 'unslotted attribute'
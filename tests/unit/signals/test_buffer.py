@@ -0,0 +1,118 @@
+from collections import deque
+
+import numpy as np
+import pytest
+
+from qstrader.signals.buffer import AssetPriceBuffers
+
+
+@pytest.mark.parametrize(
+    'lookbacks,prices,lookback,expected',
+    [
+        ([3], [1.0, 2.0], 3, [1.0, 2.0]),
+        ([3], [1.0, 2.0, 3.0, 4.0, 5.0], 3, [3.0, 4.0, 5.0]),
+        ([2, 4], [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0], 2, [6.0, 7.0]),
+        ([2, 4], [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0], 4, [4.0, 5.0, 6.0, 7.0])
+    ]
+)
+def test_get_prices_wraps_ring_buffer(lookbacks, prices, lookback, expected):
+    """
+    Checks that the most recent prices are returned, oldest first,
+    as a contiguous view once the ring buffer has wrapped around.
+    """
+    buffers = AssetPriceBuffers(['EQ:SPY'], lookbacks=lookbacks)
+    for price in prices:
+        buffers.append('EQ:SPY', price)
+
+    window = buffers.get_prices('EQ:SPY', lookback)
+    assert window.tolist() == expected
+    assert window.base is not None
+
+
+def test_append_many_and_get_windows():
+    """
+    Checks that prices appended for many assets at once are
+    returned as NaN left-padded windows, including for an asset
+    added subsequent to the creation of the buffers.
+    """
+    buffers = AssetPriceBuffers(['EQ:AAA', 'EQ:BBB'], lookbacks=[3])
+    for step in range(4):
+        buffers.append_many(np.array([10.0 + step, 20.0 + step]))
+    buffers.append_many(np.array([30.0]), assets=['EQ:CCC'])
+
+    windows, num_prices = buffers.get_windows(
+        buffers.rows(['EQ:AAA', 'EQ:BBB', 'EQ:CCC']), 3
+    )
+    np.testing.assert_array_equal(
+        windows,
+        np.array([
+            [11.0, 12.0, 13.0],
+            [21.0, 22.0, 23.0],
+            [np.nan, np.nan, 30.0]
+        ])
+    )
+    assert num_prices.tolist() == [3, 3, 1]
+
+
+def test_append_non_positive_price_raises():
+    """
+    Checks that appending a non-positive price raises a ValueError
+    without modifying the buffers.
+    """
+    buffers = AssetPriceBuffers(['EQ:AAA', 'EQ:BBB'], lookbacks=[3])
+    with pytest.raises(ValueError):
+        buffers.append_many(np.array([10.0, 0.0]))
+    assert buffers.counts.tolist() == [0, 0]
+
+
+def test_lookback_exceeding_capacity_raises():
+    """
+    Checks that requesting prices beyond the maximum lookback
+    raises a ValueError.
+    """
+    buffers = AssetPriceBuffers(['EQ:SPY'], lookbacks=[3])
+    with pytest.raises(ValueError):
+        buffers.get_prices('EQ:SPY', 4)
+
+
+def test_rows_grow_for_added_assets():
+    """
+    Checks that the rows of assets added subsequent to the creation
+    of the buffers are allocated by doubling, retaining the prices
+    of the existing assets.
+    """
+    buffers = AssetPriceBuffers(['EQ:AAA', 'EQ:BBB'], lookbacks=[2])
+    assert buffers.values.shape == (2, 4)
+    buffers.append_many(np.array([10.0, 20.0]))
+
+    for idx in range(5):
+        buffers.add_asset('EQ:X%s' % idx)
+        buffers.append_many(np.array([30.0 + idx]), assets=['EQ:X%s' % idx])
+    assert buffers.values.shape == (8, 4)
+    assert buffers.get_prices('EQ:AAA', 2).tolist() == [10.0]
+    assert buffers.get_prices('EQ:BBB', 2).tolist() == [20.0]
+    assert [
+        buffers.get_prices('EQ:X%s' % idx, 2).tolist() for idx in range(5)
+    ] == [[30.0 + idx] for idx in range(5)]
+
+
+def test_prices_dict_matches_deque_buffers():
+    """
+    Checks that the compatibility price buffer dictionary holds the
+    most recent prices of each asset-lookback pair, as did the
+    bounded deques it replaces.
+    """
+    buffers = AssetPriceBuffers(['EQ:AAA', 'EQ:BBB'], lookbacks=[2, 3])
+    deques = {
+        '%s_%s' % (asset, lookback): deque(maxlen=lookback)
+        for asset in ['EQ:AAA', 'EQ:BBB'] for lookback in [2, 3]
+    }
+    for step in range(4):
+        buffers.append('EQ:AAA', 10.0 + step)
+        for lookback in [2, 3]:
+            deques['EQ:AAA_%s' % lookback].append(10.0 + step)
+
+    prices = buffers.prices
+    assert sorted(prices.keys()) == sorted(deques.keys())
+    for key, buffer in deques.items():
+        assert prices[key].tolist() == list(buffer)
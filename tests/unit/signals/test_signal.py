@@ -0,0 +1,108 @@
+import warnings
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+import pytz
+
+from qstrader.signals.momentum import MomentumSignal
+from qstrader.signals.sma import SMASignal
+from qstrader.signals.vol import VolatilitySignal
+
+
+@pytest.mark.parametrize('signal_class', [MomentumSignal, SMASignal, VolatilitySignal])
+@pytest.mark.parametrize('lookback', [1, 3, 8])
+def test_cross_section_matches_per_asset_signal(signal_class, lookback):
+    """
+    Checks that the cross-sectional signal values of many assets,
+    including those with partially-filled and empty price buffers,
+    match the per-asset signal values.
+    """
+    universe = Mock()
+    universe.get_assets.return_value = ['EQ:AAA', 'EQ:BBB', 'EQ:CCC']
+    start_dt = pd.Timestamp('2019-01-01 14:30:00', tz=pytz.utc)
+    signal = signal_class(start_dt, universe, [1, 3, 8])
+
+    prices = 100.0 * np.cumprod(
+        1.0 + np.random.RandomState(42).normal(0.0, 0.02, (12, 2)), axis=0
+    )
+    for step in range(12):
+        signal.append('EQ:AAA', prices[step, 0])
+        if step < 2:
+            signal.append('EQ:BBB', prices[step, 1])
+
+    assets = ['EQ:CCC', 'EQ:AAA', 'EQ:BBB']
+    expected = np.array([signal(asset, lookback) for asset in assets])
+    np.testing.assert_allclose(
+        signal.cross_section(lookback, assets), expected, rtol=1e-12
+    )
+    np.testing.assert_allclose(
+        signal.cross_section(lookback), expected[[1, 2, 0]], rtol=1e-12
+    )
+
+
+@pytest.mark.parametrize(
+    'signal_class,expected',
+    [
+        (MomentumSignal, 0.03),
+        (SMASignal, 101.0),
+        (VolatilitySignal, 0.2836289835913639)
+    ]
+)
+def test_leading_missing_prices(signal_class, expected):
+    """
+    Checks that missing prices leading the price buffer, as appended
+    for assets prior to their first price, do not prevent the signal
+    from being calculated once they have left the lookback window.
+    """
+    universe = Mock()
+    universe.get_assets.return_value = ['EQ:AAA']
+    signal = signal_class(None, universe, [5])
+    for price in [np.nan, np.nan, 100.0, 101.0, 99.0, 102.0, 103.0]:
+        signal.append('EQ:AAA', price)
+    assert np.isclose(signal('EQ:AAA', 5), expected)
+    assert np.isclose(signal.cross_section(5)[0], expected)
+
+
+@pytest.mark.parametrize('signal_class', [MomentumSignal, SMASignal, VolatilitySignal])
+def test_missing_prices_match_pandas(signal_class):
+    """
+    Checks that the signal values of price buffers with leading and
+    interior missing prices match those calculated with pandas from
+    the lookback window after each price, both per asset and
+    cross-sectionally.
+    """
+    universe = Mock()
+    universe.get_assets.return_value = ['EQ:AAA', 'EQ:BBB']
+    lookbacks = [1, 3, 8]
+    signal = signal_class(None, universe, list(lookbacks))
+
+    rng = np.random.RandomState(42)
+    prices = 100.0 * np.cumprod(1.0 + rng.normal(0.0, 0.02, (30, 2)), axis=0)
+    prices[rng.uniform(size=(30, 2)) < 0.25] = np.nan
+    prices[:4, 1] = np.nan
+
+    for step in range(30):
+        signal.append_many(prices[step])
+        for lookback in lookbacks:
+            expected = []
+            for col in range(2):
+                window = prices[max(0, step - lookback):step + 1, col]
+                with warnings.catch_warnings():
+                    warnings.simplefilter('ignore')
+                    returns = pd.Series(window).pct_change().dropna().to_numpy()
+                if signal_class is SMASignal:
+                    expected.append(np.mean(window[1:] if len(window) > lookback else window))
+                elif len(returns) == 0:
+                    expected.append(0.0)
+                elif signal_class is MomentumSignal:
+                    expected.append(np.prod(1.0 + returns) - 1.0)
+                else:
+                    expected.append(np.std(returns) * np.sqrt(252))
+
+            actual = [signal(asset, lookback) for asset in ['EQ:AAA', 'EQ:BBB']]
+            np.testing.assert_allclose(actual, expected, rtol=1e-9)
+            np.testing.assert_allclose(
+                signal.cross_section(lookback), expected, rtol=1e-9
+            )
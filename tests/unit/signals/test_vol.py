@@ -0,0 +1,76 @@
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+import pytz
+
+from qstrader.signals.sma import SMASignal
+from qstrader.signals.vol import VolatilitySignal
+
+
+@pytest.mark.parametrize(
+    'start_dt,lookbacks,prices',
+    [
+        (
+            pd.Timestamp('2019-01-01 14:30:00', tz=pytz.utc),
+            [6, 12],
+            [
+                99.34, 101.87, 98.32, 92.98, 103.87,
+                104.51, 97.62, 95.22, 96.09, 100.34,
+                105.14, 107.49, 90.23, 89.43, 87.68
+            ]
+        )
+    ]
+)
+def test_vol_signal(start_dt, lookbacks, prices):
+    """
+    Checks that the volatility signal correctly calculates the
+    annualised volatility of returns after each price for
+    various lookbacks.
+    """
+    universe = Mock()
+    universe.get_assets.return_value = ['EQ:SPY']
+    vol = VolatilitySignal(start_dt, universe, lookbacks)
+    for price_idx in range(len(prices)):
+        vol.append('EQ:SPY', prices[price_idx])
+        for lookback in lookbacks:
+            window = pd.Series(prices[max(0, price_idx - lookback):price_idx + 1])
+            returns = window.pct_change().dropna().to_numpy()
+            expected = np.std(returns) * np.sqrt(252) if len(returns) > 0 else 0.0
+            assert np.isclose(vol('EQ:SPY', lookback), expected)
+
+
+def test_rolling_sums_do_not_drift():
+    """
+    Checks that the running aggregates of the volatility and SMA
+    signals remain accurate over many price updates.
+    """
+    universe = Mock()
+    universe.get_assets.return_value = ['EQ:SPY']
+    vol = VolatilitySignal(None, universe, [20])
+    sma = SMASignal(None, universe, [20])
+    prices = 100.0 * np.cumprod(
+        1.0 + np.random.default_rng(42).normal(0.0, 0.01, 5000)
+    )
+    for price in prices:
+        vol.append('EQ:SPY', price)
+        sma.append('EQ:SPY', price)
+    returns = pd.Series(prices[-21:]).pct_change().dropna().to_numpy()
+    assert np.isclose(vol('EQ:SPY', 20), np.std(returns) * np.sqrt(252), rtol=1e-12)
+    assert np.isclose(sma('EQ:SPY', 20), np.mean(prices[-20:]), rtol=1e-12)
+
+
+def test_single_return_vol_is_zero():
+    """
+    Checks that the volatility of a single return is exactly zero,
+    as per np.std, rather than the rounding error left by the
+    running sums.
+    """
+    universe = Mock()
+    universe.get_assets.return_value = ['EQ:SPY']
+    vol = VolatilitySignal(None, universe, [1, 8])
+    for price in [80.0694, 79.3907, 80.7612, 76.2878]:
+        vol.append('EQ:SPY', price)
+        assert vol('EQ:SPY', 1) == 0.0
+        assert vol.cross_section(1)[0] == 0.0
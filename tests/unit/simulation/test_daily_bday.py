@@ -67,3 +67,50 @@ def test_daily_rebalance(
         calculated_event = sim_events[0]
         expected_event = SimulationEvent(pd.Timestamp(sim_events[1][0], tz=pytz.UTC), sim_events[1][1])
         assert calculated_event == expected_event
+
+
+class _FakeDataHandler(object):
+    def __init__(self, index):
+        self.index = index
+        self.data_sources = [object()]
+
+    def get_trading_days(self):
+        return self.index
+
+
+@pytest.mark.parametrize('pre_market,post_market', [(True, True), (False, False)])
+def test_event_timeline(pre_market, post_market):
+    """
+    Checks that the precomputed event timeline only contains days
+    present within the data and matches the yielded SimulationEvents.
+    """
+    index = pd.DatetimeIndex(
+        ['2020-03-06', '2020-03-09', '2020-03-10'], tz='America/New_York'
+    )
+    sim_engine = DailyBusinessDaySimulationEngine(
+        pd.Timestamp('2020-03-05', tz='America/New_York'),
+        pd.Timestamp('2020-03-11', tz='America/New_York'),
+        _FakeDataHandler(index),
+        pre_market=pre_market,
+        post_market=post_market
+    )
+    event_types = ['market_open', 'market_close']
+    times = ['09:30', '16:00']
+    if pre_market:
+        event_types.insert(0, 'pre_market')
+        times.insert(0, '00:00')
+    if post_market:
+        event_types.append('post_market')
+        times.append('23:59')
+    expected_events = [
+        SimulationEvent(
+            pd.Timestamp('%s %s' % (day, time), tz='America/New_York'), event_type
+        )
+        for day in ['2020-03-06', '2020-03-09', '2020-03-10']
+        for time, event_type in zip(times, event_types)
+    ]
+
+    pd.testing.assert_index_equal(sim_engine.business_days, index)
+    assert len(sim_engine) == len(expected_events)
+    assert list(sim_engine.event_types) == [event.event_type for event in expected_events]
+    assert list(sim_engine) == expected_events
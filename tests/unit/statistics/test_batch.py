@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+
+from qstrader.statistics.batch import BatchStatistics
+from qstrader.statistics.json_statistics import JSONStatistics
+
+
+def test_batch_statistics_match_json_statistics():
+    """
+    Checks that the batched statistics of many equity curves match
+    the statistics calculated individually by JSONStatistics.
+    """
+    index = pd.date_range('2018-01-01', periods=600, freq='B')
+    equity_curves = pd.DataFrame(
+        1e6 * np.cumprod(
+            1.0 + np.random.RandomState(42).normal(0.0003, 0.01, (600, 5)), axis=0
+        ),
+        index=index, columns=['curve_%s' % col for col in range(5)]
+    )
+
+    batch = BatchStatistics(equity_curves)
+    results = batch.get_results()
+    assert list(results.index) == list(equity_curves.columns)
+
+    for column in equity_curves.columns:
+        json_stats = JSONStatistics(
+            equity_curves[[column]].rename(columns={column: 'Equity'}),
+            pd.DataFrame(index=index)
+        ).statistics['strategy']
+        for key in [
+            'cagr', 'mean_returns', 'stdev_returns', 'annualised_vol',
+            'sharpe', 'sortino', 'max_drawdown', 'max_drawdown_duration'
+        ]:
+            assert np.isclose(results.loc[column, key], json_stats[key], rtol=1e-10), key
+
+        monthly_returns = [ret for _, ret in json_stats['monthly_agg_returns']]
+        np.testing.assert_allclose(batch.monthly_returns[column].values, monthly_returns, rtol=1e-10)
+        assert np.isclose(results.loc[column, 'best_month'], max(monthly_returns))
+        yearly_returns = [ret for _, ret in json_stats['yearly_agg_returns']]
+        np.testing.assert_allclose(batch.yearly_returns[column].values, yearly_returns, rtol=1e-10)
+        assert np.isclose(results.loc[column, 'worst_year'], min(yearly_returns))
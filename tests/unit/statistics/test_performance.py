@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import qstrader.statistics.performance as perf
+
+
+@pytest.mark.parametrize(
+    'cum_returns,expected_drawdowns,expected_max,expected_duration',
+    [
+        (
+            [1.0, 1.1, 0.99, 1.045, 1.2, 1.2, 1.08],
+            [0.0, 0.0, 0.1, 0.05, 0.0, 0.0, 0.1],
+            0.1,
+            2
+        ),
+        (
+            [1.0, 1.0, 1.05, np.nan, 1.05],
+            [0.0, 0.0, 0.0, np.nan, 0.0],
+            0.0,
+            1
+        ),
+        (
+            [1.0, 1.01, 1.02, 1.03],
+            [0.0, 0.0, 0.0, 0.0],
+            0.0,
+            0
+        )
+    ]
+)
+def test_create_drawdowns(cum_returns, expected_drawdowns, expected_max, expected_duration):
+    """
+    Checks that the drawdowns, maximum drawdown and longest drawdown
+    duration are calculated from the High Water Mark, ignoring
+    missing values.
+    """
+    index = pd.date_range('2020-01-01', periods=len(cum_returns), freq='D')
+    drawdowns, max_drawdown, duration = perf.create_drawdowns(
+        pd.Series(cum_returns, index=index)
+    )
+    pd.testing.assert_series_equal(
+        drawdowns, pd.Series(expected_drawdowns, index=index, name='Drawdown')
+    )
+    assert np.isclose(max_drawdown, expected_max)
+    assert duration == expected_duration
+
+
+def test_create_drawdowns_batch_matches_create_drawdowns():
+    """
+    Checks that batched drawdowns of many equity curves match the
+    drawdowns of each curve calculated individually.
+    """
+    index = pd.date_range('2020-01-01', periods=250, freq='B')
+    cum_returns = pd.DataFrame(
+        np.cumprod(1.0 + np.random.RandomState(42).normal(0.0, 0.01, (250, 8)), axis=0),
+        index=index, columns=['curve_%s' % col for col in range(8)]
+    )
+    drawdowns, max_drawdowns, durations = perf.create_drawdowns_batch(cum_returns)
+
+    for column in cum_returns.columns:
+        expected = perf.create_drawdowns(cum_returns[column])
+        np.testing.assert_array_equal(drawdowns[column].values, expected[0].values)
+        assert max_drawdowns[column] == expected[1]
+        assert durations[column] == expected[2]
@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from qstrader.execution.order import Order
+from qstrader.statistics.recorder import AssetPanel, StatsRecorder
+
+
+def test_asset_panel_grows_and_retains_asset_order():
+    """
+    Checks that an AssetPanel grows beyond its preallocated rows and
+    asset columns, reconstructing each row with its assets in the
+    order originally recorded.
+    """
+    panel = AssetPanel(['quantity'], row_fields=['cash'], assets=['EQ:AAA'], capacity=1)
+    dts = pd.date_range('2020-01-01', periods=3, freq='D', tz='America/New_York')
+    panel.append(dts[0], 'market_open', ['EQ:AAA'], {'quantity': [1.0]}, {'cash': 10.0})
+    panel.append(dts[1], 'market_close', ['EQ:CCC', 'EQ:BBB'], {'quantity': [3.0, 2.0]}, {'cash': 20.0})
+    panel.extend(
+        dts[2:], ['market_open'], ['EQ:BBB', 'EQ:AAA'],
+        {'quantity': np.array([[4.0, 5.0]])}, {'cash': np.array([30.0])}
+    )
+
+    rows = list(panel.rows())
+    assert len(panel) == 3
+    assert [row[0] for row in rows] == list(dts)
+    assert [row[1] for row in rows] == ['market_open', 'market_close', 'market_open']
+    assert [row[2] for row in rows] == [['EQ:AAA'], ['EQ:CCC', 'EQ:BBB'], ['EQ:BBB', 'EQ:AAA']]
+    assert [panel.values['quantity'][idx, row[3]].tolist() for idx, row in enumerate(rows)] == [
+        [1.0], [3.0, 2.0], [4.0, 5.0]
+    ]
+    assert panel.row_values['cash'][:3].tolist() == [10.0, 20.0, 30.0]
+
+
+def test_stats_recorder_reconstructs_records():
+    """
+    Checks that recorded weights and orders are copied upon recording
+    and reconstructed in their original dictionary format.
+    """
+    dt = pd.Timestamp('2020-01-02 14:30:00', tz='UTC')
+    recorder = StatsRecorder()
+    weights = {'EQ:AAA': 0.6, 'EQ:BBB': 0.4}
+    recorder.record_weights('alpha_weights', dt, 'market_open', weights)
+    weights['EQ:AAA'] = 0.0
+    recorder.record_rebalance_orders(dt, 'market_open', [Order(dt, 'EQ:AAA', 100, order_id='1')])
+    recorder.record_rebalance_orders(dt, 'market_close', [])
+
+    assert recorder['alpha_weights'] == [
+        {'date': dt, 'event': 'market_open', 'weights': {'EQ:AAA': 0.6, 'EQ:BBB': 0.4}}
+    ]
+    assert recorder['rebalance_orders'] == [
+        {
+            'date': dt, 'event': 'market_open',
+            'orders': [{'asset': 'EQ:AAA', 'quantity': 100, 'order_id': '1'}]
+        },
+        {'date': dt, 'event': 'market_close', 'orders': []}
+    ]
+
+
+def test_stats_recorder_unknown_granularity_raises():
+    """
+    Checks that an unknown statistics granularity raises a ValueError.
+    """
+    with pytest.raises(ValueError):
+        StatsRecorder(granularity='daily')
+
+
+def test_stats_recorder_to_dataframes():
+    """
+    Checks that the recorded statistics are exported as long-format
+    DataFrames indexed by date and asset, with the cash balance
+    following the assets of each portfolio snapshot.
+    """
+    dts = pd.date_range('2020-01-02', periods=2, freq='D', tz='America/New_York')
+    recorder = StatsRecorder()
+    recorder.record_snapshot(dts[0], 'market_open', [], [], [], [], 1000.0)
+    recorder.record_snapshot(
+        dts[1], 'market_close', ['EQ:BBB', 'EQ:AAA'],
+        [10.0, 5.0], [200.0, 50.0], [20.0, 10.0], 750.0
+    )
+    recorder.record_rebalance_orders(dts[0], 'market_open', [Order(dts[0], 'EQ:AAA', 5, order_id='1')])
+    recorder.record_equity(dts[0], 1000.0)
+
+    stats_dfs = recorder.to_dataframes()
+    assert set(stats_dfs.keys()) == {'equity_curve', 'portfolio_snapshots', 'rebalance_orders'}
+
+    expected_index = pd.MultiIndex.from_arrays(
+        [dts[[0, 1, 1, 1]], ['Cash', 'EQ:BBB', 'EQ:AAA', 'Cash']], names=['Date', 'Asset']
+    )
+    expected_snapshots = pd.DataFrame(
+        {
+            'NetQuantity': [np.nan, 10.0, 5.0, np.nan],
+            'MarketValue': [1000.0, 200.0, 50.0, 750.0],
+            'CurrentPrice': [np.nan, 20.0, 10.0, np.nan]
+        },
+        index=expected_index
+    )
+    pd.testing.assert_frame_equal(stats_dfs['portfolio_snapshots'], expected_snapshots)
+
+    orders = stats_dfs['rebalance_orders']
+    assert list(orders.index) == [(dts[0], 'EQ:AAA')]
+    assert orders.iloc[0].to_dict() == {'Quantity': 5, 'OrderID': '1', 'Event': 'market_open'}
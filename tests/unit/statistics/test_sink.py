@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+
+from qstrader.statistics.sink import JSONLinesStatsSink
+
+
+def test_sink_appends_in_batches(tmp_path):
+    """
+    Checks that records are only appended to the statistics files
+    once the batch size is reached or the sink is flushed, and are
+    serialised with ISO 8601 timestamps and NaN as null.
+    """
+    sink = JSONLinesStatsSink(str(tmp_path), batch_size=2)
+    sink.open()
+    dt = pd.Timestamp('2020-01-02 16:00:00', tz='America/New_York')
+
+    sink.write('equity_curve', [{'date': dt, 'equity': np.float64(100.0)}])
+    assert sink.read('equity_curve') == []
+
+    sink.write('equity_curve', [{'date': dt, 'equity': np.nan}])
+    assert sink.read('equity_curve') == [
+        {'date': '2020-01-02T16:00:00-05:00', 'equity': 100.0},
+        {'date': '2020-01-02T16:00:00-05:00', 'equity': None}
+    ]
+
+    sink.write('executed_orders', [{'date': dt, 'asset': 'EQ:AAA', 'quantity': 10}])
+    sink.close()
+    assert sink.read('executed_orders') == [
+        {'date': '2020-01-02T16:00:00-05:00', 'asset': 'EQ:AAA', 'quantity': 10}
+    ]
+
+    # Reopening discards the records of the previous backtest
+    sink.open()
+    assert sink.read('equity_curve') == []
@@ -62,3 +62,36 @@ def test_check_weekday_raises_value_error():
         WeeklyRebalance(
             start_date=sd, end_date=ed, weekday=weekday, pre_market=pre_market
         )
+
+
+class _CalendarDataHandler(object):
+    def __init__(self, trading_days):
+        self.data_sources = [object()]
+        self.trading_days = pd.DatetimeIndex(trading_days, tz='America/New_York')
+
+    def get_trading_days(self):
+        return self.trading_days
+
+
+def test_weekly_rebalance_trading_calendar():
+    """
+    Checks that weekly rebalances falling on a non-trading day are
+    moved to the next trading day of the same week, or skipped.
+    """
+    data_handler = _CalendarDataHandler(
+        [
+            '2019-12-23', '2019-12-24', '2019-12-26', '2019-12-27',
+            '2019-12-30', '2019-12-31', '2020-01-02', '2020-01-03',
+            '2020-01-06', '2020-01-07', '2020-01-08'
+        ]
+    )
+    reb = WeeklyRebalance(
+        pd.Timestamp('2019-12-23', tz='America/New_York'),
+        pd.Timestamp('2020-01-08 23:59', tz='America/New_York'),
+        'WED', data_handler
+    )
+    assert reb.rebalances == [
+        pd.Timestamp('2019-12-26 16:00:00', tz='America/New_York'),
+        pd.Timestamp('2020-01-02 16:00:00', tz='America/New_York'),
+        pd.Timestamp('2020-01-08 16:00:00', tz='America/New_York')
+    ]